@@ -208,6 +208,7 @@ from draive.models import (
     ModelToolsSelection,
     ModelToolStatus,
     RealtimeGenerativeModel,
+    model_output_tags,
 )
 from draive.multimodal import (
     ArtifactContent,
@@ -240,6 +241,7 @@ from draive.resources import (
     ResourceReference,
     ResourceReferenceTemplate,
     ResourcesRepository,
+    ResourceStream,
     ResourceTemplate,
     ResourceUnresolveable,
     ResourceUploading,
@@ -247,13 +249,17 @@ from draive.resources import (
 )
 from draive.skills import (
     Skill,
+    SkillDescription,
     SkillException,
     SkillResource,
     SkillResourceMissing,
+    SkillsCatalog,
 )
 from draive.splitters import split_text
 from draive.steps import (
     Step,
+    StepCache,
+    StepContext,
     StepException,
     StepExecuting,
     StepOutputChunk,
@@ -445,17 +451,22 @@ __all__ = (
     "ResourceMissing",
     "ResourceReference",
     "ResourceReferenceTemplate",
+    "ResourceStream",
     "ResourceTemplate",
     "ResourceUnresolveable",
     "ResourceUploading",
     "ResourcesRepository",
     "Skill",
+    "SkillDescription",
     "SkillException",
     "SkillResource",
     "SkillResourceMissing",
+    "SkillsCatalog",
     "Specification",
     "State",
     "Step",
+    "StepCache",
+    "StepContext",
     "StepException",
     "StepExecuting",
     "StepOutputChunk",
@@ -510,6 +521,7 @@ __all__ = (
     "is_missing",
     "load_env",
     "mmr_vector_similarity_search",
+    "model_output_tags",
     "not_missing",
     "process_concurrently",
     "resource",
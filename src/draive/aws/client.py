@@ -75,6 +75,8 @@ class AWS(
                 ResourcesRepository(
                     list_fetching=self.list_paginated,
                     fetching=self.fetch,
+                    stream_fetching=self.fetch_stream,
+                    revision_checking=self.revision,
                     uploading=self.upload,
                 ),
             )
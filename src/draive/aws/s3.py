@@ -1,7 +1,7 @@
 import mimetypes
 import re
 from asyncio import gather
-from collections.abc import Collection, Mapping, Sequence
+from collections.abc import AsyncIterator, Collection, Mapping, Sequence
 from io import BytesIO
 from pathlib import Path
 from typing import Any
@@ -12,7 +12,7 @@ from haiway import BasicValue, Meta, Paginated, Pagination, asynchronous
 
 from draive.aws.api import AWSAPI
 from draive.aws.types import AWSAccessDenied, AWSError, AWSResourceNotFound
-from draive.resources import ResourceContent, ResourceReference
+from draive.resources import ResourceContent, ResourceReference, ResourceStream
 
 __all__ = ("AWSS3Mixin",)
 
@@ -187,7 +187,7 @@ class AWSS3Mixin(AWSAPI):
         self,
         bucket: str,
         name: str,
-    ) -> bytes:
+    ) -> memoryview:
         output: BytesIO = BytesIO()
         try:
             self._s3_client.download_fileobj(
@@ -203,7 +203,196 @@ class AWSS3Mixin(AWSAPI):
                 key=name,
             ) from exc
 
-        return output.getvalue()
+        return output.getbuffer()  # avoid copying downloaded content
+
+    async def fetch_stream(
+        self,
+        uri: str,
+        *,
+        offset: int,
+        length: int | None,
+        chunk_size: int,
+        **extra: Any,
+    ) -> ResourceStream | None:
+        """Stream an S3 object in chunks using ranged reads.
+
+        Parameters
+        ----------
+        uri
+            S3 URI pointing to the object (``s3://bucket/key``).
+        offset
+            Position in bytes of the first byte to stream.
+        length
+            Maximal number of bytes to stream, streams until the end when ``None``.
+        chunk_size
+            Size in bytes of streamed chunks.
+
+        Returns
+        -------
+        ResourceStream | None
+            Stream of the object content with metadata for S3 objects.
+
+        Raises
+        ------
+        ValueError
+            If the ``uri`` does not use the ``s3://`` scheme.
+        AWSAccessDenied
+            If S3 rejects the request due to missing or invalid credentials.
+        AWSResourceNotFound
+            If the bucket or object key does not exist.
+        AWSError
+            For other S3 client failures.
+        """
+        if not uri.startswith("s3://"):
+            raise ValueError("Unsupported fetch uri scheme")
+
+        parsed_uri: ParseResult = urlparse(uri)  # s3://bucket/name
+        bucket: str = parsed_uri.netloc
+        name: str = parsed_uri.path.lstrip("/")
+        mime_type, meta, size = await self._get_object_details(
+            bucket=bucket,
+            name=name,
+        )
+
+        async def chunks() -> AsyncIterator[bytes]:
+            end: int = size if length is None else min(offset + length, size)
+            if offset >= end:
+                return  # nothing to read
+
+            body: Any = await self._open_object(
+                bucket=bucket,
+                name=name,
+                byte_range=f"bytes={offset}-{end - 1}",
+            )
+            try:
+                while chunk := await self._read_object(
+                    body,
+                    chunk_size=chunk_size,
+                ):
+                    yield chunk
+
+            finally:
+                body.close()
+
+        return ResourceStream(
+            uri=uri,
+            mime_type=mime_type or "application/octet-stream",
+            offset=offset,
+            size=size,
+            meta=meta,
+            _chunks=chunks(),
+        )
+
+    @asynchronous
+    def _open_object(
+        self,
+        bucket: str,
+        name: str,
+        byte_range: str,
+    ) -> Any:
+        try:
+            return self._s3_client.get_object(
+                Bucket=bucket,
+                Key=name,
+                Range=byte_range,
+            )["Body"]
+
+        except ClientError as exc:
+            raise _translate_client_error(
+                error=exc,
+                bucket=bucket,
+                key=name,
+            ) from exc
+
+    @asynchronous
+    def _read_object(
+        self,
+        body: Any,
+        chunk_size: int,
+    ) -> bytes:
+        return body.read(chunk_size)
+
+    async def revision(
+        self,
+        uri: str,
+        *,
+        revision: str | None,
+        **extra: Any,
+    ) -> str | None:
+        """Check the current revision (ETag) of an S3 object.
+
+        Parameters
+        ----------
+        uri
+            S3 URI pointing to the object (``s3://bucket/key``).
+        revision
+            Previously known ETag used for a conditional request.
+
+        Returns
+        -------
+        str | None
+            Current object ETag, ``None`` when the object does not exist.
+
+        Raises
+        ------
+        ValueError
+            If the ``uri`` does not use the ``s3://`` scheme.
+        AWSAccessDenied
+            If S3 rejects the request due to missing or invalid credentials.
+        AWSError
+            For other S3 client failures.
+        """
+        if not uri.startswith("s3://"):
+            raise ValueError("Unsupported revision uri scheme")
+
+        parsed_uri: ParseResult = urlparse(uri)  # s3://bucket/name
+        return await self._object_revision(
+            bucket=parsed_uri.netloc,
+            name=parsed_uri.path.lstrip("/"),
+            revision=revision,
+        )
+
+    @asynchronous
+    def _object_revision(
+        self,
+        bucket: str,
+        name: str,
+        revision: str | None,
+    ) -> str | None:
+        try:
+            response: Any
+            if revision is None:
+                response = self._s3_client.head_object(
+                    Bucket=bucket,
+                    Key=name,
+                )
+
+            else:
+                response = self._s3_client.head_object(
+                    Bucket=bucket,
+                    Key=name,
+                    IfNoneMatch=revision,
+                )
+
+        except ClientError as exc:
+            status_code: Any = (
+                getattr(exc, "response", {}).get("ResponseMetadata", {}).get("HTTPStatusCode")
+            )
+            if status_code == 304:  # noqa: PLR2004
+                return revision  # not modified
+
+            error: Exception = _translate_client_error(
+                error=exc,
+                bucket=bucket,
+                key=name,
+            )
+            if isinstance(error, AWSResourceNotFound):
+                return None
+
+            raise error from exc
+
+        else:
+            return response.get("ETag")
 
     async def download(
         self,
@@ -288,6 +477,32 @@ class AWSS3Mixin(AWSAPI):
         else:
             return response.get("ContentType"), Meta.of(response.get("Metadata"))
 
+    @asynchronous
+    def _get_object_details(
+        self,
+        bucket: str,
+        name: str,
+    ) -> tuple[str | None, Meta, int]:
+        try:
+            response: Any = self._s3_client.head_object(
+                Bucket=bucket,
+                Key=name,
+            )
+
+        except ClientError as exc:
+            raise _translate_client_error(
+                error=exc,
+                bucket=bucket,
+                key=name,
+            ) from exc
+
+        else:
+            return (
+                response.get("ContentType"),
+                Meta.of(response.get("Metadata")),
+                int(response.get("ContentLength", 0)),
+            )
+
     async def upload(
         self,
         uri: str,
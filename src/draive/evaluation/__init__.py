@@ -1,4 +1,16 @@
-from draive.evaluation.agreement import cohen_kappa, quadratic_weighted_kappa
+from draive.evaluation.agreement import (
+    AgreementEstimate,
+    agreement_estimate,
+    cohen_kappa,
+    quadratic_weighted_kappa,
+)
+from draive.evaluation.cache import (
+    EvaluationCache,
+    EvaluationCacheLoading,
+    EvaluationCacheStoring,
+    evaluation_fingerprint,
+)
+from draive.evaluation.confidence import bootstrap_interval, wilson_interval
 from draive.evaluation.evaluation import evaluate
 from draive.evaluation.evaluator import (
     Evaluator,
@@ -7,6 +19,7 @@ from draive.evaluation.evaluator import (
     PreparedEvaluator,
     evaluator,
 )
+from draive.evaluation.queue import volatile_queue
 from draive.evaluation.reference import (
     EvaluationReference,
     reference_conformance,
@@ -23,8 +36,10 @@ from draive.evaluation.suite import (
     EvaluatorSuite,
     EvaluatorSuiteCase,
     EvaluatorSuiteCaseResult,
+    EvaluatorSuiteCasesIncrementalStorage,
     EvaluatorSuiteCasesStorage,
     EvaluatorSuiteDefinition,
+    EvaluatorSuiteEarlyStopping,
     EvaluatorSuiteResult,
     PreparedEvaluatorSuite,
     evaluator_suite,
@@ -40,6 +55,10 @@ from draive.evaluation.value import (
 __all__ = (
     "EVALUATION_SCORE_LEVELS",
     "EVALUATION_SCORE_VALUES",
+    "AgreementEstimate",
+    "EvaluationCache",
+    "EvaluationCacheLoading",
+    "EvaluationCacheStoring",
     "EvaluationReference",
     "EvaluationScore",
     "EvaluationScoreLevel",
@@ -53,18 +72,25 @@ __all__ = (
     "EvaluatorSuite",
     "EvaluatorSuiteCase",
     "EvaluatorSuiteCaseResult",
+    "EvaluatorSuiteCasesIncrementalStorage",
     "EvaluatorSuiteCasesStorage",
     "EvaluatorSuiteDefinition",
+    "EvaluatorSuiteEarlyStopping",
     "EvaluatorSuiteResult",
     "PreparedEvaluator",
     "PreparedEvaluatorScenario",
     "PreparedEvaluatorSuite",
+    "agreement_estimate",
+    "bootstrap_interval",
     "cohen_kappa",
     "evaluate",
+    "evaluation_fingerprint",
     "evaluation_score_level",
     "evaluator",
     "evaluator_scenario",
     "evaluator_suite",
     "quadratic_weighted_kappa",
     "reference_conformance",
+    "volatile_queue",
+    "wilson_interval",
 )
@@ -1,87 +1,179 @@
-from collections.abc import Callable, Sequence
+from collections.abc import Sequence
+from typing import Any
+
+import numpy as np
+from haiway import State
+from numpy.typing import NDArray
 
 from draive.evaluation.value import (
     EVALUATION_SCORE_LEVELS,
 )
 
 __all__ = (
+    "AgreementEstimate",
+    "agreement_estimate",
     "cohen_kappa",
     "quadratic_weighted_kappa",
 )
 
+# Upper bound of resampled labels materialized at once during bootstrap
+_BOOTSTRAP_CHUNK_ELEMENTS: int = 1 << 22
 
-def _confusion(
-    rater_a: Sequence[str],
-    rater_b: Sequence[str],
-    categories: Sequence[str],
+
+class AgreementEstimate(State):
+    """
+    Agreement between two raters with optional bootstrap confidence intervals.
+
+    Attributes
+    ----------
+    cohen_kappa : float
+        Unweighted (nominal) Cohen's kappa.
+    cohen_kappa_interval : tuple[float, float] | None
+        Bootstrap confidence interval of the nominal kappa, ``None`` without resampling.
+    quadratic_weighted_kappa : float
+        Quadratic-weighted Cohen's kappa.
+    quadratic_weighted_kappa_interval : tuple[float, float] | None
+        Bootstrap confidence interval of the quadratic kappa, ``None`` without resampling.
+    exact_agreement : float
+        Fraction of items with identical labels.
+    sample_count : int
+        Number of rated items.
+    """
+
+    cohen_kappa: float
+    cohen_kappa_interval: tuple[float, float] | None
+    quadratic_weighted_kappa: float
+    quadratic_weighted_kappa_interval: tuple[float, float] | None
+    exact_agreement: float
+    sample_count: int
+
+
+def _label_indices(
+    labels: Sequence[str] | NDArray[Any],
+    categories: NDArray[Any],
     /,
-) -> list[list[int]]:
-    index: dict[str, int] = {label: position for position, label in enumerate(categories)}
-    size: int = len(categories)
-    matrix: list[list[int]] = [[0] * size for _ in range(size)]
+    *,
+    rater: str,
+) -> NDArray[np.intp]:
+    values: NDArray[Any] = np.asarray(labels)
+    if values.dtype.kind in "iu":
+        # integer labels are already category positions
+        if values.size and (values.min() < 0 or values.max() >= len(categories)):
+            invalid: Any = values[(values < 0) | (values >= len(categories))][0]
+            raise ValueError(f"Unknown category in {rater} sequence: {invalid}")
+
+        return values.astype(np.intp, copy=False)
 
-    for left, right in zip(rater_a, rater_b, strict=True):
-        if left not in index:
-            raise ValueError(f"Unknown category in first sequence: {left}")
+    if values.dtype.kind not in "US":
+        # mixed labels, such as missing (None) ones, can't match any category
+        for value in values.flat:
+            if not isinstance(value, str):
+                raise ValueError(f"Unknown category in {rater} sequence: {value}")
 
-        if right not in index:
-            raise ValueError(f"Unknown category in second sequence: {right}")
+        values = values.astype(str)
 
-        matrix[index[left]][index[right]] += 1
+    order: NDArray[np.intp] = np.argsort(categories)
+    sorted_categories: NDArray[Any] = categories[order]
+    positions: NDArray[np.intp] = np.searchsorted(sorted_categories, values)
+    clipped: NDArray[np.intp] = np.minimum(positions, len(categories) - 1)
+    unknown: NDArray[np.bool_] = sorted_categories[clipped] != values
+    if unknown.any():
+        raise ValueError(f"Unknown category in {rater} sequence: {values[unknown][0]}")
 
-    return matrix
+    return order[clipped]
+
+
+def _confusion(
+    rater_a: NDArray[np.intp],
+    rater_b: NDArray[np.intp],
+    size: int,
+    /,
+) -> NDArray[np.int64]:
+    # Accepts label positions shaped (n,) or (batch, n) and counts all pairs at once,
+    # offsetting each batch row so a single bincount produces every matrix.
+    batched_a: NDArray[np.intp] = np.atleast_2d(rater_a)
+    batched_b: NDArray[np.intp] = np.atleast_2d(rater_b)
+    batch: int = batched_a.shape[0]
+    offsets: NDArray[np.intp] = (np.arange(batch, dtype=np.intp) * size * size)[:, None]
+    counts: NDArray[np.int64] = np.bincount(
+        (offsets + batched_a * size + batched_b).ravel(),
+        minlength=batch * size * size,
+    )
+    return counts.reshape(batch, size, size)
 
 
 def _weighted_kappa(
-    matrix: list[list[int]],
-    weight: Callable[[int, int], float],
+    matrices: NDArray[np.int64],
+    weights: NDArray[np.float64],
     /,
-) -> float:
+) -> NDArray[np.float64]:
     # General Cohen's kappa: 1 - sum(w * observed) / sum(w * expected), where the
     # weight encodes how much each (i, j) disagreement counts. Nominal kappa uses a
     # 0/1 weight; the ordinal variant uses squared distance (see the callers below).
-    size: int = len(matrix)
-    total: int = sum(sum(row) for row in matrix)
-    row_totals: list[int] = [sum(row) for row in matrix]
-    col_totals: list[int] = [sum(matrix[r][c] for r in range(size)) for c in range(size)]
-
-    observed: float = 0.0
-    expected: float = 0.0
-    for i in range(size):
-        for j in range(size):
-            w: float = weight(i, j)
-            observed += w * matrix[i][j]
-            expected += w * (row_totals[i] * col_totals[j]) / total
-
-    if expected == 0.0:
-        # No disagreement is expected by chance (a single populated category):
-        # the result is perfect agreement unless something was actually observed.
-        return 1.0 if observed == 0.0 else 0.0
-
-    return 1.0 - (observed / expected)
-
-
-def _validated_confusion(
-    rater_a: Sequence[str],
-    rater_b: Sequence[str],
+    total: NDArray[np.int64] = matrices.sum(axis=(1, 2))
+    row_totals: NDArray[np.int64] = matrices.sum(axis=2)
+    col_totals: NDArray[np.int64] = matrices.sum(axis=1)
+
+    observed: NDArray[np.float64] = (weights * matrices).sum(axis=(1, 2))
+    expected: NDArray[np.float64] = np.einsum(
+        "ij,bi,bj->b",
+        weights,
+        row_totals,
+        col_totals,
+    ) / np.maximum(total, 1)
+
+    # No disagreement expected by chance (a single populated category) means
+    # perfect agreement unless something was actually observed.
+    return np.where(
+        expected == 0.0,
+        np.where(observed == 0.0, 1.0, 0.0),
+        1.0 - observed / np.where(expected == 0.0, 1.0, expected),
+    )
+
+
+def _nominal_weights(
+    size: int,
+    /,
+) -> NDArray[np.float64]:
+    return 1.0 - np.eye(size)
+
+
+def _quadratic_weights(
+    size: int,
+    /,
+) -> NDArray[np.float64]:
+    positions: NDArray[np.float64] = np.arange(size, dtype=np.float64)
+    # Largest possible squared distance; falls back to 1.0 for a single-category
+    # scale so the weight stays well-defined (every weight is then 0 anyway).
+    max_distance: float = float((size - 1) ** 2) or 1.0
+    return (positions[:, None] - positions[None, :]) ** 2 / max_distance
+
+
+def _validated_indices(
+    rater_a: Sequence[str] | NDArray[Any],
+    rater_b: Sequence[str] | NDArray[Any],
     categories: Sequence[str],
     /,
-) -> list[list[int]]:
+) -> tuple[NDArray[np.intp], NDArray[np.intp]]:
     if len(rater_a) != len(rater_b):
         raise ValueError(f"Rater sequences differ in length: {len(rater_a)} vs {len(rater_b)}")
 
-    if not rater_a:
+    if not len(rater_a):
         raise ValueError("Cannot compute kappa over empty sequences")
 
     if len(set(categories)) != len(categories):
         raise ValueError(f"Categories contain duplicate values: {categories}")
 
-    return _confusion(rater_a, rater_b, categories)
+    categories_array: NDArray[Any] = np.asarray(categories)
+    return (
+        _label_indices(rater_a, categories_array, rater="first"),
+        _label_indices(rater_b, categories_array, rater="second"),
+    )
 
 
 def cohen_kappa(
-    rater_a: Sequence[str],
-    rater_b: Sequence[str],
+    rater_a: Sequence[str] | NDArray[Any],
+    rater_b: Sequence[str] | NDArray[Any],
     /,
     *,
     categories: Sequence[str] = EVALUATION_SCORE_LEVELS,
@@ -91,9 +183,10 @@ def cohen_kappa(
 
     Parameters
     ----------
-    rater_a : Sequence[str]
-        Category labels assigned by the first rater.
-    rater_b : Sequence[str]
+    rater_a : Sequence[str] | NDArray[Any]
+        Category labels assigned by the first rater, either label values or integer
+        positions within ``categories``.
+    rater_b : Sequence[str] | NDArray[Any]
         Category labels assigned by the second rater (aligned with ``rater_a``).
     categories : Sequence[str]
         Full set of possible category labels, by default ``EVALUATION_SCORE_LEVELS``.
@@ -108,15 +201,18 @@ def cohen_kappa(
     ValueError
         If sequences are empty, differ in length, or contain unknown categories.
     """
-    return _weighted_kappa(
-        _validated_confusion(rater_a, rater_b, categories),
-        lambda i, j: 0.0 if i == j else 1.0,
+    indices_a, indices_b = _validated_indices(rater_a, rater_b, categories)
+    return float(
+        _weighted_kappa(
+            _confusion(indices_a, indices_b, len(categories)),
+            _nominal_weights(len(categories)),
+        )[0]
     )
 
 
 def quadratic_weighted_kappa(
-    rater_a: Sequence[str],
-    rater_b: Sequence[str],
+    rater_a: Sequence[str] | NDArray[Any],
+    rater_b: Sequence[str] | NDArray[Any],
     /,
     *,
     categories: Sequence[str] = EVALUATION_SCORE_LEVELS,
@@ -129,9 +225,10 @@ def quadratic_weighted_kappa(
 
     Parameters
     ----------
-    rater_a : Sequence[str]
-        Category labels assigned by the first rater.
-    rater_b : Sequence[str]
+    rater_a : Sequence[str] | NDArray[Any]
+        Category labels assigned by the first rater, either label values or integer
+        positions within ``categories``.
+    rater_b : Sequence[str] | NDArray[Any]
         Category labels assigned by the second rater (aligned with ``rater_a``).
     categories : Sequence[str]
         Full set of possible category labels in order, by default ``EVALUATION_SCORE_LEVELS``.
@@ -146,11 +243,129 @@ def quadratic_weighted_kappa(
     ValueError
         If sequences are empty, differ in length, or contain unknown categories.
     """
-    matrix: list[list[int]] = _validated_confusion(rater_a, rater_b, categories)
-    # Largest possible squared distance; falls back to 1.0 for a single-category
-    # scale so the weight stays well-defined (every weight is then 0 anyway).
-    max_distance: float = float((len(matrix) - 1) ** 2) or 1.0
-    return _weighted_kappa(
-        matrix,
-        lambda i, j: ((i - j) ** 2) / max_distance,
+    indices_a, indices_b = _validated_indices(rater_a, rater_b, categories)
+    return float(
+        _weighted_kappa(
+            _confusion(indices_a, indices_b, len(categories)),
+            _quadratic_weights(len(categories)),
+        )[0]
+    )
+
+
+def agreement_estimate(
+    rater_a: Sequence[str] | NDArray[Any],
+    rater_b: Sequence[str] | NDArray[Any],
+    /,
+    *,
+    categories: Sequence[str] = EVALUATION_SCORE_LEVELS,
+    confidence: float = 0.95,
+    resamples: int | None = 1000,
+    seed: int | None = None,
+) -> AgreementEstimate:
+    """
+    Compute both kappa variants with percentile bootstrap confidence intervals.
+
+    All bootstrap resamples are evaluated as a batch of confusion matrices instead of
+    recomputing each kappa separately, which keeps calibration against large labelled
+    sets cheap.
+
+    Parameters
+    ----------
+    rater_a : Sequence[str] | NDArray[Any]
+        Category labels assigned by the first rater, either label values or integer
+        positions within ``categories``.
+    rater_b : Sequence[str] | NDArray[Any]
+        Category labels assigned by the second rater (aligned with ``rater_a``).
+    categories : Sequence[str]
+        Full set of possible category labels in order, by default ``EVALUATION_SCORE_LEVELS``.
+    confidence : float
+        Two-sided confidence level in (0, 1), by default 0.95.
+    resamples : int | None
+        Number of bootstrap resamples, by default 1000. ``None`` skips intervals.
+    seed : int | None
+        Seed of the resampling generator, allowing reproducible intervals.
+
+    Returns
+    -------
+    AgreementEstimate
+        Point estimates of both kappa variants with their intervals.
+
+    Raises
+    ------
+    ValueError
+        If sequences are empty, differ in length, or contain unknown categories.
+    """
+    assert 0 < confidence < 1  # nosec: B101
+    assert resamples is None or resamples > 0  # nosec: B101
+    indices_a, indices_b = _validated_indices(rater_a, rater_b, categories)
+    size: int = len(categories)
+    weights: NDArray[np.float64] = np.stack(
+        (
+            _nominal_weights(size),
+            _quadratic_weights(size),
+        )
+    )
+    matrix: NDArray[np.int64] = _confusion(indices_a, indices_b, size)
+    nominal: float = float(_weighted_kappa(matrix, weights[0])[0])
+    quadratic: float = float(_weighted_kappa(matrix, weights[1])[0])
+    exact_agreement: float = float(np.trace(matrix[0]) / len(indices_a))
+
+    if resamples is None:
+        return AgreementEstimate(
+            cohen_kappa=nominal,
+            cohen_kappa_interval=None,
+            quadratic_weighted_kappa=quadratic,
+            quadratic_weighted_kappa_interval=None,
+            exact_agreement=exact_agreement,
+            sample_count=len(indices_a),
+        )
+
+    count: int = len(indices_a)
+    generator: np.random.Generator = np.random.default_rng(seed)
+    chunk: int = max(1, _BOOTSTRAP_CHUNK_ELEMENTS // count)
+    nominal_samples: list[NDArray[np.float64]] = []
+    quadratic_samples: list[NDArray[np.float64]] = []
+    for start in range(0, resamples, chunk):
+        selection: NDArray[np.int64] = generator.integers(
+            0,
+            count,
+            size=(min(chunk, resamples - start), count),
+        )
+        matrices: NDArray[np.int64] = _confusion(
+            indices_a[selection],
+            indices_b[selection],
+            size,
+        )
+        nominal_samples.append(_weighted_kappa(matrices, weights[0]))
+        quadratic_samples.append(_weighted_kappa(matrices, weights[1]))
+
+    return AgreementEstimate(
+        cohen_kappa=nominal,
+        cohen_kappa_interval=_percentile_interval(
+            np.concatenate(nominal_samples),
+            confidence=confidence,
+        ),
+        quadratic_weighted_kappa=quadratic,
+        quadratic_weighted_kappa_interval=_percentile_interval(
+            np.concatenate(quadratic_samples),
+            confidence=confidence,
+        ),
+        exact_agreement=exact_agreement,
+        sample_count=count,
+    )
+
+
+def _percentile_interval(
+    samples: NDArray[np.float64],
+    /,
+    *,
+    confidence: float,
+) -> tuple[float, float]:
+    # matches draive.evaluation.confidence.bootstrap_interval percentile selection
+    ordered: NDArray[np.float64] = np.sort(samples)
+    tail: float = (1 - confidence) / 2
+    last: int = len(ordered) - 1
+    return (
+        float(ordered[int(tail * last)]),
+        float(ordered[int((1 - tail) * last + 0.5)]),
     )
@@ -0,0 +1,349 @@
+import json
+from collections.abc import Mapping, Sequence, Set
+from hashlib import sha256
+from pathlib import Path
+from typing import Any, Protocol, Self, cast, final, overload, runtime_checkable
+
+from haiway import (
+    Configuration,
+    ContextState,
+    Meta,
+    MetaValues,
+    State,
+    statemethod,
+)
+from haiway.attributes import AttributesJSONEncoder
+
+from draive.utils import FileKeyedStorage, VolatileKeyedStorage
+
+__all__ = (
+    "EvaluationCache",
+    "EvaluationCacheLoading",
+    "EvaluationCacheStoring",
+    "evaluation_fingerprint",
+)
+
+
+@runtime_checkable
+class EvaluationCacheLoading(Protocol):
+    async def __call__(
+        self,
+        key: str,
+        **extra: Any,
+    ) -> str | None: ...
+
+
+@runtime_checkable
+class EvaluationCacheStoring(Protocol):
+    async def __call__(
+        self,
+        key: str,
+        entry: str,
+        *,
+        expiration: float | None,
+        **extra: Any,
+    ) -> None: ...
+
+
+async def _none_loading(
+    key: str,
+    **extra: Any,
+) -> str | None:
+    return None
+
+
+async def _noop_storing(
+    key: str,
+    entry: str,
+    *,
+    expiration: float | None,
+    **extra: Any,
+) -> None:
+    pass
+
+
+@final
+class EvaluationCache(State):
+    """Storage backend for evaluation results.
+
+    When available in the context scope, evaluators and scenarios replay
+    stored results for inputs evaluated before instead of recomputing
+    them. Entries are keyed by ``evaluation_fingerprint`` and stored as JSON.
+    Convenience constructors supply in-memory and file-backed implementations,
+    Postgres storage is available through ``draive.postgres.PostgresEvaluationCache``.
+
+    Attributes
+    ----------
+    expiration : float | None
+        Lifetime of stored entries in seconds, ``None`` keeps them until evicted.
+    bypass : bool
+        When ``True`` stored entries are ignored and fresh results overwrite them.
+    meta : Meta
+        Additional cache metadata.
+    """
+
+    @classmethod
+    def volatile(
+        cls,
+        *,
+        limit: int = 1024,
+        expiration: float | None = None,
+        bypass: bool = False,
+    ) -> Self:
+        """Create an in-memory LRU cache.
+
+        Parameters
+        ----------
+        limit : int, optional
+            Maximum number of entries kept at once. Least recently used entries
+            are evicted first.
+        expiration : float | None, optional
+            Lifetime of stored entries in seconds.
+        bypass : bool, optional
+            Whether stored entries are ignored and refreshed.
+
+        Returns
+        -------
+        Self
+            Cache backed by process-local storage.
+        """
+        assert limit > 0  # nosec: B101
+        storage: VolatileKeyedStorage[str] = VolatileKeyedStorage(limit)
+
+        return cls(
+            loading=storage.loading,
+            storing=storage.storing,
+            expiration=expiration,
+            bypass=bypass,
+            meta=Meta({"source": "volatile"}),
+        )
+
+    @classmethod
+    def file(
+        cls,
+        path: Path | str,
+        *,
+        expiration: float | None = None,
+        bypass: bool = False,
+    ) -> Self:
+        """Create a cache storing each entry as a JSON file in a directory.
+
+        Parameters
+        ----------
+        path : Path | str
+            Directory used to persist cache entries. Created when missing.
+        expiration : float | None, optional
+            Lifetime of stored entries in seconds.
+        bypass : bool, optional
+            Whether stored entries are ignored and refreshed.
+
+        Returns
+        -------
+        Self
+            Cache backed by the given directory.
+        """
+        storage: FileKeyedStorage[str] = FileKeyedStorage(
+            path,
+            encoding=str,
+            decoding=str,
+        )
+
+        return cls(
+            loading=storage.loading,
+            storing=storage.storing,
+            expiration=expiration,
+            bypass=bypass,
+            meta=Meta({"source": str(path)}),
+        )
+
+    @overload
+    @classmethod
+    async def load(
+        cls,
+        key: str,
+        /,
+        **extra: Any,
+    ) -> str | None: ...
+
+    @overload
+    async def load(
+        self,
+        key: str,
+        /,
+        **extra: Any,
+    ) -> str | None: ...
+
+    @statemethod
+    async def load(
+        self,
+        key: str,
+        /,
+        **extra: Any,
+    ) -> str | None:
+        """Load a stored evaluation result.
+
+        Parameters
+        ----------
+        key : str
+            Fingerprint of the evaluation input.
+        **extra : Any
+            Extra arguments forwarded to the underlying loading callable.
+
+        Returns
+        -------
+        str | None
+            Stored result JSON or ``None`` when missing, expired or bypassed.
+        """
+        if self.bypass:
+            return None
+
+        return await self._loading(
+            key,
+            **extra,
+        )
+
+    @overload
+    @classmethod
+    async def store(
+        cls,
+        key: str,
+        /,
+        entry: str,
+        **extra: Any,
+    ) -> None: ...
+
+    @overload
+    async def store(
+        self,
+        key: str,
+        /,
+        entry: str,
+        **extra: Any,
+    ) -> None: ...
+
+    @statemethod
+    async def store(
+        self,
+        key: str,
+        /,
+        entry: str,
+        **extra: Any,
+    ) -> None:
+        """Store an evaluation result.
+
+        Parameters
+        ----------
+        key : str
+            Fingerprint of the evaluation input.
+        entry : str
+            Result JSON.
+        **extra : Any
+            Extra arguments forwarded to the underlying storing callable.
+        """
+        await self._storing(
+            key,
+            entry,
+            expiration=self.expiration,
+            **extra,
+        )
+
+    _loading: EvaluationCacheLoading
+    _storing: EvaluationCacheStoring
+    expiration: float | None
+    bypass: bool
+    meta: Meta
+
+    def __init__(
+        self,
+        loading: EvaluationCacheLoading = _none_loading,
+        storing: EvaluationCacheStoring = _noop_storing,
+        expiration: float | None = None,
+        bypass: bool = False,
+        meta: Meta | MetaValues | None = None,
+    ) -> None:
+        assert expiration is None or expiration > 0  # nosec: B101
+        super().__init__(
+            _loading=loading,
+            _storing=storing,
+            expiration=expiration,
+            bypass=bypass,
+            meta=Meta.of(meta),
+        )
+
+
+def evaluation_fingerprint(
+    namespace: str,
+    /,
+    *values: Any,
+) -> str:
+    """Compute a stable fingerprint of an evaluation input.
+
+    Besides the provided values, every ``Configuration`` available in the
+    current context scope is included, so changing the active model
+    configuration produces a different fingerprint.
+
+    Parameters
+    ----------
+    namespace : str
+        Namespace distinguishing evaluators, scenarios and suites from each other.
+    *values : Any
+        Values identifying the evaluation, including the evaluated value and
+        its arguments.
+
+    Returns
+    -------
+    str
+        Hex encoded SHA-256 digest.
+
+    Raises
+    ------
+    TypeError
+        When any of the values can't be represented as JSON.
+    """
+    hasher = sha256(namespace.encode())
+    for value in values:
+        hasher.update(b"\x1e")
+        hasher.update(_json_bytes(value))
+
+    hasher.update(b"\x1d")
+    configurations: Mapping[str, Configuration] = {
+        f"{type(state).__module__}.{type(state).__qualname__}": state
+        for state in ContextState.snapshot()
+        if isinstance(state, Configuration)
+    }
+    for name in sorted(configurations):
+        hasher.update(b"\x1e")
+        hasher.update(name.encode())
+        hasher.update(b"\x1f")
+        hasher.update(_json_bytes(configurations[name]))
+
+    return hasher.hexdigest()
+
+
+class _FingerprintJSONEncoder(AttributesJSONEncoder):
+    def default(self, o: object) -> Any:
+        if isinstance(o, State):
+            return o.to_mapping(recursive=True)
+
+        elif isinstance(o, Mapping):
+            return dict(cast(Mapping[Any, Any], o))
+
+        elif isinstance(o, Set):
+            return sorted(cast(Set[Any], o), key=repr)
+
+        elif isinstance(o, Sequence) and not isinstance(o, str | bytes):
+            return list(cast(Sequence[Any], o))
+
+        else:
+            return super().default(o)
+
+
+def _json_bytes(
+    value: Any,
+    /,
+) -> bytes:
+    return json.dumps(
+        value,
+        cls=_FingerprintJSONEncoder,
+        sort_keys=True,
+    ).encode()
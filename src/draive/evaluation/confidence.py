@@ -0,0 +1,104 @@
+import random
+from collections.abc import Sequence
+from math import fsum, sqrt
+from statistics import NormalDist
+
+__all__ = (
+    "bootstrap_interval",
+    "wilson_interval",
+)
+
+
+def wilson_interval(
+    successes: int,
+    total: int,
+    /,
+    *,
+    confidence: float = 0.95,
+) -> tuple[float, float]:
+    """
+    Compute the Wilson score confidence interval of a binomial proportion.
+
+    Parameters
+    ----------
+    successes : int
+        Number of successful trials.
+    total : int
+        Number of all trials.
+    confidence : float
+        Two-sided confidence level in (0, 1), by default 0.95.
+
+    Returns
+    -------
+    tuple[float, float]
+        Lower and upper bound of the proportion, ``(0.0, 1.0)`` when there are no trials.
+
+    Raises
+    ------
+    ValueError
+        If counts are negative or successes exceed the total.
+    """
+    assert 0 < confidence < 1  # nosec: B101
+    if total < 0 or successes < 0 or successes > total:
+        raise ValueError(f"Invalid proportion counts: {successes}/{total}")
+
+    if total == 0:
+        return (0.0, 1.0)
+
+    z: float = NormalDist().inv_cdf(0.5 + confidence / 2)
+    proportion: float = successes / total
+    denominator: float = 1 + z * z / total
+    center: float = (proportion + z * z / (2 * total)) / denominator
+    margin: float = (
+        z * sqrt(proportion * (1 - proportion) / total + z * z / (4 * total * total)) / denominator
+    )
+    return (max(0.0, center - margin), min(1.0, center + margin))
+
+
+def bootstrap_interval(
+    values: Sequence[float],
+    /,
+    *,
+    confidence: float = 0.95,
+    resamples: int = 1000,
+    seed: int | None = None,
+) -> tuple[float, float]:
+    """
+    Compute the percentile bootstrap confidence interval of a mean.
+
+    Parameters
+    ----------
+    values : Sequence[float]
+        Observed values.
+    confidence : float
+        Two-sided confidence level in (0, 1), by default 0.95.
+    resamples : int
+        Number of bootstrap resamples, by default 1000.
+    seed : int | None
+        Seed of the resampling generator, allowing reproducible intervals.
+
+    Returns
+    -------
+    tuple[float, float]
+        Lower and upper bound of the mean.
+
+    Raises
+    ------
+    ValueError
+        If values are empty.
+    """
+    assert 0 < confidence < 1  # nosec: B101
+    assert resamples > 0  # nosec: B101
+    if not values:
+        raise ValueError("Cannot compute bootstrap interval over empty values")
+
+    count: int = len(values)
+    generator: random.Random = random.Random(seed)  # nosec: B311
+    means: list[float] = sorted(
+        fsum(generator.choices(values, k=count)) / count for _ in range(resamples)
+    )
+    tail: float = (1 - confidence) / 2
+    return (
+        means[int(tail * (resamples - 1))],
+        means[int((1 - tail) * (resamples - 1) + 0.5)],
+    )
@@ -1,5 +1,6 @@
 import re
 from collections.abc import Callable, Collection, Sequence
+from contextlib import AbstractAsyncContextManager
 from typing import Annotated, Literal, Protocol, Self, cast, overload, runtime_checkable
 
 from haiway import (
@@ -14,6 +15,7 @@ from haiway import (
     ctx,
 )
 
+from draive.evaluation.cache import EvaluationCache, evaluation_fingerprint
 from draive.evaluation.reference import EvaluationReference, reference_conformance
 from draive.evaluation.score import EvaluationScore
 from draive.evaluation.value import (
@@ -764,26 +766,129 @@ class Evaluator[Value, **Args](Immutable):
         *args: Args.args,
         **kwargs: Args.kwargs,
     ) -> EvaluatorResult:
-        async with ctx.scope(f"evaluator.{self.name}", *self._state):
-            result: EvaluatorResult = await self._evaluate(
+        async with self._scope():
+            result: EvaluatorResult = await self._cached_evaluate(
                 value,
                 *args,
                 **kwargs,
             )
 
-            ctx.record_info(
-                metric=f"evaluator.{result.evaluator}.performance",
-                value=result.performance,
-                unit="%",
-                kind="histogram",
-                attributes={
-                    "passed": result.passed,
-                    "threshold": result.threshold,
-                    "score": result.score,
-                },
-            )
+            self._record(result)
             return result
 
+    def _scope(self) -> AbstractAsyncContextManager[str]:
+        return ctx.scope(f"evaluator.{self.name}", *self._state)
+
+    def _record(
+        self,
+        result: EvaluatorResult,
+        /,
+    ) -> None:
+        ctx.record_info(
+            metric=f"evaluator.{result.evaluator}.performance",
+            value=result.performance,
+            unit="%",
+            kind="histogram",
+            attributes={
+                "passed": result.passed,
+                "threshold": result.threshold,
+                "score": result.score,
+            },
+        )
+
+    def _cache_key(
+        self,
+        value: Value,
+        /,
+        *args: Args.args,
+        **kwargs: Args.kwargs,
+    ) -> str | None:
+        if not ctx.contains_state(EvaluationCache):
+            return None
+
+        try:
+            return evaluation_fingerprint(
+                "evaluator",
+                self.name,
+                self.threshold,
+                self.meta,
+                value,
+                args,
+                kwargs,
+            )
+
+        except TypeError as exc:
+            ctx.log_warning(
+                f"Evaluator `{self.name}` input can't be fingerprinted, skipping cache...",
+                exception=exc,
+            )
+            return None
+
+    async def _cached(
+        self,
+        cache_key: str,
+        /,
+    ) -> EvaluatorResult | None:
+        if cached := await EvaluationCache.load(cache_key):
+            try:
+                return EvaluatorResult.from_json(cached)
+
+            except Exception as exc:
+                ctx.log_warning(
+                    f"Invalid evaluation cache entry {cache_key}, ignoring...",
+                    exception=exc,
+                )
+
+        return None
+
+    async def _cache(
+        self,
+        cache_key: str,
+        /,
+        result: EvaluatorResult,
+    ) -> None:
+        if "error" in result.meta:
+            return  # failures are retried on the next run
+
+        await EvaluationCache.store(
+            cache_key,
+            result.to_json(),
+        )
+
+    async def _cached_evaluate(
+        self,
+        value: Value,
+        /,
+        *args: Args.args,
+        **kwargs: Args.kwargs,
+    ) -> EvaluatorResult:
+        cache_key: str | None = self._cache_key(
+            value,
+            *args,
+            **kwargs,
+        )
+        if cache_key is None:
+            return await self._evaluate(
+                value,
+                *args,
+                **kwargs,
+            )
+
+        if cached := await self._cached(cache_key):
+            return cached
+
+        result: EvaluatorResult = await self._evaluate(
+            value,
+            *args,
+            **kwargs,
+        )
+        await self._cache(
+            cache_key,
+            result=result,
+        )
+
+        return result
+
     async def _evaluate(
         self,
         value: Value,
@@ -791,31 +896,47 @@ class Evaluator[Value, **Args](Immutable):
         *args: Args.args,
         **kwargs: Args.kwargs,
     ) -> EvaluatorResult:
-        result: EvaluationScore | EvaluationScoreValue
+        score: EvaluationScore | EvaluationScoreValue
         try:
-            result = await self._definition(
+            score = await self._definition(
                 value,
                 *args,
                 **kwargs,
             )
 
         except Exception as exc:
-            ctx.log_error(
-                f"Evaluator `{self.name}` failed due to an error",
-                exception=exc,
-            )
-            result = EvaluationScore.of(
-                0.0,
-                meta=Meta.empty.with_error(exc),
-            )
+            return self._failed(exc)
+
+        return self._result(score)
 
+    def _result(
+        self,
+        score: EvaluationScore | EvaluationScoreValue,
+        /,
+    ) -> EvaluatorResult:
         return EvaluatorResult.of(
             self.name,
-            score=result,
+            score=score,
             threshold=self.threshold,
             meta=self.meta,
         )
 
+    def _failed(
+        self,
+        exception: Exception,
+        /,
+    ) -> EvaluatorResult:
+        ctx.log_error(
+            f"Evaluator `{self.name}` failed due to an error",
+            exception=exception,
+        )
+        return self._result(
+            EvaluationScore.of(
+                0.0,
+                meta=Meta.empty.with_error(exception),
+            )
+        )
+
 
 @overload
 def evaluator[Value, **Args](
@@ -0,0 +1,75 @@
+from asyncio import Queue
+from collections.abc import AsyncGenerator, AsyncIterable
+from typing import Any
+
+from haiway import FlatObject, Meta, MQMessage, MQQueue
+
+__all__ = ("volatile_queue",)
+
+
+def volatile_queue(
+    *,
+    redeliveries: int = 3,
+) -> MQQueue[str]:
+    """
+    Create an in-memory message queue for running distributed evaluation locally.
+
+    Messages are delivered to a single consumer at a time. Rejected messages are put
+    back to the queue until the redelivery limit is reached, after which they are dropped.
+
+    Parameters
+    ----------
+    redeliveries : int, optional
+        Maximum number of times a rejected message is delivered again, by default 3
+
+    Returns
+    -------
+    MQQueue[str]
+        Queue of JSON encoded messages backed by process-local storage
+    """
+    assert redeliveries >= 0  # nosec: B101
+    messages: Queue[tuple[str, int]] = Queue()
+
+    async def publishing(
+        message: str,
+        attributes: FlatObject | None,
+        **extra: Any,
+    ) -> None:
+        messages.put_nowait((message, 0))
+
+    def delivered(
+        content: str,
+        attempt: int,
+    ) -> MQMessage[str]:
+        async def acknowledge(
+            **extra: Any,
+        ) -> None:
+            pass
+
+        async def reject(
+            **extra: Any,
+        ) -> None:
+            if attempt < redeliveries:
+                messages.put_nowait((content, attempt + 1))
+
+        return MQMessage[str](
+            content=content,
+            acknowledge=acknowledge,
+            reject=reject,
+            meta=Meta({"attempt": attempt}),
+        )
+
+    async def consuming(
+        **extra: Any,
+    ) -> AsyncIterable[MQMessage[str]]:
+        async def consume() -> AsyncGenerator[MQMessage[str]]:
+            while True:
+                content, attempt = await messages.get()
+                yield delivered(content, attempt)
+
+        return consume()
+
+    return MQQueue[str](
+        publishing=publishing,
+        consuming=consuming,
+    )
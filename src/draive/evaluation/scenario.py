@@ -12,6 +12,7 @@ from haiway import (
     ctx,
 )
 
+from draive.evaluation.cache import EvaluationCache, evaluation_fingerprint
 from draive.evaluation.evaluator import EvaluatorResult
 
 __all__ = (
@@ -391,7 +392,7 @@ class EvaluatorScenario[Value, **Args](Immutable):
         **kwargs: Args.kwargs,
     ) -> EvaluatorScenarioResult:
         async with ctx.scope(f"evaluator.scenario.{self.name}", *self._state):
-            result: EvaluatorScenarioResult = await self._evaluate(
+            result: EvaluatorScenarioResult = await self._cached_evaluate(
                 value,
                 *args,
                 **kwargs,
@@ -409,6 +410,66 @@ class EvaluatorScenario[Value, **Args](Immutable):
             )
         return result
 
+    async def _cached_evaluate(
+        self,
+        value: Value,
+        /,
+        *args: Args.args,
+        **kwargs: Args.kwargs,
+    ) -> EvaluatorScenarioResult:
+        if not ctx.contains_state(EvaluationCache):
+            return await self._evaluate(
+                value,
+                *args,
+                **kwargs,
+            )
+
+        cache_key: str
+        try:
+            cache_key = evaluation_fingerprint(
+                "scenario",
+                self.name,
+                self.meta,
+                value,
+                args,
+                kwargs,
+            )
+
+        except TypeError as exc:
+            ctx.log_warning(
+                f"Evaluator scenario `{self.name}` input can't be fingerprinted, skipping cache...",
+                exception=exc,
+            )
+            return await self._evaluate(
+                value,
+                *args,
+                **kwargs,
+            )
+
+        if cached := await EvaluationCache.load(cache_key):
+            try:
+                return EvaluatorScenarioResult.from_json(cached)
+
+            except Exception as exc:
+                ctx.log_warning(
+                    f"Invalid evaluation cache entry {cache_key}, ignoring...",
+                    exception=exc,
+                )
+
+        result: EvaluatorScenarioResult = await self._evaluate(
+            value,
+            *args,
+            **kwargs,
+        )
+
+        if all("error" not in evaluation.meta for evaluation in result.results):
+            await EvaluationCache.store(
+                cache_key,
+                result.to_json(),
+            )
+
+        return result
+
     async def _evaluate(
         self,
         value: Value,
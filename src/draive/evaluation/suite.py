@@ -1,9 +1,23 @@
 import json
+import os
 import random
-from asyncio import Lock
-from collections.abc import Callable, Iterable, Sequence
+from asyncio import FIRST_COMPLETED, Lock, Task, wait
+from asyncio import timeout as timeout_scope
+from collections.abc import (
+    AsyncGenerator,
+    AsyncIterator,
+    Callable,
+    Collection,
+    Iterable,
+    Iterator,
+    Mapping,
+    Sequence,
+    Set,
+)
+from contextlib import aclosing
+from itertools import islice
 from pathlib import Path
-from typing import Annotated, Protocol, Self, cast, runtime_checkable
+from typing import Annotated, Any, Protocol, Self, cast, runtime_checkable
 from uuid import uuid4
 
 from haiway import (
@@ -12,21 +26,29 @@ from haiway import (
     Immutable,
     Meta,
     MetaValues,
+    MQMessage,
+    MQQueue,
     State,
     asynchronous,
     ctx,
     execute_concurrently,
+    process_concurrently,
 )
 from haiway.attributes import AttributesJSONEncoder
 
+from draive.evaluation.confidence import bootstrap_interval, wilson_interval
 from draive.evaluation.evaluator import EvaluatorResult
 from draive.evaluation.scenario import EvaluatorScenarioResult
+from draive.evaluation.score import EvaluationScore
+from draive.utils import write_atomically
 
 __all__ = (
     "EvaluatorSuite",
     "EvaluatorSuiteCaseResult",
+    "EvaluatorSuiteCasesIncrementalStorage",
     "EvaluatorSuiteCasesStorage",
     "EvaluatorSuiteDefinition",
+    "EvaluatorSuiteEarlyStopping",
     "EvaluatorSuiteResult",
     "PreparedEvaluatorSuite",
     "evaluator_suite",
@@ -182,13 +204,23 @@ class EvaluatorSuiteResult(State, serializable=True):
         Name of the evaluated suite
     results : Sequence[EvaluatorSuiteCaseResult]
         Results from all evaluated test cases
+    decision : bool | None
+        Statistical pass/fail decision of early stopped suites, ``None`` when
+        the outcome is determined by case results
+    meta : Meta
+        Additional result metadata, including early stopping statistics
     """
 
     suite: str
     results: Sequence[EvaluatorSuiteCaseResult]
+    decision: bool | None = None
+    meta: Meta = Meta.empty
 
     @property
     def passed(self) -> bool:
+        if self.decision is not None:
+            return self.decision
+
         return all(result.passed for result in self.results)
 
     def report(
@@ -246,6 +278,106 @@ class EvaluatorSuiteResult(State, serializable=True):
         return score / len(self.results)
 
 
+class EvaluatorSuiteEarlyStopping(State):
+    """
+    Sequential early stopping configuration of an evaluator suite.
+
+    Cases are evaluated in randomized order keeping up to ``concurrent_evaluations``
+    of the suite running. After each ``batch_size`` completed cases a Wilson interval
+    of the case pass rate and, when a performance target is set, a bootstrap interval
+    of the mean case performance are computed. Evaluation stops as soon as every interval
+    lies entirely above its target (passed) or any lies entirely below it (failed).
+    Checking after each batch slightly inflates error rates, prefer higher confidence
+    for strict gates.
+
+    Attributes
+    ----------
+    pass_rate : float
+        Fraction of passing cases (0-1) required for the suite to pass
+    performance : float | None
+        Mean case performance (0-100) required for the suite to pass, ignored when None
+    confidence : float
+        Two-sided confidence level of the intervals
+    batch_size : int
+        Number of completed cases between decisions, cases still running when the
+        decision is settled are cancelled
+    min_cases : int
+        Minimal number of evaluated cases before stopping is allowed
+    resamples : int
+        Number of bootstrap resamples used for the performance interval
+    """
+
+    pass_rate: float
+    performance: float | None = None
+    confidence: float = 0.95
+    batch_size: int = 20
+    min_cases: int = 10
+    resamples: int = 1000
+
+    def summary(
+        self,
+        results: Sequence[EvaluatorSuiteCaseResult],
+        /,
+    ) -> Meta:
+        """
+        Compute intervals and the decision for the evaluated case results.
+
+        Parameters
+        ----------
+        results : Sequence[EvaluatorSuiteCaseResult]
+            Results of cases evaluated so far
+
+        Returns
+        -------
+        Meta
+            Statistics including ``settled`` and the ``passed`` decision, which falls
+            back to point estimates when the decision is not settled
+        """
+        passing: int = sum(1 for result in results if result.passed)
+        pass_rate_lower, pass_rate_upper = wilson_interval(
+            passing,
+            len(results),
+            confidence=self.confidence,
+        )
+        point_passed: bool = len(results) > 0 and passing / len(results) >= self.pass_rate
+        settled_passed: bool = pass_rate_lower >= self.pass_rate
+        settled_failed: bool = pass_rate_upper < self.pass_rate
+        statistics: dict[str, float | int] = {
+            "evaluated": len(results),
+            "pass_rate": passing / len(results) if results else 0.0,
+            "pass_rate_lower": pass_rate_lower,
+            "pass_rate_upper": pass_rate_upper,
+        }
+
+        if self.performance is not None:
+            performances: Sequence[float] = [min(100.0, result.performance) for result in results]
+            performance_lower, performance_upper = (
+                bootstrap_interval(
+                    performances,
+                    confidence=self.confidence,
+                    resamples=self.resamples,
+                )
+                if performances
+                else (0.0, 100.0)
+            )
+            point_passed = (
+                point_passed and sum(performances) / len(performances) >= self.performance
+            )
+            settled_passed = settled_passed and performance_lower >= self.performance
+            settled_failed = settled_failed or performance_upper < self.performance
+            statistics["performance_lower"] = performance_lower
+            statistics["performance_upper"] = performance_upper
+
+        settled: bool = len(results) >= self.min_cases and (settled_passed or settled_failed)
+        return Meta.of(
+            {
+                **statistics,
+                "settled": settled,
+                "passed": (settled_passed and not settled_failed) if settled else point_passed,
+            }
+        )
+
+
 @runtime_checkable
 class EvaluatorSuiteDefinition[**Args, Parameters: State](Protocol):
     """
@@ -298,6 +430,36 @@ class EvaluatorSuiteCasesStorage[Parameters: State](Protocol):
     ) -> None: ...
 
 
+@runtime_checkable
+class EvaluatorSuiteCasesIncrementalStorage[Parameters: State](
+    EvaluatorSuiteCasesStorage[Parameters],
+    Protocol,
+):
+    """
+    Protocol for test case storage backends supporting incremental updates.
+
+    Suites use ``append`` and ``remove`` instead of saving all cases when the
+    storage implements them, avoiding rewrites of large case collections.
+
+    Methods
+    -------
+    append(cases)
+        Persist additional test cases
+    remove(identifiers)
+        Remove test cases with given identifiers
+    """
+
+    async def append(
+        self,
+        cases: Sequence[EvaluatorSuiteCase[Parameters]],
+    ) -> None: ...
+
+    async def remove(
+        self,
+        identifiers: Collection[str],
+    ) -> None: ...
+
+
 @runtime_checkable
 class PreparedEvaluatorSuite[Parameters: State](Protocol):
     """
@@ -368,7 +530,10 @@ class EvaluatorSuite[**Args, Parameters: State](Immutable):
     _definition: EvaluatorSuiteDefinition[Args, Parameters]
     _cases_storage: EvaluatorSuiteCasesStorage[Parameters]
     _cases_cache: Sequence[EvaluatorSuiteCase[Parameters]] | None
+    _cases_index: Mapping[str, EvaluatorSuiteCase[Parameters]] | None
     _state: Sequence[State]
+    _checkpoint: Path | None
+    _early_stopping: EvaluatorSuiteEarlyStopping | None
     _lock: Lock
 
     def __init__(
@@ -380,6 +545,8 @@ class EvaluatorSuite[**Args, Parameters: State](Immutable):
         cases_storage: EvaluatorSuiteCasesStorage[Parameters],
         state: Sequence[State],
         meta: Meta,
+        checkpoint: Path | None = None,
+        early_stopping: EvaluatorSuiteEarlyStopping | None = None,
     ) -> None:
         object.__setattr__(
             self,
@@ -416,11 +583,26 @@ class EvaluatorSuite[**Args, Parameters: State](Immutable):
             "_cases_cache",
             None,
         )
+        object.__setattr__(
+            self,
+            "_cases_index",
+            None,
+        )
         object.__setattr__(
             self,
             "_state",
             state,
         )
+        object.__setattr__(
+            self,
+            "_checkpoint",
+            checkpoint,
+        )
+        object.__setattr__(
+            self,
+            "_early_stopping",
+            early_stopping,
+        )
         object.__setattr__(
             self,
             "_lock",
@@ -458,49 +640,34 @@ class EvaluatorSuite[**Args, Parameters: State](Immutable):
         **kwargs: Args.kwargs,
     ) -> EvaluatorSuiteResult:
         async with ctx.scope(f"evaluator.suite.{self.name}", *self._state):
-            available_cases: Sequence[EvaluatorSuiteCase[Parameters]]
-            async with self._lock:
-                available_cases = await self._available_cases()
-
-            selected_cases: Sequence[EvaluatorSuiteCase[Parameters]]
-            if cases is None:
-                selected_cases = available_cases
-
-            elif isinstance(cases, int):
-                selected_cases = random.sample(  # nosec: B311
-                    available_cases,
-                    min(len(available_cases), cases),
-                )
+            selected_cases: Sequence[EvaluatorSuiteCase[Parameters]] = await self._selected_cases(
+                cases
+            )
 
-            elif isinstance(cases, float):
-                assert 0 < cases <= 1  # nosec: B101
-                selected_cases = random.sample(  # nosec: B311
-                    available_cases,
-                    min(len(available_cases), int(len(available_cases) * cases)),
+            if self._early_stopping is not None:
+                return await self._evaluate_sequentially(
+                    selected_cases,
+                    *args,
+                    **kwargs,
                 )
 
-            else:
-                selected_cases = []
-                for case in cases:
-                    if isinstance(case, str):
-                        if evaluation_case := next(
-                            iter(
-                                available
-                                for available in available_cases
-                                if available.identifier == case
-                            ),
-                            None,
-                        ):
-                            selected_cases.append(evaluation_case)
-
-                        else:
-                            raise ValueError(f"Evaluation case with ID {case} does not exists.")
-
-                    elif isinstance(case, EvaluatorSuiteCase):
-                        selected_cases.append(cast(EvaluatorSuiteCase[Parameters], case))
-
-                    else:
-                        selected_cases.append(EvaluatorSuiteCase(parameters=case))
+            if self._checkpoint is not None:
+                async for _ in self._stream(
+                    selected_cases,
+                    *args,
+                    **kwargs,
+                ):
+                    pass  # results are collected from the checkpoint
+
+                selected_identifiers: Set[str] = {case.identifier for case in selected_cases}
+                return EvaluatorSuiteResult(
+                    suite=self.name,
+                    results=tuple(
+                        result
+                        for result in await _checkpoint_results(self._checkpoint)
+                        if result.case_identifier in selected_identifiers
+                    ),
+                )
 
             async def evaluate_case(
                 case: EvaluatorSuiteCase[Parameters],
@@ -520,21 +687,453 @@ class EvaluatorSuite[**Args, Parameters: State](Immutable):
                 ),
             )
 
+    async def stream(
+        self,
+        cases: Sequence[EvaluatorSuiteCase[Parameters] | Parameters | str]
+        | float
+        | int
+        | None = None,
+        /,
+        *args: Args.args,
+        **kwargs: Args.kwargs,
+    ) -> AsyncIterator[EvaluatorSuiteCaseResult]:
+        """
+        Evaluate selected cases yielding results as soon as each case completes.
+
+        Results are not retained by the suite. When a checkpoint is configured using
+        ``with_checkpoint``, each result is appended to it before being yielded and
+        cases already present in the checkpoint are skipped, allowing interrupted
+        runs to be resumed.
+
+        Parameters
+        ----------
+        cases : Sequence[EvaluatorSuiteCase | Parameters | str] | float | int | None, optional
+            Cases selection, the same as when calling the suite
+        *args : Args.args
+            Positional arguments passed to the suite definition
+        **kwargs : Args.kwargs
+            Keyword arguments passed to the suite definition
+
+        Yields
+        ------
+        EvaluatorSuiteCaseResult
+            Results of evaluated cases in completion order
+        """
+        async with ctx.scope(f"evaluator.suite.{self.name}", *self._state):
+            async for result in self._stream(
+                await self._selected_cases(cases),
+                *args,
+                **kwargs,
+            ):
+                yield result
+
+    async def dispatch(
+        self,
+        cases: Sequence[EvaluatorSuiteCase[Parameters] | Parameters | str]
+        | float
+        | int
+        | None = None,
+        /,
+        *,
+        tasks: MQQueue[str],
+        results: MQQueue[str],
+        timeout: float | None = None,
+    ) -> EvaluatorSuiteResult:
+        """
+        Evaluate selected cases using workers consuming from a message queue.
+
+        Selected cases are published to the ``tasks`` queue, evaluated by workers
+        running ``serve`` and gathered from the ``results`` queue. Each dispatch should
+        use a dedicated results queue, results of other runs are acknowledged and
+        ignored. When a checkpoint is configured, cases already present in it are not
+        published and gathered results are appended to it.
+
+        Parameters
+        ----------
+        cases : Sequence[EvaluatorSuiteCase | Parameters | str] | float | int | None, optional
+            Cases selection, the same as when calling the suite
+        tasks : MQQueue[str]
+            Queue receiving cases to evaluate
+        results : MQQueue[str]
+            Queue delivering evaluated case results
+        timeout : float | None, optional
+            Maximum time in seconds to wait for all results, ``None`` waits indefinitely
+
+        Returns
+        -------
+        EvaluatorSuiteResult
+            Aggregated results of all selected cases
+
+        Raises
+        ------
+        TimeoutError
+            When results were not gathered within the timeout
+        """
+        async with ctx.scope(f"evaluator.suite.{self.name}.dispatch", *self._state):
+            selected_cases: Sequence[EvaluatorSuiteCase[Parameters]] = await self._selected_cases(
+                cases
+            )
+            completed: Set[str] = frozenset()
+            if self._checkpoint is not None:
+                completed = await _checkpoint_identifiers(self._checkpoint)
+
+            run: str = str(uuid4())
+            awaiting: set[str] = set()
+            for case in selected_cases:
+                if case.identifier in completed or case.identifier in awaiting:
+                    continue
+
+                await tasks.publish(
+                    json.dumps(
+                        {
+                            "run": run,
+                            "suite": self.name,
+                            "case": case.to_mapping(recursive=True),
+                        },
+                        cls=AttributesJSONEncoder,
+                    ),
+                    attributes={"run": run, "suite": self.name},
+                )
+                awaiting.add(case.identifier)
+
+            ctx.log_info(f"Dispatched {len(awaiting)} cases of evaluator suite `{self.name}`")
+            gathered: Mapping[str, EvaluatorSuiteCaseResult] = {}
+            if awaiting:
+                async with timeout_scope(timeout):
+                    gathered = await self._gathered_results(
+                        results,
+                        run=run,
+                        awaiting=awaiting,
+                    )
+
+            if self._checkpoint is not None:
+                gathered = {
+                    result.case_identifier: result
+                    for result in await _checkpoint_results(self._checkpoint)
+                }
+
+            return EvaluatorSuiteResult(
+                suite=self.name,
+                results=tuple(
+                    gathered[case.identifier]
+                    for case in selected_cases
+                    if case.identifier in gathered
+                ),
+            )
+
+    async def _gathered_results(
+        self,
+        results: MQQueue[str],
+        /,
+        *,
+        run: str,
+        awaiting: set[str],
+    ) -> Mapping[str, EvaluatorSuiteCaseResult]:
+        gathered: dict[str, EvaluatorSuiteCaseResult] = {}
+        async for message in await results.consume():
+            async with message as content:
+                match json.loads(content):
+                    case {"run": str() as result_run, "result": {**result}} if result_run == run:
+                        case_result: EvaluatorSuiteCaseResult = (
+                            EvaluatorSuiteCaseResult.from_mapping(result)
+                        )
+
+                    case _:
+                        ctx.log_warning("Ignoring unexpected evaluator suite result")
+                        continue
+
+            if case_result.case_identifier not in awaiting:
+                continue  # redelivered result
+
+            awaiting.remove(case_result.case_identifier)
+            gathered[case_result.case_identifier] = case_result
+            if self._checkpoint is not None:
+                await _checkpoint_append(
+                    self._checkpoint,
+                    record=case_result.to_json(),
+                )
+
+            if not awaiting:
+                break
+
+        return gathered
+
+    async def serve(
+        self,
+        tasks: MQQueue[str],
+        results: MQQueue[str],
+        /,
+        *args: Args.args,
+        **kwargs: Args.kwargs,
+    ) -> None:
+        """
+        Evaluate cases consumed from a message queue until consumption ends.
+
+        Worker counterpart of ``dispatch``, evaluating up to ``concurrent_evaluations``
+        cases at once. Each result is published to the ``results`` queue before its
+        task message is acknowledged. Failed evaluations are published as failed
+        results carrying the error in their metadata, tasks of other suites are
+        rejected.
+
+        Parameters
+        ----------
+        tasks : MQQueue[str]
+            Queue delivering cases to evaluate
+        results : MQQueue[str]
+            Queue receiving evaluated case results
+        *args : Args.args
+            Positional arguments passed to the suite definition
+        **kwargs : Args.kwargs
+            Keyword arguments passed to the suite definition
+        """
+
+        async def evaluate(
+            message: MQMessage[str],
+        ) -> None:
+            async with message as content:
+                match json.loads(content):
+                    case {"run": str() as run, "suite": str() as suite, "case": {**case}} if (
+                        suite == self.name
+                    ):
+                        evaluated_case: EvaluatorSuiteCase[Parameters] = EvaluatorSuiteCase[
+                            self._parameters
+                        ].from_mapping(case)
+
+                    case _:
+                        raise ValueError(f"Unexpected task for evaluator suite `{self.name}`")
+
+                result: EvaluatorSuiteCaseResult
+                try:
+                    result = await self._evaluate_case(
+                        evaluated_case,
+                        *args,
+                        **kwargs,
+                    )
+
+                except Exception as exc:
+                    ctx.log_error(
+                        f"Evaluator suite `{self.name}` case {evaluated_case.identifier} failed",
+                        exception=exc,
+                    )
+                    # publish failure so the dispatcher does not wait for redeliveries
+                    result = EvaluatorSuiteCaseResult(
+                        case_identifier=evaluated_case.identifier,
+                        results=(
+                            EvaluatorResult.of(
+                                self.name,
+                                score=EvaluationScore.of(
+                                    0.0,
+                                    meta=Meta.empty.with_error(exc),
+                                ),
+                                threshold=1.0,
+                            ),
+                        ),
+                    )
+
+                await results.publish(
+                    json.dumps(
+                        {
+                            "run": run,
+                            "result": result.to_mapping(recursive=True),
+                        },
+                        cls=AttributesJSONEncoder,
+                    ),
+                    attributes={"run": run, "suite": self.name},
+                )
+
+        async with ctx.scope(f"evaluator.suite.{self.name}.serve", *self._state):
+            await process_concurrently(
+                await tasks.consume(),
+                evaluate,
+                concurrent_tasks=self.concurrent_evaluations,
+                ignore_exceptions=True,
+            )
+
+    async def _stream(
+        self,
+        cases: Sequence[EvaluatorSuiteCase[Parameters]],
+        /,
+        *args: Args.args,
+        **kwargs: Args.kwargs,
+    ) -> AsyncGenerator[EvaluatorSuiteCaseResult]:
+        completed: Set[str] = frozenset()
+        if self._checkpoint is not None:
+            completed = await _checkpoint_identifiers(self._checkpoint)
+
+        pending: Iterator[EvaluatorSuiteCase[Parameters]] = iter(
+            case for case in cases if case.identifier not in completed
+        )
+        running: set[Task[EvaluatorSuiteCaseResult]] = {
+            ctx.spawn(self._evaluate_case, case, *args, **kwargs)
+            for case in islice(pending, self.concurrent_evaluations)
+        }
+        try:
+            while running:
+                done, _ = await wait(
+                    running,
+                    return_when=FIRST_COMPLETED,
+                )
+                running.difference_update(done)
+                # keep evaluating while results are consumed
+                running.update(
+                    ctx.spawn(self._evaluate_case, case, *args, **kwargs)
+                    for case in islice(pending, len(done))
+                )
+
+                for task in done:
+                    result: EvaluatorSuiteCaseResult = task.result()
+                    if self._checkpoint is not None:
+                        await _checkpoint_append(
+                            self._checkpoint,
+                            record=result.to_json(),
+                        )
+
+                    yield result
+
+        finally:
+            for task in running:
+                task.cancel()
+
+    async def _evaluate_sequentially(
+        self,
+        cases: Sequence[EvaluatorSuiteCase[Parameters]],
+        /,
+        *args: Args.args,
+        **kwargs: Args.kwargs,
+    ) -> EvaluatorSuiteResult:
+        assert self._early_stopping is not None  # nosec: B101
+        results: list[EvaluatorSuiteCaseResult] = []
+        if self._checkpoint is not None:
+            selected_identifiers: Set[str] = {case.identifier for case in cases}
+            results.extend(
+                result
+                for result in await _checkpoint_results(self._checkpoint)
+                if result.case_identifier in selected_identifiers
+            )
+
+        evaluated_identifiers: Set[str] = {result.case_identifier for result in results}
+        pending: Sequence[EvaluatorSuiteCase[Parameters]] = [
+            case for case in cases if case.identifier not in evaluated_identifiers
+        ]
+        pending = random.sample(pending, len(pending))  # nosec: B311
+        summary: Meta = self._early_stopping.summary(results)
+        checked: int = len(results)
+        if not summary.get_bool("settled"):
+            # cases are evaluated continuously, the decision is checked after each batch
+            async with aclosing(self._stream(pending, *args, **kwargs)) as stream:
+                async for result in stream:
+                    results.append(result)
+                    if len(results) - checked < self._early_stopping.batch_size:
+                        continue
+
+                    checked = len(results)
+                    summary = self._early_stopping.summary(results)
+                    if summary.get_bool("settled"):
+                        break
+
+        if checked != len(results):
+            summary = self._early_stopping.summary(results)
+
+        ctx.log_info(
+            f"Evaluator suite `{self.name}` evaluated {len(results)} of {len(cases)} cases"
+            f" ({'settled' if summary.get_bool('settled') else 'not settled'})"
+        )
+        return EvaluatorSuiteResult(
+            suite=self.name,
+            results=results,
+            decision=summary.get_bool("passed"),
+            meta=summary.merged_with({"selected": len(cases)}),
+        )
+
+    async def _selected_cases(
+        self,
+        cases: Sequence[EvaluatorSuiteCase[Parameters] | Parameters | str] | float | int | None,
+        /,
+    ) -> Sequence[EvaluatorSuiteCase[Parameters]]:
+        available_cases: Sequence[EvaluatorSuiteCase[Parameters]]
+        cases_index: Mapping[str, EvaluatorSuiteCase[Parameters]] | None
+        async with self._lock:
+            available_cases = await self._available_cases()
+            cases_index = self._cases_index
+
+        assert cases_index is not None  # nosec: B101
+        if cases is None:
+            return available_cases
+
+        elif isinstance(cases, int):
+            return await self._sampled_cases(
+                available_cases,
+                count=min(len(available_cases), cases),
+            )
+
+        elif isinstance(cases, float):
+            assert 0 < cases <= 1  # nosec: B101
+            return await self._sampled_cases(
+                available_cases,
+                count=min(len(available_cases), int(len(available_cases) * cases)),
+            )
+
+        selected_cases: list[EvaluatorSuiteCase[Parameters]] = []
+        for case in cases:
+            if isinstance(case, str):
+                if evaluation_case := cases_index.get(case):
+                    selected_cases.append(evaluation_case)
+
+                else:
+                    raise ValueError(f"Evaluation case with ID {case} does not exists.")
+
+            elif isinstance(case, EvaluatorSuiteCase):
+                selected_cases.append(cast(EvaluatorSuiteCase[Parameters], case))
+
+            else:
+                selected_cases.append(EvaluatorSuiteCase(parameters=case))
+
+        return selected_cases
+
+    async def _sampled_cases(
+        self,
+        available_cases: Sequence[EvaluatorSuiteCase[Parameters]],
+        /,
+        *,
+        count: int,
+    ) -> Sequence[EvaluatorSuiteCase[Parameters]]:
+        if self._checkpoint is None:
+            return random.sample(available_cases, count)  # nosec: B311
+
+        # sampled selection is pinned in the checkpoint so resumed runs evaluate the same cases
+        selection: Sequence[str] | None = await _checkpoint_selection(self._checkpoint)
+        if selection is None:
+            sampled: Sequence[EvaluatorSuiteCase[Parameters]] = random.sample(  # nosec: B311
+                available_cases,
+                count,
+            )
+            await _checkpoint_append(
+                self._checkpoint,
+                record=json.dumps({"selection": [case.identifier for case in sampled]}),
+            )
+            return sampled
+
+        cases_index: Mapping[str, EvaluatorSuiteCase[Parameters]] = {
+            case.identifier: case for case in available_cases
+        }
+        return [cases_index[identifier] for identifier in selection if identifier in cases_index]
+
     async def _evaluate_case(
         self,
         case: EvaluatorSuiteCase[Parameters],
         *args: Args.args,
         **kwargs: Args.kwargs,
     ) -> EvaluatorSuiteCaseResult:
-        results: Sequence[EvaluatorScenarioResult | EvaluatorResult] = await self._definition(
-            case.parameters,
-            *args,
-            **kwargs,
-        )
-
+        # cases are not cached as a whole, their results depend on the evaluated
+        # system which is not part of case parameters, evaluators used by the
+        # definition cache results keyed by the actually evaluated values instead
         return EvaluatorSuiteCaseResult(
             case_identifier=case.identifier,
-            results=results,
+            results=await self._definition(
+                case.parameters,
+                *args,
+                **kwargs,
+            ),
         )
 
     async def _available_cases(
@@ -542,18 +1141,27 @@ class EvaluatorSuite[**Args, Parameters: State](Immutable):
         reload: bool = False,
     ) -> Sequence[EvaluatorSuiteCase[Parameters]]:
         if reload or self._cases_cache is None:
-            object.__setattr__(
-                self,
-                "_cases_cache",
-                await self._cases_storage.load(),
-            )
-
-            assert self._cases_cache is not None  # nosec: B101
-            return self._cases_cache
+            return self._cache_cases(await self._cases_storage.load())
 
         else:
             return self._cases_cache
 
+    def _cache_cases(
+        self,
+        cases: Sequence[EvaluatorSuiteCase[Parameters]],
+    ) -> Sequence[EvaluatorSuiteCase[Parameters]]:
+        object.__setattr__(
+            self,
+            "_cases_cache",
+            cases,
+        )
+        object.__setattr__(
+            self,
+            "_cases_index",
+            {case.identifier: case for case in cases},
+        )
+        return cases
+
     def with_name(
         self,
         name: str,
@@ -567,6 +1175,8 @@ class EvaluatorSuite[**Args, Parameters: State](Immutable):
             definition=self._definition,
             cases_storage=self._cases_storage,
             state=self._state,
+            checkpoint=self._checkpoint,
+            early_stopping=self._early_stopping,
         )
 
     def with_concurrent_evaluations(
@@ -582,6 +1192,8 @@ class EvaluatorSuite[**Args, Parameters: State](Immutable):
             definition=self._definition,
             cases_storage=self._cases_storage,
             state=self._state,
+            checkpoint=self._checkpoint,
+            early_stopping=self._early_stopping,
         )
 
     def with_meta(
@@ -597,6 +1209,8 @@ class EvaluatorSuite[**Args, Parameters: State](Immutable):
             definition=self._definition,
             cases_storage=self._cases_storage,
             state=self._state,
+            checkpoint=self._checkpoint,
+            early_stopping=self._early_stopping,
         )
 
     def with_state(
@@ -613,6 +1227,8 @@ class EvaluatorSuite[**Args, Parameters: State](Immutable):
             definition=self._definition,
             cases_storage=self._cases_storage,
             state=(*self._state, state, *states),
+            checkpoint=self._checkpoint,
+            early_stopping=self._early_stopping,
         )
 
     def with_storage(
@@ -624,7 +1240,13 @@ class EvaluatorSuite[**Args, Parameters: State](Immutable):
         /,
     ) -> Self:
         suite_storage: EvaluatorSuiteCasesStorage[Parameters]
-        if isinstance(storage, Path | str):
+        if isinstance(storage, Path | str) and str(storage).endswith(".jsonl"):
+            suite_storage = _EvaluatorSuiteJSONLStorage[Parameters](
+                path=storage,
+                parameters=self._parameters,
+            )
+
+        elif isinstance(storage, Path | str):
             suite_storage = _EvaluatorSuiteFileStorage[Parameters](
                 path=storage,
                 parameters=self._parameters,
@@ -646,6 +1268,80 @@ class EvaluatorSuite[**Args, Parameters: State](Immutable):
             definition=self._definition,
             cases_storage=suite_storage,
             state=self._state,
+            checkpoint=self._checkpoint,
+            early_stopping=self._early_stopping,
+        )
+
+    def with_early_stopping(
+        self,
+        early_stopping: EvaluatorSuiteEarlyStopping | None,
+        /,
+    ) -> Self:
+        """
+        Create a copy stopping evaluation once its outcome is statistically settled.
+
+        Parameters
+        ----------
+        early_stopping : EvaluatorSuiteEarlyStopping | None
+            Early stopping configuration, ``None`` evaluates all selected cases
+
+        Returns
+        -------
+        Self
+            New suite instance using early stopping
+        """
+        if early_stopping is not None:
+            assert 0 <= early_stopping.pass_rate <= 1  # nosec: B101
+            assert 0 < early_stopping.confidence < 1  # nosec: B101
+            assert early_stopping.batch_size > 0  # nosec: B101
+
+        return self.__class__(
+            name=self.name,
+            concurrent_evaluations=self.concurrent_evaluations,
+            meta=self.meta,
+            parameters=self._parameters,
+            definition=self._definition,
+            cases_storage=self._cases_storage,
+            state=self._state,
+            checkpoint=self._checkpoint,
+            early_stopping=early_stopping,
+        )
+
+    def with_checkpoint(
+        self,
+        checkpoint: Path | str | None,
+        /,
+    ) -> Self:
+        """
+        Create a copy persisting case results to a JSONL checkpoint file.
+
+        Each completed case result is appended as a single line. Cases already
+        present in the checkpoint are skipped, so rerunning an interrupted suite
+        resumes it, and the aggregated result is read from the checkpoint. Cases
+        passed as parameters receive new identifiers on each run and can't be resumed.
+        Cases sampled by count or fraction are recorded in the checkpoint on the first
+        run and the same selection is reused when resuming.
+
+        Parameters
+        ----------
+        checkpoint : Path | str | None
+            Checkpoint file path, ``None`` disables checkpointing
+
+        Returns
+        -------
+        Self
+            New suite instance using the checkpoint
+        """
+        return self.__class__(
+            name=self.name,
+            concurrent_evaluations=self.concurrent_evaluations,
+            meta=self.meta,
+            parameters=self._parameters,
+            definition=self._definition,
+            cases_storage=self._cases_storage,
+            state=self._state,
+            checkpoint=Path(checkpoint) if checkpoint is not None else None,
+            early_stopping=self._early_stopping,
         )
 
     async def cases(
@@ -662,24 +1358,22 @@ class EvaluatorSuite[**Args, Parameters: State](Immutable):
         /,
         identifier: str | None = None,
     ) -> None:
+        case: EvaluatorSuiteCase[Parameters] = EvaluatorSuiteCase[Parameters](
+            identifier=identifier if identifier is not None else str(uuid4()),
+            parameters=parameters,
+        )
         async with self._lock:
+            if isinstance(self._cases_storage, EvaluatorSuiteCasesIncrementalStorage):
+                await self._cases_storage.append((case,))
+                if self._cases_cache is not None:
+                    self._cache_cases((*self._cases_cache, case))
+
+                return
+
             current_cases: Sequence[EvaluatorSuiteCase[Parameters]] = await self._available_cases(
                 reload=True
             )
-            object.__setattr__(
-                self,
-                "_cases_cache",
-                (
-                    *current_cases,
-                    EvaluatorSuiteCase[Parameters](
-                        identifier=identifier if identifier is not None else str(uuid4()),
-                        parameters=parameters,
-                    ),
-                ),
-            )
-
-            assert self._cases_cache is not None  # nosec: B101
-            await self._cases_storage.save(self._cases_cache)
+            await self._cases_storage.save(self._cache_cases((*current_cases, case)))
 
     async def generate_cases(
         self,
@@ -688,6 +1382,8 @@ class EvaluatorSuite[**Args, Parameters: State](Immutable):
         persist: bool = False,
         guidelines: str | None = None,
         examples: Iterable[Parameters] | None = None,
+        concurrent_generations: int = 1,
+        similarity_threshold: float | None = None,
     ) -> Sequence[EvaluatorSuiteCase[Parameters]]:
         async with self._lock:
             from draive.helpers.evaluation_case_generation import generate_case_parameters
@@ -703,18 +1399,22 @@ class EvaluatorSuite[**Args, Parameters: State](Immutable):
                     count=count,
                     examples=examples or [case.parameters for case in current_cases],
                     guidelines=guidelines,
+                    concurrent_generations=concurrent_generations,
+                    similarity_threshold=similarity_threshold,
                 )
             ]
 
-            object.__setattr__(
-                self,
-                "_cases_cache",
-                (*current_cases, *generated),
+            cases: Sequence[EvaluatorSuiteCase[Parameters]] = self._cache_cases(
+                (*current_cases, *generated)
             )
+            if not persist:
+                return generated
+
+            if isinstance(self._cases_storage, EvaluatorSuiteCasesIncrementalStorage):
+                await self._cases_storage.append(generated)
 
-            assert self._cases_cache is not None  # nosec: B101
-            if persist:
-                await self._cases_storage.save(self._cases_cache)
+            else:
+                await self._cases_storage.save(cases)
 
             return generated
 
@@ -724,16 +1424,113 @@ class EvaluatorSuite[**Args, Parameters: State](Immutable):
         /,
     ) -> None:
         async with self._lock:
+            if isinstance(self._cases_storage, EvaluatorSuiteCasesIncrementalStorage):
+                await self._cases_storage.remove((identifier,))
+                if self._cases_cache is not None:
+                    self._cache_cases(
+                        tuple(case for case in self._cases_cache if case.identifier != identifier)
+                    )
+
+                return
+
             current_cases: Sequence[EvaluatorSuiteCase[Parameters]] = await self._available_cases(
                 reload=True
             )
-            object.__setattr__(
-                self,
-                "_cases_cache",
-                tuple(case for case in current_cases if case.identifier != identifier),
+            await self._cases_storage.save(
+                self._cache_cases(
+                    tuple(case for case in current_cases if case.identifier != identifier)
+                )
             )
-            assert self._cases_cache is not None  # nosec: B101
-            await self._cases_storage.save(self._cases_cache)
+
+
+@asynchronous
+def _checkpoint_identifiers(
+    path: Path,
+) -> Set[str]:
+    identifiers: set[str] = set()
+    if not path.exists():
+        return identifiers
+
+    with open(path, encoding="utf-8") as file:
+        for line in file:
+            try:
+                match json.loads(line):
+                    case {"case_identifier": str() as identifier}:
+                        identifiers.add(identifier)
+
+                    case _:
+                        continue  # skip unknown lines
+
+            except ValueError:
+                continue  # skip partially written line after interruption
+
+    return identifiers
+
+
+@asynchronous
+def _checkpoint_results(
+    path: Path,
+) -> Sequence[EvaluatorSuiteCaseResult]:
+    results: dict[str, EvaluatorSuiteCaseResult] = {}
+    if not path.exists():
+        return ()
+
+    with open(path, encoding="utf-8") as file:
+        for line in file:
+            if not line.strip():
+                continue
+
+            try:
+                result: EvaluatorSuiteCaseResult = EvaluatorSuiteCaseResult.from_json(line)
+
+            except Exception:
+                continue  # skip partially written line after interruption
+
+            results[result.case_identifier] = result  # latest result wins
+
+    return tuple(results.values())
+
+
+@asynchronous
+def _checkpoint_selection(
+    path: Path,
+) -> Sequence[str] | None:
+    if not path.exists():
+        return None
+
+    with open(path, encoding="utf-8") as file:
+        for line in file:
+            try:
+                match json.loads(line):
+                    case {"selection": [*identifiers]}:
+                        return tuple(str(identifier) for identifier in identifiers)
+
+                    case _:
+                        continue  # skip results
+
+            except ValueError:
+                continue  # skip partially written line after interruption
+
+    return None
+
+
+@asynchronous
+def _checkpoint_append(
+    path: Path,
+    *,
+    record: str,
+) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    data: bytes = f"{record}\n".encode()
+    with open(path, mode="ab+") as file:
+        if file.tell() > 0:
+            file.seek(-1, os.SEEK_END)
+            if file.read(1) != b"\n":
+                data = b"\n" + data  # terminate line torn by an interruption
+
+        file.write(data)
+        file.flush()
+        os.fsync(file.fileno())
 
 
 def evaluator_suite[**Args, Parameters: State](
@@ -768,7 +1565,7 @@ def evaluator_suite[**Args, Parameters: State](
     storage : EvaluatorSuiteCasesStorage | Sequence | Path | str | None, optional
         Storage backend for test cases. Can be:
         - None: In-memory storage with empty initial cases
-        - Path/str: File-based storage at specified path
+        - Path/str: File-based storage at specified path, JSON Lines when using `.jsonl` suffix
         - Sequence[EvaluatorSuiteCase]: In-memory storage with initial cases
         - EvaluatorSuiteCasesStorage: Custom storage backend
     concurrent_evaluations : int, optional
@@ -809,6 +1606,12 @@ def evaluator_suite[**Args, Parameters: State](
             cases=(),
         )
 
+    elif isinstance(storage, Path | str) and str(storage).endswith(".jsonl"):
+        suite_storage = _EvaluatorSuiteJSONLStorage[Parameters](
+            path=storage,
+            parameters=parameters,
+        )
+
     elif isinstance(storage, Path | str):
         suite_storage = _EvaluatorSuiteFileStorage[Parameters](
             path=storage,
@@ -951,3 +1754,169 @@ class _EvaluatorSuiteFileStorage[Parameters: State](Immutable):
                     cls=AttributesJSONEncoder,
                 ).encode("utf-8")
             )
+
+
+class _EvaluatorSuiteJSONLStorage[Parameters: State](Immutable):
+    _path: Path
+    _data_type: type[EvaluatorSuiteCase[Parameters]]
+    _compaction_threshold: int
+    # identifiers of live cases, None until the file was loaded
+    _identifiers: set[str] | None
+    _garbage: int
+
+    def __init__(
+        self,
+        path: Path | str,
+        parameters: type[Parameters],
+        compaction_threshold: int = 1024,
+    ) -> None:
+        object.__setattr__(
+            self,
+            "_path",
+            Path(path) if isinstance(path, str) else path,
+        )
+        object.__setattr__(
+            self,
+            "_data_type",
+            EvaluatorSuiteCase[parameters],
+        )
+        object.__setattr__(
+            self,
+            "_compaction_threshold",
+            compaction_threshold,
+        )
+        object.__setattr__(
+            self,
+            "_identifiers",
+            None,
+        )
+        object.__setattr__(
+            self,
+            "_garbage",
+            0,
+        )
+
+    async def load(
+        self,
+    ) -> Sequence[EvaluatorSuiteCase[Parameters]]:
+        try:
+            cases, lines = await self._file_load(data_type=self._data_type)
+
+        except ValueError as exc:
+            ctx.log_error(
+                f"Invalid EvaluationSuite at {self._path}",
+                exception=exc,
+            )
+            raise exc
+
+        object.__setattr__(self, "_identifiers", {case.identifier for case in cases})
+        object.__setattr__(self, "_garbage", lines - len(cases))
+        return cases
+
+    async def save(
+        self,
+        cases: Sequence[EvaluatorSuiteCase[Parameters]],
+    ) -> None:
+        await self._file_save(cases)
+        identifiers: set[str] = {case.identifier for case in cases}
+        object.__setattr__(self, "_identifiers", identifiers)
+        object.__setattr__(self, "_garbage", len(cases) - len(identifiers))
+
+    async def append(
+        self,
+        cases: Sequence[EvaluatorSuiteCase[Parameters]],
+    ) -> None:
+        identifiers: set[str] = await self._live_identifiers()
+        await self._file_append([case.to_mapping() for case in cases])
+        garbage: int = self._garbage
+        for case in cases:
+            if case.identifier in identifiers:
+                garbage += 1  # replaced entry stays in the file
+
+            else:
+                identifiers.add(case.identifier)
+
+        object.__setattr__(self, "_garbage", garbage)
+        await self._compact_if_needed()
+
+    async def remove(
+        self,
+        identifiers: Collection[str],
+    ) -> None:
+        live: set[str] = await self._live_identifiers()
+        removed: Sequence[str] = [
+            identifier for identifier in dict.fromkeys(identifiers) if identifier in live
+        ]
+        if not removed:
+            return  # nothing to remove
+
+        # removals are appended as tombstones, compacting once they outweigh live cases
+        await self._file_append([{"removed": identifier} for identifier in removed])
+        live.difference_update(removed)
+        object.__setattr__(self, "_garbage", self._garbage + 2 * len(removed))
+        await self._compact_if_needed()
+
+    async def _live_identifiers(self) -> set[str]:
+        if self._identifiers is None:
+            await self.load()  # derive counts from the file before the first change
+
+        assert self._identifiers is not None  # nosec: B101
+        return self._identifiers
+
+    async def _compact_if_needed(self) -> None:
+        assert self._identifiers is not None  # nosec: B101
+        if self._garbage >= self._compaction_threshold and self._garbage > len(self._identifiers):
+            await self.save(await self.load())
+
+    @asynchronous
+    def _file_load(
+        self,
+        data_type: type[EvaluatorSuiteCase[Parameters]],
+    ) -> tuple[Sequence[EvaluatorSuiteCase[Parameters]], int]:
+        if not self._path.exists():
+            return ((), 0)
+
+        cases: dict[str, EvaluatorSuiteCase[Parameters]] = {}
+        lines: int = 0
+        with open(self._path, encoding="utf-8") as file:
+            for line in file:  # stream lines instead of reading the whole file
+                if not line.strip():
+                    continue
+
+                lines += 1
+                match json.loads(line):
+                    case {"removed": str() as identifier}:
+                        cases.pop(identifier, None)
+
+                    case {**case}:
+                        loaded: EvaluatorSuiteCase[Parameters] = data_type.from_mapping(case)
+                        cases.pop(loaded.identifier, None)  # latest entry wins
+                        cases[loaded.identifier] = loaded
+
+                    case _:
+                        raise ValueError(f"Invalid evaluation suite data at {self._path}")
+
+        return (tuple(cases.values()), lines)
+
+    @asynchronous
+    def _file_append(
+        self,
+        entries: Sequence[Mapping[str, Any]],
+    ) -> None:
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self._path, mode="a", encoding="utf-8") as file:
+            file.writelines(
+                f"{json.dumps(entry, cls=AttributesJSONEncoder)}\n" for entry in entries
+            )
+
+    @asynchronous
+    def _file_save(
+        self,
+        cases: Sequence[EvaluatorSuiteCase[Parameters]],
+    ) -> None:
+        write_atomically(
+            self._path,
+            "".join(
+                f"{json.dumps(case.to_mapping(), cls=AttributesJSONEncoder)}\n" for case in cases
+            ).encode("utf-8"),
+        )
@@ -5,6 +5,7 @@ from draive.evaluators.conciseness import conciseness_context_evaluator, concise
 from draive.evaluators.consistency import consistency_context_evaluator, consistency_evaluator
 from draive.evaluators.coverage import coverage_context_evaluator, coverage_evaluator
 from draive.evaluators.creativity import creativity_context_evaluator, creativity_evaluator
+from draive.evaluators.criteria import EvaluationCriterion, criteria_evaluator
 from draive.evaluators.expectations import expectations_context_evaluator, expectations_evaluator
 from draive.evaluators.factual_accuracy import (
     factual_accuracy_context_evaluator,
@@ -24,9 +25,11 @@ from draive.evaluators.readability import readability_context_evaluator, readabi
 from draive.evaluators.relevance import relevance_context_evaluator, relevance_evaluator
 from draive.evaluators.safety import safety_context_evaluator, safety_evaluator
 from draive.evaluators.similarity import (
+    image_vector_similarity_batch,
     image_vector_similarity_evaluator,
     similarity_context_evaluator,
     similarity_evaluator,
+    text_vector_similarity_batch,
     text_vector_similarity_evaluator,
 )
 from draive.evaluators.tone_style import tone_style_context_evaluator, tone_style_evaluator
@@ -34,6 +37,7 @@ from draive.evaluators.tool_usage import ToolUsageRequirement, tool_usage_contex
 from draive.evaluators.truthfulness import truthfulness_context_evaluator, truthfulness_evaluator
 
 __all__ = (
+    "EvaluationCriterion",
     "ToolUsageRequirement",
     "cohen_kappa_evaluator",
     "coherence_context_evaluator",
@@ -48,6 +52,7 @@ __all__ = (
     "coverage_evaluator",
     "creativity_context_evaluator",
     "creativity_evaluator",
+    "criteria_evaluator",
     "expectations_context_evaluator",
     "expectations_evaluator",
     "factual_accuracy_context_evaluator",
@@ -60,6 +65,7 @@ __all__ = (
     "groundedness_evaluator",
     "helpfulness_context_evaluator",
     "helpfulness_evaluator",
+    "image_vector_similarity_batch",
     "image_vector_similarity_evaluator",
     "jailbreak_context_evaluator",
     "jailbreak_evaluator",
@@ -73,6 +79,7 @@ __all__ = (
     "safety_evaluator",
     "similarity_context_evaluator",
     "similarity_evaluator",
+    "text_vector_similarity_batch",
     "text_vector_similarity_evaluator",
     "tone_style_context_evaluator",
     "tone_style_evaluator",
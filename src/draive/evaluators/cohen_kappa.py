@@ -8,8 +8,8 @@ from draive.evaluation import (
     evaluator,
 )
 from draive.evaluation.agreement import (
-    cohen_kappa,
-    quadratic_weighted_kappa,
+    AgreementEstimate,
+    agreement_estimate,
 )
 from draive.evaluation.value import evaluation_score_level, evaluation_score_value
 
@@ -102,21 +102,23 @@ async def cohen_kappa_evaluator(
         evaluation_score_level(_rating_value(rating)) for rating in reference
     )
 
-    nominal: float = cohen_kappa(reference_bins, evaluated_bins)
-    quadratic: float = quadratic_weighted_kappa(reference_bins, evaluated_bins)
-    exact_agreement: float = sum(
-        1 for left, right in zip(reference_bins, evaluated_bins, strict=True) if left == right
-    ) / len(evaluated_bins)
-
-    selected_kappa: float = quadratic if weighting == "quadratic" else nominal
+    # both variants share a single confusion matrix
+    agreement: AgreementEstimate = agreement_estimate(
+        reference_bins,
+        evaluated_bins,
+        resamples=None,
+    )
+    selected_kappa: float = (
+        agreement.quadratic_weighted_kappa if weighting == "quadratic" else agreement.cohen_kappa
+    )
 
     return EvaluationScore.of(
         max(0.0, selected_kappa),
         meta={
-            "cohen_kappa": nominal,
-            "quadratic_weighted_kappa": quadratic,
-            "exact_agreement": exact_agreement,
-            "sample_count": len(evaluated_bins),
+            "cohen_kappa": agreement.cohen_kappa,
+            "quadratic_weighted_kappa": agreement.quadratic_weighted_kappa,
+            "exact_agreement": agreement.exact_agreement,
+            "sample_count": agreement.sample_count,
             "weighting": weighting,
         },
     )
@@ -0,0 +1,455 @@
+import re
+from collections.abc import Mapping, MutableSequence, Sequence
+from typing import Final, Literal, Self, final
+
+from haiway import Meta, MetaValues, State, ctx
+
+from draive.evaluation import (
+    EvaluationScore,
+    EvaluationScoreValue,
+    EvaluatorResult,
+)
+from draive.evaluation.value import evaluation_score_value
+from draive.evaluators.coherence import CONTENT_INSTRUCTION as COHERENCE_INSTRUCTION
+from draive.evaluators.completeness import CONTENT_INSTRUCTION as COMPLETENESS_INSTRUCTION
+from draive.evaluators.conciseness import CONTENT_INSTRUCTION as CONCISENESS_INSTRUCTION
+from draive.evaluators.consistency import CONTENT_INSTRUCTION as CONSISTENCY_INSTRUCTION
+from draive.evaluators.coverage import CONTENT_INSTRUCTION as COVERAGE_INSTRUCTION
+from draive.evaluators.creativity import CONTENT_INSTRUCTION as CREATIVITY_INSTRUCTION
+from draive.evaluators.factual_accuracy import CONTENT_INSTRUCTION as FACTUAL_ACCURACY_INSTRUCTION
+from draive.evaluators.fluency import CONTENT_INSTRUCTION as FLUENCY_INSTRUCTION
+from draive.evaluators.groundedness import CONTENT_INSTRUCTION as GROUNDEDNESS_INSTRUCTION
+from draive.evaluators.helpfulness import CONTENT_INSTRUCTION as HELPFULNESS_INSTRUCTION
+from draive.evaluators.readability import CONTENT_INSTRUCTION as READABILITY_INSTRUCTION
+from draive.evaluators.relevance import CONTENT_INSTRUCTION as RELEVANCE_INSTRUCTION
+from draive.evaluators.safety import CONTENT_INSTRUCTION as SAFETY_INSTRUCTION
+from draive.evaluators.similarity import CONTENT_INSTRUCTION as SIMILARITY_INSTRUCTION
+from draive.evaluators.truthfulness import CONTENT_INSTRUCTION as TRUTHFULNESS_INSTRUCTION
+from draive.evaluators.utils import (
+    COMMENT_TAG_NAME,
+    RATING_TAG_NAME,
+    extract_evaluation_result,
+    is_empty_content,
+)
+from draive.models import ModelInput
+from draive.multimodal import Multimodal, MultimodalContent, MultimodalTag
+from draive.steps import Step
+
+__all__ = (
+    "EvaluationCriterion",
+    "criteria_evaluator",
+)
+
+EvaluationCriterionInput = Literal["reference", "user_query"]
+BuiltinEvaluationCriterion = Literal[
+    "coherence",
+    "completeness",
+    "conciseness",
+    "consistency",
+    "coverage",
+    "creativity",
+    "factual_accuracy",
+    "fluency",
+    "groundedness",
+    "helpfulness",
+    "readability",
+    "relevance",
+    "safety",
+    "similarity",
+    "truthfulness",
+]
+
+EVALUATION_TAG_NAME: Final[str] = "evaluation"
+
+
+@final
+class EvaluationCriterion(State):
+    """
+    Single criterion rated by the combined criteria evaluator.
+
+    Attributes
+    ----------
+    name : str
+        Name of the criterion, used as the name of produced evaluator result.
+    criteria : str
+        Description of the evaluated metric.
+    rating : str
+        Description of the rating scale.
+    requires : EvaluationCriterionInput | None
+        Additional input required to rate the criterion.
+    threshold : float
+        Minimum score (0-1) required for evaluation to pass.
+    meta : Meta
+        Additional metadata attached to produced evaluator result.
+    """
+
+    @classmethod
+    def of(
+        cls,
+        name: str,
+        /,
+        *,
+        criteria: str,
+        rating: str,
+        requires: EvaluationCriterionInput | None = None,
+        threshold: EvaluationScoreValue = 1,
+        meta: Meta | MetaValues | None = None,
+    ) -> Self:
+        """
+        Create a custom criterion.
+
+        Parameters
+        ----------
+        name : str
+            Name of the criterion.
+        criteria : str
+            Description of the evaluated metric.
+        rating : str
+            Description of the rating scale using evaluation score value names.
+        requires : EvaluationCriterionInput | None, optional
+            Additional input required to rate the criterion.
+        threshold : EvaluationScoreValue, optional
+            Minimum score to pass evaluation, by default 1.
+        meta : Meta | MetaValues | None, optional
+            Additional metadata attached to produced evaluator result.
+
+        Returns
+        -------
+        Self
+            Criterion instance.
+        """
+        return cls(
+            name=name,
+            criteria=criteria,
+            rating=rating,
+            requires=requires,
+            threshold=evaluation_score_value(threshold),
+            meta=Meta.of(meta),
+        )
+
+    @classmethod
+    def builtin(
+        cls,
+        name: BuiltinEvaluationCriterion,
+        /,
+        *,
+        threshold: EvaluationScoreValue = 1,
+        meta: Meta | MetaValues | None = None,
+    ) -> Self:
+        """
+        Prepare a criterion of a built-in evaluator.
+
+        Criterion description and rating scale are the same as used by the
+        corresponding evaluator, its results are named after that evaluator.
+
+        Parameters
+        ----------
+        name : BuiltinEvaluationCriterion
+            Name of the built-in evaluator.
+        threshold : EvaluationScoreValue, optional
+            Minimum score to pass evaluation, by default 1.
+        meta : Meta | MetaValues | None, optional
+            Additional metadata attached to produced evaluator result.
+
+        Returns
+        -------
+        Self
+            Criterion instance.
+        """
+        instruction, requires = _BUILTIN_CRITERIA[name]
+        return cls.of(
+            name,
+            criteria=_instruction_section(instruction, "EVALUATION_CRITERIA"),
+            rating=_instruction_section(instruction, "RATING"),
+            requires=requires,
+            threshold=threshold,
+            meta=meta,
+        )
+
+    name: str
+    criteria: str
+    rating: str
+    requires: EvaluationCriterionInput | None = None
+    threshold: float = 1
+    meta: Meta = Meta.empty
+
+
+async def criteria_evaluator(
+    evaluated: Multimodal,
+    /,
+    *,
+    criteria: Sequence[EvaluationCriterion],
+    reference: Multimodal | None = None,
+    user_query: Multimodal | None = None,
+    guidelines: str | None = None,
+) -> Sequence[EvaluatorResult]:
+    """
+    Evaluate multiple criteria using a single model call.
+
+    The evaluated content and its inputs are sent once and the model rates each
+    criterion separately. Each rating is parsed with the same rules as built-in
+    evaluators, producing one ``EvaluatorResult`` per criterion which makes the
+    function suitable for use within evaluator scenarios.
+
+    Parameters
+    ----------
+    evaluated : Multimodal
+        Content to evaluate.
+    criteria : Sequence[EvaluationCriterion]
+        Criteria to rate, e.g. ``EvaluationCriterion.builtin("coherence")``.
+    reference : Multimodal | None, optional
+        Reference content required by some of the criteria.
+    user_query : Multimodal | None, optional
+        User query required by some of the criteria.
+    guidelines : str | None, optional
+        Additional guidelines for the evaluation, by default None.
+
+    Returns
+    -------
+    Sequence[EvaluatorResult]
+        Results in order of requested criteria.
+    """
+    assert criteria, "Criteria can't be empty"  # nosec: B101
+    assert len({criterion.name for criterion in criteria}) == len(criteria), (  # nosec: B101
+        "Criteria names have to be unique"
+    )
+
+    async with ctx.scope("evaluator.criteria"):
+        scores: dict[str, EvaluationScore] = {}
+        rated: MutableSequence[EvaluationCriterion] = []
+        for criterion in criteria:
+            if is_empty_content(evaluated):
+                scores[criterion.name] = EvaluationScore.of(
+                    0.0,
+                    meta={"comment": "Input was empty!"},
+                )
+
+            elif criterion.requires == "reference" and (
+                reference is None or is_empty_content(reference)
+            ):
+                scores[criterion.name] = EvaluationScore.of(
+                    0.0,
+                    meta={"comment": "Reference was empty!"},
+                )
+
+            elif criterion.requires == "user_query" and (
+                user_query is None or is_empty_content(user_query)
+            ):
+                scores[criterion.name] = EvaluationScore.of(
+                    0.0,
+                    meta={"comment": "User query was empty!"},
+                )
+
+            else:
+                rated.append(criterion)
+
+        if rated:
+            try:
+                scores.update(
+                    _extract_criteria_results(
+                        await Step.generating_completion(
+                            instructions=_instruction(
+                                rated,
+                                reference=reference is not None,
+                                user_query=user_query is not None,
+                                guidelines=guidelines,
+                            ),
+                        ).run(
+                            (
+                                ModelInput.of(
+                                    _input_content(
+                                        evaluated,
+                                        reference=reference,
+                                        user_query=user_query,
+                                    )
+                                ),
+                            )
+                        ),
+                        criteria=rated,
+                    )
+                )
+
+            except Exception as exc:
+                ctx.log_error(
+                    "Criteria evaluation failed due to an error",
+                    exception=exc,
+                )
+                for criterion in rated:
+                    scores[criterion.name] = EvaluationScore.of(
+                        0.0,
+                        meta=Meta.empty.with_error(exc),
+                    )
+
+        results: MutableSequence[EvaluatorResult] = []
+        for criterion in criteria:
+            result: EvaluatorResult = EvaluatorResult.of(
+                criterion.name,
+                score=scores[criterion.name],
+                threshold=criterion.threshold,
+                meta=criterion.meta,
+            )
+            ctx.record_info(
+                metric=f"evaluator.{result.evaluator}.performance",
+                value=result.performance,
+                unit="%",
+                kind="histogram",
+                attributes={
+                    "passed": result.passed,
+                    "threshold": result.threshold,
+                    "score": result.score,
+                },
+            )
+            results.append(result)
+
+        return results
+
+
+def _extract_criteria_results(
+    content: MultimodalContent,
+    /,
+    *,
+    criteria: Sequence[EvaluationCriterion],
+) -> Mapping[str, EvaluationScore]:
+    evaluations: dict[str, MultimodalTag] = {}
+    for tag in content.tags():
+        if tag.name.lower() != EVALUATION_TAG_NAME:
+            continue
+
+        criterion_name: str | None = tag.meta.get_str("criterion")
+        if criterion_name is None:
+            raise ValueError(f"Invalid evaluator result - missing criterion name:\n{content}")
+
+        if criterion_name in evaluations:
+            raise ValueError(
+                f"Invalid evaluator result - multiple {criterion_name} evaluations:\n{content}"
+            )
+
+        evaluations[criterion_name] = tag
+
+    scores: dict[str, EvaluationScore] = {}
+    for criterion in criteria:
+        evaluation: MultimodalTag | None = evaluations.get(criterion.name)
+        try:
+            if evaluation is None:
+                raise ValueError(
+                    f"Invalid evaluator result - missing {criterion.name} evaluation:\n{content}"
+                )
+
+            scores[criterion.name] = extract_evaluation_result(evaluation.content)
+
+        except Exception as exc:
+            ctx.log_error(
+                f"Criterion `{criterion.name}` evaluation failed due to an error",
+                exception=exc,
+            )
+            scores[criterion.name] = EvaluationScore.of(
+                0.0,
+                meta=Meta.empty.with_error(exc),
+            )
+
+    return scores
+
+
+def _input_content(
+    evaluated: Multimodal,
+    /,
+    *,
+    reference: Multimodal | None,
+    user_query: Multimodal | None,
+) -> MultimodalContent:
+    parts: list[Multimodal] = []
+    if reference is not None:
+        parts.extend(("<REFERENCE>", reference, "</REFERENCE>\n"))
+
+    if user_query is not None:
+        parts.extend(("<USER_QUERY>", user_query, "</USER_QUERY>\n"))
+
+    parts.extend(("<EVALUATED>", evaluated, "</EVALUATED>"))
+    return MultimodalContent.of(*parts)
+
+
+def _instruction(
+    criteria: Sequence[EvaluationCriterion],
+    /,
+    *,
+    reference: bool,
+    user_query: bool,
+    guidelines: str | None,
+) -> str:
+    inputs: str = "".join(
+        (
+            " and the REFERENCE" if reference else "",
+            " and the USER_QUERY" if user_query else "",
+        )
+    )
+    described_criteria: str = "\n".join(
+        f'<CRITERION name="{criterion.name}">\n'
+        f"<EVALUATION_CRITERIA>\n{criterion.criteria}\n</EVALUATION_CRITERIA>\n"
+        f"<RATING>\n{criterion.rating}\n</RATING>\n"
+        "</CRITERION>"
+        for criterion in criteria
+    )
+    return CRITERIA_INSTRUCTION.format(
+        inputs=inputs,
+        criteria=described_criteria,
+        guidelines=f"\n<GUIDELINES>\n{guidelines}\n</GUIDELINES>\n" if guidelines else "",
+    )
+
+
+def _instruction_section(
+    instruction: str,
+    name: str,
+) -> str:
+    section: re.Match[str] | None = re.search(
+        rf"<{name}>\n(.*?)\n</{name}>",
+        instruction,
+        re.DOTALL,
+    )
+    assert section is not None, f"Missing {name} section"  # nosec: B101
+    return section.group(1)
+
+
+_BUILTIN_CRITERIA: Final[
+    Mapping[BuiltinEvaluationCriterion, tuple[str, EvaluationCriterionInput | None]]
+] = {
+    "coherence": (COHERENCE_INSTRUCTION, "reference"),
+    "completeness": (COMPLETENESS_INSTRUCTION, "user_query"),
+    "conciseness": (CONCISENESS_INSTRUCTION, "reference"),
+    "consistency": (CONSISTENCY_INSTRUCTION, "reference"),
+    "coverage": (COVERAGE_INSTRUCTION, "reference"),
+    "creativity": (CREATIVITY_INSTRUCTION, None),
+    "factual_accuracy": (FACTUAL_ACCURACY_INSTRUCTION, None),
+    "fluency": (FLUENCY_INSTRUCTION, None),
+    "groundedness": (GROUNDEDNESS_INSTRUCTION, "reference"),
+    "helpfulness": (HELPFULNESS_INSTRUCTION, "user_query"),
+    "readability": (READABILITY_INSTRUCTION, None),
+    "relevance": (RELEVANCE_INSTRUCTION, "reference"),
+    "safety": (SAFETY_INSTRUCTION, None),
+    "similarity": (SIMILARITY_INSTRUCTION, "reference"),
+    "truthfulness": (TRUTHFULNESS_INSTRUCTION, None),
+}
+
+CRITERIA_INSTRUCTION: str = f"""\
+You are evaluating the provided content according to multiple defined criteria at once.
+
+<INSTRUCTION>
+Carefully examine the EVALUATED content{{inputs}}, then rate the EVALUATED content separately for each of the CRITERIA, using solely the metric described by its EVALUATION_CRITERIA and its own RATING scale.
+Criteria may refer to the evaluated content as CONTENT or EVALUATED. Rate each criterion independently, do not let other criteria influence the score.
+Think step by step and provide explanation of each score before the score.
+Use the explained RATING scales and the requested FORMAT to provide the results.
+</INSTRUCTION>
+
+<CRITERIA>
+{{criteria}}
+</CRITERIA>
+{{guidelines}}
+<FORMAT>
+Respond using exactly the following XML structure repeated for each of the CRITERIA in the same order, and include no other text before or after it.
+Include both the rating and the comment tags exactly once within each evaluation.
+
+<{EVALUATION_TAG_NAME} criterion="Name of the rated criterion">
+  <{COMMENT_TAG_NAME}>Concise, step-by-step justification that supports the rating. Do not leave empty.</{COMMENT_TAG_NAME}>
+  <{RATING_TAG_NAME}>Single, lowercase rating name chosen from the criterion ratings list (no quotes or extra text).</{RATING_TAG_NAME}>
+</{EVALUATION_TAG_NAME}>
+</FORMAT>
+"""  # noqa: E501
@@ -1,8 +1,17 @@
 from base64 import urlsafe_b64decode
-from collections.abc import Sequence
+from collections.abc import Awaitable, Callable, Iterable, Mapping, Sequence
+
+import numpy as np
 
 from draive.embedding import Embedded, ImageEmbedding, TextEmbedding, vector_similarity_score
-from draive.evaluation import EvaluationScore, evaluator
+from draive.embedding.cosine import cosine_similarity
+from draive.evaluation import (
+    EvaluationScore,
+    EvaluationScoreValue,
+    Evaluator,
+    EvaluatorResult,
+    evaluator,
+)
 from draive.evaluators.utils import (
     FORMAT_INSTRUCTION,
     extract_evaluation_result,
@@ -196,6 +205,43 @@ async def text_vector_similarity_evaluator(
     return max(0.0, min(1.0, similarity))
 
 
+async def text_vector_similarity_batch(
+    pairs: Iterable[tuple[str, str]],
+    /,
+    *,
+    threshold: EvaluationScoreValue | None = None,
+) -> Sequence[EvaluatorResult]:
+    """
+    Evaluate text vector similarity for many pairs at once.
+
+    Unique texts of all pairs are embedded with a single ``TextEmbedding.embed_many``
+    call and all scores are computed together, producing the same results as
+    ``text_vector_similarity_evaluator`` applied to each pair, including its
+    context scope, metrics, error handling and ``EvaluationCache`` entries.
+
+    Parameters
+    ----------
+    pairs : Iterable[tuple[str, str]]
+        Pairs of evaluated and reference texts.
+    threshold : EvaluationScoreValue | None
+        Passing threshold of results, by default the threshold of
+        ``text_vector_similarity_evaluator``.
+
+    Returns
+    -------
+    Sequence[EvaluatorResult]
+        Evaluation results in the order of given pairs.
+    """
+    evaluated_pairs: Sequence[tuple[str, str]] = tuple(pairs)
+    return await _vector_similarity_batch(
+        text_vector_similarity_evaluator,
+        evaluated_pairs,
+        data=evaluated_pairs,
+        embedding=TextEmbedding.embed_many,
+        threshold=threshold,
+    )
+
+
 @evaluator(name="image_vector_similarity")
 async def image_vector_similarity_evaluator(
     evaluated: ResourceContent | bytes,
@@ -218,22 +264,8 @@ async def image_vector_similarity_evaluator(
     float
         Evaluation result clipped to [0.0, 1.0].
     """
-    evaluated_data: bytes
-    match evaluated:
-        case ResourceContent() as media:
-            evaluated_data = urlsafe_b64decode(media.data.encode("utf-8"))
-
-        case raw_data:
-            evaluated_data = raw_data
-
-    reference_data: bytes
-    match reference:
-        case ResourceContent() as media:
-            reference_data = urlsafe_b64decode(media.data.encode("utf-8"))
-
-        case raw_data:
-            reference_data = raw_data
-
+    evaluated_data: bytes = _image_data(evaluated)
+    reference_data: bytes = _image_data(reference)
     if not evaluated_data or not reference_data:
         return 0.0
 
@@ -249,6 +281,137 @@ async def image_vector_similarity_evaluator(
     return max(0.0, min(1.0, similarity))
 
 
+async def image_vector_similarity_batch(
+    pairs: Iterable[tuple[ResourceContent | bytes, ResourceContent | bytes]],
+    /,
+    *,
+    threshold: EvaluationScoreValue | None = None,
+) -> Sequence[EvaluatorResult]:
+    """
+    Evaluate image vector similarity for many pairs at once.
+
+    Unique images of all pairs are embedded with a single ``ImageEmbedding.embed_many``
+    call and all scores are computed together, producing the same results as
+    ``image_vector_similarity_evaluator`` applied to each pair, including its
+    context scope, metrics, error handling and ``EvaluationCache`` entries.
+
+    Parameters
+    ----------
+    pairs : Iterable[tuple[ResourceContent | bytes, ResourceContent | bytes]]
+        Pairs of evaluated and reference images.
+    threshold : EvaluationScoreValue | None
+        Passing threshold of results, by default the threshold of
+        ``image_vector_similarity_evaluator``.
+
+    Returns
+    -------
+    Sequence[EvaluatorResult]
+        Evaluation results in the order of given pairs.
+    """
+    evaluated_pairs: Sequence[tuple[ResourceContent | bytes, ResourceContent | bytes]] = tuple(
+        pairs
+    )
+    return await _vector_similarity_batch(
+        image_vector_similarity_evaluator,
+        evaluated_pairs,
+        data=tuple(
+            (_image_data(evaluated), _image_data(reference))
+            for evaluated, reference in evaluated_pairs
+        ),
+        embedding=ImageEmbedding.embed_many,
+        threshold=threshold,
+    )
+
+
+def _image_data(
+    image: ResourceContent | bytes,
+    /,
+) -> bytes:
+    match image:
+        case ResourceContent() as media:
+            return urlsafe_b64decode(media.data.encode("utf-8"))
+
+        case raw_data:
+            return raw_data
+
+
+async def _vector_similarity_batch[Value, Data: str | bytes](
+    evaluator: Evaluator[Value, ...],
+    pairs: Sequence[tuple[Value, Value]],
+    /,
+    *,
+    data: Sequence[tuple[Data, Data]],
+    embedding: Callable[[Sequence[Data]], Awaitable[Sequence[Embedded[Data]]]],
+    threshold: EvaluationScoreValue | None,
+) -> Sequence[EvaluatorResult]:
+    # behaves like calling the evaluator for each pair while sharing a single embedding call
+    if threshold is not None:
+        evaluator = evaluator.with_threshold(threshold)
+
+    async with evaluator._scope():  # pyright: ignore[reportPrivateUsage]
+        cache_keys: Sequence[str | None] = [
+            evaluator._cache_key(  # pyright: ignore[reportPrivateUsage]
+                evaluated,
+                reference=reference,
+            )
+            for evaluated, reference in pairs
+        ]
+        results: list[EvaluatorResult | None] = [
+            await evaluator._cached(cache_key)  # pyright: ignore[reportPrivateUsage]
+            if cache_key is not None
+            else None
+            for cache_key in cache_keys
+        ]
+
+        # pairs with empty elements are not embedded and score 0.0
+        pending: Sequence[int] = [index for index, result in enumerate(results) if result is None]
+        unique: Sequence[Data] = tuple(
+            dict.fromkeys(element for index in pending for element in data[index] if element)
+        )
+        try:
+            embedded: Sequence[Embedded[Data]] = await embedding(unique) if unique else ()
+            vectors: Mapping[Data, Sequence[float]] = {
+                element: embedded_element.vector
+                for element, embedded_element in zip(unique, embedded, strict=True)
+            }
+            for index in pending:
+                evaluated_data, reference_data = data[index]
+                similarity: float = 0.0
+                if evaluated_data in vectors and reference_data in vectors:
+                    similarity = float(
+                        cosine_similarity(
+                            np.asarray(vectors[evaluated_data]),
+                            np.asarray(vectors[reference_data]),
+                        )[0]
+                    )
+
+                results[index] = evaluator._result(  # pyright: ignore[reportPrivateUsage]
+                    max(0.0, min(1.0, similarity))
+                )
+
+        except Exception as exc:
+            failure: EvaluatorResult = evaluator._failed(exc)  # pyright: ignore[reportPrivateUsage]
+            for index in pending:
+                results[index] = failure
+
+        evaluated_results: Sequence[EvaluatorResult] = tuple(
+            result for result in results if result is not None
+        )
+        assert len(evaluated_results) == len(pairs)  # nosec: B101
+        for index in pending:
+            cache_key: str | None = cache_keys[index]
+            if cache_key is not None:
+                await evaluator._cache(  # pyright: ignore[reportPrivateUsage]
+                    cache_key,
+                    result=evaluated_results[index],
+                )
+
+        for result in evaluated_results:
+            evaluator._record(result)  # pyright: ignore[reportPrivateUsage]
+
+        return evaluated_results
+
+
 CONTEXT_REFERENCE_INSTRUCTION: str = f"""\
 You are evaluating model results produced within a conversation context according to the defined criteria.
 
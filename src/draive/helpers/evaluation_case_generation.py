@@ -1,8 +1,9 @@
 from collections.abc import Iterable, Sequence
 from typing import Any
 
-from haiway import State
+from haiway import State, ctx, execute_concurrently
 
+from draive.embedding import Embedded, TextEmbedding, vector_similarity_search
 from draive.generation import ModelGeneration
 
 __all__ = ("generate_case_parameters",)
@@ -36,26 +37,154 @@ async def generate_case_parameters[Parameters: State](
     count: int,
     examples: Iterable[Parameters],
     guidelines: str | None = None,
+    concurrent_generations: int = 1,
+    similarity_threshold: float | None = None,
+    attempts_limit: int | None = None,
 ) -> Sequence[Parameters]:
+    """
+    Generate evaluation case parameters using the model.
+
+    By default cases are generated one by one, each generated case becomes an example
+    for the next one. Using more than one concurrent generation or a similarity threshold
+    switches to batched generation where candidates are generated concurrently and
+    near-duplicates are rejected until the requested count of distinct cases is reached.
+
+    Parameters
+    ----------
+    parameters : type[Parameters]
+        Type of generated case parameters.
+    count : int
+        Number of cases to generate.
+    examples : Iterable[Parameters]
+        Examples guiding the generation.
+    guidelines : str | None
+        Optional guidelines for the generation.
+    concurrent_generations : int
+        Maximum number of generation calls running concurrently, by default 1.
+    similarity_threshold : float | None
+        Cosine similarity at or above which a candidate is rejected as a duplicate of an
+        accepted case or example. Requires ``TextEmbedding`` in the context scope.
+    attempts_limit : int | None
+        Maximum number of generated candidates in batched generation, by default three
+        times the requested count.
+
+    Returns
+    -------
+    Sequence[Parameters]
+        Generated case parameters, fewer than requested when attempts run out.
+    """
+    assert count >= 0  # nosec: B101
+    assert concurrent_generations > 0  # nosec: B101
+    assert similarity_threshold is None or 1 >= similarity_threshold > 0  # nosec: B101
+    if concurrent_generations > 1 or similarity_threshold is not None:
+        return await _generate_distinct(
+            parameters,
+            count=count,
+            examples=examples,
+            guidelines=guidelines,
+            concurrent_generations=concurrent_generations,
+            similarity_threshold=similarity_threshold,
+            attempts_limit=attempts_limit if attempts_limit is not None else count * 3,
+        )
+
     results: list[Parameters] = []
     example_pairs: list[tuple[str, Any]] = [(INPUT, example) for example in examples]
 
     for _ in range(0, count):
-        results.append(
-            await ModelGeneration.generate(
-                parameters,
-                instructions=INSTRUCTION.format(
-                    guidelines=f"\n<GUIDELINES>\n{guidelines}\n</GUIDELINES>\n"
-                    if guidelines
-                    else ""
-                ),
-                input=INPUT,
-                examples=example_pairs,
-                schema_injection="full",
-            )
-        )
+        results.append(await _generate(parameters, guidelines=guidelines, examples=example_pairs))
         # put each generated element into the examples for next generation
         # to prevent repetitions and encourage diversified results
         example_pairs.append((INPUT, results[-1]))
 
     return results
+
+
+async def _generate[Parameters: State](
+    parameters: type[Parameters],
+    /,
+    *,
+    guidelines: str | None,
+    examples: Sequence[tuple[str, Any]],
+) -> Parameters:
+    return await ModelGeneration.generate(
+        parameters,
+        instructions=INSTRUCTION.format(
+            guidelines=f"\n<GUIDELINES>\n{guidelines}\n</GUIDELINES>\n" if guidelines else ""
+        ),
+        input=INPUT,
+        examples=examples,
+        schema_injection="full",
+    )
+
+
+async def _generate_distinct[Parameters: State](
+    parameters: type[Parameters],
+    /,
+    *,
+    count: int,
+    examples: Iterable[Parameters],
+    guidelines: str | None,
+    concurrent_generations: int,
+    similarity_threshold: float | None,
+    attempts_limit: int,
+) -> Sequence[Parameters]:
+    results: list[Parameters] = []
+    example_pairs: list[tuple[str, Any]] = [(INPUT, example) for example in examples]
+    accepted_vectors: list[Sequence[float]] = []
+    if similarity_threshold is not None and example_pairs:
+        accepted_vectors.extend(
+            embedded.vector
+            for embedded in await TextEmbedding.embed_many(
+                [example.to_json() for _, example in example_pairs]
+            )
+        )
+
+    async def generate(
+        examples: Sequence[tuple[str, Any]],
+    ) -> Parameters:
+        return await _generate(
+            parameters,
+            guidelines=guidelines,
+            examples=examples,
+        )
+
+    attempts: int = 0
+    while len(results) < count and attempts < attempts_limit:
+        batch_size: int = min(count - len(results), attempts_limit - attempts)
+        attempts += batch_size
+        # all generations in the batch share examples accepted so far
+        batch_examples: Sequence[tuple[str, Any]] = tuple(example_pairs)
+        candidates: Sequence[Parameters] = await execute_concurrently(
+            generate,
+            [batch_examples] * batch_size,
+            concurrent_tasks=concurrent_generations,
+        )
+
+        if similarity_threshold is None:
+            results.extend(candidates)
+            example_pairs.extend((INPUT, candidate) for candidate in candidates)
+            continue
+
+        embedded_candidates: Sequence[Embedded[str]] = await TextEmbedding.embed_many(
+            [candidate.to_json() for candidate in candidates]
+        )
+        for candidate, embedded in zip(candidates, embedded_candidates, strict=True):
+            if vector_similarity_search(
+                query_vector=embedded.vector,
+                values_vectors=accepted_vectors,
+                limit=1,
+                score_threshold=similarity_threshold,
+            ):
+                continue  # near-duplicate of an accepted case
+
+            accepted_vectors.append(embedded.vector)
+            results.append(candidate)
+            example_pairs.append((INPUT, candidate))
+
+    if len(results) < count:
+        ctx.log_warning(
+            f"Generated {len(results)} distinct cases out of {count} requested"
+            f" within {attempts_limit} attempts"
+        )
+
+    return results
@@ -1,12 +1,14 @@
 import random
 from collections.abc import Mapping, Sequence
+from hashlib import sha256
 from typing import Any
 from uuid import UUID, uuid4
 
-from haiway import Meta, State, as_dict, ctx, execute_concurrently
+from haiway import Immutable, Meta, State, as_dict, ctx, execute_concurrently
 
 from draive.evaluation import (
     EvaluatorSuiteCase,
+    EvaluatorSuiteCaseResult,
     EvaluatorSuiteResult,
     PreparedEvaluatorSuite,
 )
@@ -53,6 +55,9 @@ async def refine_instructions[Parameters: State](
         performance_drop_threshold: Prune branches with score drop > this threshold
         quality_threshold: Stop if score reaches this threshold
         concurrent_nodes: How many nodes explored concurrently
+
+    Case results are memoized by normalized instructions content for the whole run,
+    candidates repeating already explored instructions are skipped.
     """
 
     assert rounds_limit > 0  # nosec: B101
@@ -70,11 +75,16 @@ async def refine_instructions[Parameters: State](
         f"performance_drop_threshold={performance_drop_threshold}"
     )
 
+    memo: _EvaluationMemo = _EvaluationMemo(
+        _results={},
+        _explored=set(),
+    )
     result: MultimodalContent = await Step.sequence(
         _tree_initialization_step(
             instructions=instructions,
             instructions_content=instructions_content,
             evaluator_suite=evaluator_suite,
+            memo=memo,
             sample_ratio=sample_ratio,
             performance_drop_threshold=performance_drop_threshold,
             guidelines=guidelines,
@@ -83,12 +93,14 @@ async def refine_instructions[Parameters: State](
         _tree_exploration_step(
             evaluator_suite=evaluator_suite,
             evaluator_cases=evaluator_cases,
+            memo=memo,
             rounds_limit=rounds_limit,
             quality_threshold=quality_threshold,
             concurrent_nodes=concurrent_nodes,
         ),
         _tree_finalization_step(
             evaluator_suite=evaluator_suite,
+            memo=memo,
             quality_threshold=quality_threshold,
             candidates_limit=candidates_limit,
         ),
@@ -169,6 +181,65 @@ class _RefinementState(State):
         return [node for node in self.nodes.values() if node.is_leaf and not node.pruned]
 
 
+def _instructions_key(
+    instructions: ModelInstructions,
+) -> str:
+    # normalize whitespace so formatting-only differences share results
+    return sha256(" ".join(instructions.split()).encode()).hexdigest()
+
+
+class _EvaluationMemo(Immutable):
+    _results: dict[tuple[str, str], tuple[str, EvaluatorSuiteCaseResult]]
+    _explored: set[str]
+
+    def claim(
+        self,
+        instructions: ModelInstructions,
+    ) -> bool:
+        key: str = _instructions_key(instructions)
+        if key in self._explored:
+            return False
+
+        self._explored.add(key)
+        return True
+
+    def record(
+        self,
+        instructions: ModelInstructions,
+        evaluation: EvaluatorSuiteResult,
+    ) -> None:
+        key: str = _instructions_key(instructions)
+        for case_result in evaluation.results:
+            self._results[(key, case_result.case_identifier)] = (evaluation.suite, case_result)
+
+    async def evaluate[Parameters: State](
+        self,
+        node: _RefinementTreeNode,
+        *,
+        evaluator_suite: PreparedEvaluatorSuite[Parameters],
+        cases: Sequence[str],
+    ) -> EvaluatorSuiteResult:
+        key: str = _instructions_key(node.instructions_content)
+        missing: Sequence[str] = [case for case in cases if (key, case) not in self._results]
+        if missing:
+            with ctx.updating(node.patched_instructions_repository):
+                self.record(
+                    node.instructions_content,
+                    await evaluator_suite(missing),
+                )
+
+        else:
+            ctx.log_info("...reusing memoized evaluation results...")
+
+        memoized: Sequence[tuple[str, EvaluatorSuiteCaseResult]] = [
+            self._results[(key, case)] for case in cases if (key, case) in self._results
+        ]
+        return EvaluatorSuiteResult(
+            suite=memoized[0][0] if memoized else "refinement",
+            results=tuple(case_result for _, case_result in memoized),
+        )
+
+
 def _select_focused_cases[Parameters: State](
     *,
     evaluation_result: EvaluatorSuiteResult,
@@ -224,6 +295,7 @@ def _tree_initialization_step[Parameters: State](
     instructions: Template,
     instructions_content: ModelInstructions | None,
     evaluator_suite: PreparedEvaluatorSuite[Parameters],
+    memo: _EvaluationMemo,
     sample_ratio: float,
     performance_drop_threshold: float,
     guidelines: str | None,
@@ -246,6 +318,9 @@ def _tree_initialization_step[Parameters: State](
         else:
             content = instructions_content
 
+        memo.claim(content)
+        memo.record(content, evaluation)
+
         # Create root node
         root_node = _RefinementTreeNode(
             identifier=uuid4(),
@@ -281,6 +356,7 @@ def _tree_exploration_step[Parameters: State](
     *,
     evaluator_suite: PreparedEvaluatorSuite[Parameters],
     evaluator_cases: Sequence[EvaluatorSuiteCase[Parameters]],
+    memo: _EvaluationMemo,
     rounds_limit: int,
     quality_threshold: float,
     concurrent_nodes: int,
@@ -301,6 +377,7 @@ def _tree_exploration_step[Parameters: State](
                 node=node,
                 evaluator_suite=evaluator_suite,
                 evaluator_cases=evaluator_cases,
+                memo=memo,
                 sample_ratio=refinement_state.sample_ratio,
                 performance_drop_threshold=refinement_state.performance_drop_threshold,
                 guidelines=refinement_state.guidelines,
@@ -314,10 +391,7 @@ def _tree_exploration_step[Parameters: State](
 
         updated_nodes: dict[UUID, _RefinementTreeNode] = as_dict(refinement_state.nodes)
         for nodes in node_updates:
-            updated_nodes = {
-                **updated_nodes,
-                **nodes,
-            }
+            updated_nodes.update(nodes)
 
         # Update the refinement state with the updated nodes
         refinement_state = refinement_state.updating(nodes=updated_nodes)
@@ -366,6 +440,7 @@ async def _explore_node[Parameters: State](
     node: _RefinementTreeNode,
     evaluator_suite: PreparedEvaluatorSuite[Parameters],
     evaluator_cases: Sequence[EvaluatorSuiteCase[Parameters]],
+    memo: _EvaluationMemo,
     sample_ratio: float,
     performance_drop_threshold: float,
     guidelines: str | None,
@@ -393,6 +468,10 @@ async def _explore_node[Parameters: State](
 
     children: dict[UUID, _RefinementTreeNode] = {}
     for strategy_name, refined_instructions in strategies:
+        if not memo.claim(refined_instructions):
+            ctx.log_info(f"Strategy '{strategy_name}' repeats explored instructions, skipping...")
+            continue
+
         # Create child node
         child_node = _RefinementTreeNode(
             identifier=uuid4(),
@@ -413,9 +492,11 @@ async def _explore_node[Parameters: State](
 
         # Evaluate with focused suite
         ctx.log_info(f"Evaluating strategy '{strategy_name}'...")
-        focused_evaluation: EvaluatorSuiteResult
-        with ctx.updating(child_node.patched_instructions_repository):
-            focused_evaluation = await evaluator_suite(focused_suite_cases)
+        focused_evaluation: EvaluatorSuiteResult = await memo.evaluate(
+            child_node,
+            evaluator_suite=evaluator_suite,
+            cases=focused_suite_cases,
+        )
 
         # Check for performance drop
         performance_ratio = (
@@ -628,6 +709,7 @@ async def _generate_refined_instructions(
 def _tree_finalization_step[Parameters: State](
     *,
     evaluator_suite: PreparedEvaluatorSuite[Parameters],
+    memo: _EvaluationMemo,
     quality_threshold: float,
     candidates_limit: int,
 ) -> Step:
@@ -656,6 +738,13 @@ def _tree_finalization_step[Parameters: State](
         best_instructions: ModelInstructions = refinement_state.root.instructions_content
         best_score: float = refinement_state.root.complete_evaluation_performance or 0
         best_node: _RefinementTreeNode = refinement_state.root
+        root_evaluation: EvaluatorSuiteResult = (
+            refinement_state.root.complete_evaluation or refinement_state.root.focused_evaluation
+        )
+        complete_cases: Sequence[str] = [
+            case_result.case_identifier for case_result in root_evaluation.results
+        ]
+        updated_nodes: dict[UUID, _RefinementTreeNode] = as_dict(refinement_state.nodes)
 
         for candidate_node in candidates:
             ctx.log_info(
@@ -663,21 +752,18 @@ def _tree_finalization_step[Parameters: State](
                 f"(strategy: {candidate_node.strategy}, depth: {candidate_node.depth})"
             )
 
-            complete_evaluation: EvaluatorSuiteResult
-            with ctx.updating(candidate_node.patched_instructions_repository):
-                complete_evaluation = await evaluator_suite()
+            # cases evaluated during focused evaluation are reused from the memo
+            complete_evaluation: EvaluatorSuiteResult = await memo.evaluate(
+                candidate_node,
+                evaluator_suite=evaluator_suite,
+                cases=complete_cases,
+            )
 
             # Update node with full eval score
             updated_node: _RefinementTreeNode = candidate_node.updating(
                 complete_evaluation=complete_evaluation
             )
-            refinement_state = refinement_state.updating(
-                nodes={
-                    **refinement_state.nodes,
-                    # update node in tree
-                    updated_node.identifier: updated_node,
-                },
-            )
+            updated_nodes[updated_node.identifier] = updated_node
 
             ctx.log_info(
                 f"Full evaluation score: {complete_evaluation.performance:.4f} "
@@ -689,8 +775,9 @@ def _tree_finalization_step[Parameters: State](
                 best_score = complete_evaluation.performance
                 best_node = updated_node
 
-        # Update state with best instructions
+        # Update state with evaluated nodes and best instructions
         refinement_state = refinement_state.updating(
+            nodes=updated_nodes,
             instructions=best_instructions,
         )
 
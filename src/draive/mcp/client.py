@@ -5,7 +5,7 @@ from collections.abc import AsyncGenerator, Callable, Collection, Coroutine, Map
 from contextlib import AbstractAsyncContextManager, asynccontextmanager
 from itertools import chain
 from types import TracebackType
-from typing import Any, Self, cast, final
+from typing import Any, Final, Self, cast, final
 from urllib.parse import ParseResult, urlparse, urlunparse
 from uuid import uuid4
 
@@ -561,7 +561,7 @@ async def _convert_content(  # noqa: C901, PLR0911
         case MCPImageContent() as image:
             return MultimodalContent.of(
                 ResourceContent.of(
-                    urlsafe_b64decode(image.data),
+                    _standard_base64(image.data),
                     mime_type=image.mimeType,
                 )
             )
@@ -569,7 +569,7 @@ async def _convert_content(  # noqa: C901, PLR0911
         case MCPAudioContent() as audio:
             return MultimodalContent.of(
                 ResourceContent.of(
-                    urlsafe_b64decode(audio.data),
+                    _standard_base64(audio.data),
                     mime_type=audio.mimeType,
                 )
             )
@@ -612,6 +612,18 @@ async def _convert_content(  # noqa: C901, PLR0911
             raise NotImplementedError("MCP resource links are not supported yet")
 
 
+_URLSAFE_BASE64_TRANSLATION: Final[Mapping[int, int]] = str.maketrans("-_", "+/")
+
+
+def _standard_base64(
+    data: str,
+    /,
+) -> str:
+    # MCP payloads may use the URL-safe alphabet and omit padding,
+    # resources keep standard padded base64 which is used without decoding
+    return data.translate(_URLSAFE_BASE64_TRANSLATION) + "=" * (-len(data) % 4)
+
+
 def _convert_tool(
     mcp_tool: MCPTool,
     /,
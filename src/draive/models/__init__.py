@@ -5,6 +5,7 @@ from draive.models.metrics import (
     record_model_invocation,
     record_usage_metrics,
 )
+from draive.models.tags import model_output_tags
 from draive.models.types import (
     ModelContext,
     ModelContextElement,
@@ -101,6 +102,7 @@ __all__ = (
     "ModelTools",
     "ModelToolsSelection",
     "RealtimeGenerativeModel",
+    "model_output_tags",
     "record_embedding_invocation",
     "record_embedding_metrics",
     "record_model_invocation",
@@ -1,13 +1,18 @@
+from asyncio import CancelledError, Queue, Task, sleep, timeout
+from time import monotonic
 from typing import Any, final, overload
 
-from haiway import State, statemethod
+from haiway import State, ctx, statemethod
+from haiway.context.tasks import ContextTaskGroup
 
 from draive.models.types import (
     ModelContext,
     ModelGenerating,
     ModelInstructions,
+    ModelOutputChunk,
     ModelOutputSelection,
     ModelOutputStream,
+    ModelRateLimit,
     ModelSessionOutputSelection,
     ModelSessionPreparing,
     ModelSessionScope,
@@ -91,6 +96,62 @@ class GenerativeModel(State):
         """
         super().__init__(_generating=generating)
 
+    def with_hedging(
+        self,
+        *,
+        delay: float,
+        fallback: GenerativeModel | ModelGenerating | None = None,
+    ) -> GenerativeModel:
+        """Return a model issuing a hedged request when the first chunk is late.
+
+        The primary request is started immediately. When it produces no output
+        within ``delay`` seconds, a second request is issued to ``fallback`` (or
+        duplicated to the same provider when no fallback is given). Whichever
+        request yields its first chunk first is streamed and the other one is
+        cancelled.
+
+        Parameters
+        ----------
+        delay : float
+            Time-to-first-chunk deadline in seconds after which the hedged request
+            is issued.
+        fallback : GenerativeModel | ModelGenerating | None, default=None
+            Alternative generation used for the hedged request. When omitted the
+            hedged request is sent to the same generation.
+
+        Returns
+        -------
+        GenerativeModel
+            Model wrapping the current generation with hedging applied.
+
+        Notes
+        -----
+        A failure of the primary request before producing any output issues the
+        hedged request immediately when a fallback is available. Without a
+        fallback only ``ModelRateLimit`` is retried, after the reported
+        ``retry_after`` delay. Failures after the first chunk was streamed are
+        propagated unchanged.
+        """
+        assert delay >= 0  # nosec: B101
+        hedging: ModelGenerating
+        if fallback is None:
+            hedging = self._generating
+
+        elif isinstance(fallback, GenerativeModel):
+            hedging = fallback._generating
+
+        else:
+            hedging = fallback
+
+        return GenerativeModel(
+            generating=_hedged_generating(
+                self._generating,
+                hedging=hedging,
+                delay=delay,
+                fallback=fallback is not None,
+            )
+        )
+
 
 @final
 class RealtimeGenerativeModel(State):
@@ -190,3 +251,132 @@ class RealtimeGenerativeModel(State):
             returning an asynchronous context manager when called.
         """
         super().__init__(_session_preparing=session_preparing)
+
+
+def _hedged_generating(  # noqa: C901, PLR0915
+    generating: ModelGenerating,
+    /,
+    *,
+    hedging: ModelGenerating,
+    delay: float,
+    fallback: bool,
+) -> ModelGenerating:
+    async def hedged(  # noqa: C901, PLR0912, PLR0915
+        *,
+        instructions: ModelInstructions,
+        tools: ModelTools,
+        context: ModelContext,
+        output: ModelOutputSelection,
+        **extra: Any,
+    ) -> ModelOutputStream:
+        async with ctx.scope("model.hedging"):
+            # events are tagged with attempt index, None marks finished attempt
+            events: Queue[tuple[int, ModelOutputChunk | Exception | None]] = Queue()
+
+            async def attempt(
+                index: int,
+                attempt_generating: ModelGenerating,
+                attempt_delay: float,
+            ) -> None:
+                try:
+                    if attempt_delay > 0:
+                        await sleep(attempt_delay)
+
+                    async for chunk in attempt_generating(
+                        instructions=instructions,
+                        tools=tools,
+                        context=context,
+                        output=output,
+                        **extra,
+                    ):
+                        events.put_nowait((index, chunk))
+
+                except CancelledError:
+                    raise
+
+                except Exception as exc:
+                    events.put_nowait((index, exc))
+
+                else:
+                    events.put_nowait((index, None))
+
+            async with ContextTaskGroup():  # local task group for more granular management
+                running: dict[int, Task[None]] = {0: ctx.spawn(attempt, 0, generating, 0.0)}
+                hedge_deadline: float | None = monotonic() + delay
+                primary_error: Exception | None = None
+                winner: int | None = None
+
+                def start_hedge(attempt_delay: float) -> None:
+                    nonlocal hedge_deadline
+                    hedge_deadline = None
+                    ctx.log_info("Issuing hedged model request")
+                    running[1] = ctx.spawn(attempt, 1, hedging, attempt_delay)
+
+                try:
+                    while True:
+                        event: tuple[int, ModelOutputChunk | Exception | None]
+                        if hedge_deadline is not None:
+                            try:
+                                async with timeout(max(hedge_deadline - monotonic(), 0.0)):
+                                    event = await events.get()
+
+                            except TimeoutError:
+                                start_hedge(0.0)
+                                continue
+
+                        else:
+                            event = await events.get()
+
+                        index, item = event
+                        if winner is None:
+                            if isinstance(item, Exception):
+                                running.pop(index, None)
+                                if index == 0:
+                                    primary_error = item
+
+                                if hedge_deadline is not None:
+                                    # primary failed before the deadline
+                                    if fallback:
+                                        start_hedge(0.0)
+
+                                    elif isinstance(item, ModelRateLimit):
+                                        start_hedge(item.retry_after)
+
+                                    else:
+                                        raise item
+
+                                elif not running:
+                                    raise primary_error or item
+
+                                continue  # wait for the remaining attempt
+
+                            # first chunk or completion decides the winner
+                            winner = index
+                            hedge_deadline = None
+                            for other, task in tuple(running.items()):
+                                if other != index:
+                                    task.cancel()
+                                    del running[other]
+
+                            if item is None:
+                                return  # finished without output
+
+                            yield item
+
+                        elif index != winner:
+                            continue  # late event from cancelled attempt
+
+                        elif item is None:
+                            return  # winning attempt finished
+
+                        elif isinstance(item, Exception):
+                            raise item
+
+                        else:
+                            yield item
+
+                finally:
+                    for task in running.values():
+                        task.cancel()
+
+    return hedged
@@ -0,0 +1,43 @@
+from collections.abc import AsyncIterator, Collection
+
+from draive.models.types import ModelOutputStream, ModelReasoningChunk, ModelToolRequest
+from draive.multimodal import MultimodalTagEvent, MultimodalTagsParser
+
+__all__ = ("model_output_tags",)
+
+
+async def model_output_tags(
+    stream: ModelOutputStream,
+    /,
+    *,
+    names: Collection[str] | None = None,
+) -> AsyncIterator[MultimodalTagEvent]:
+    """
+    Extract tags incrementally from a model output stream.
+
+    Content chunks are parsed as they arrive, allowing tagged sections to be
+    forwarded while the model is still generating. Reasoning chunks and tool
+    requests are skipped.
+
+    Parameters
+    ----------
+    stream : ModelOutputStream
+        Stream of chunks, e.g. produced by ``GenerativeModel.completion``.
+    names : Collection[str] | None, optional
+        Names of tags to report events for. When ``None``, all tags are reported.
+
+    Yields
+    ------
+    MultimodalTagEvent
+        Tag opened, content delta, and tag closed events in stream order.
+    """
+    parser = MultimodalTagsParser(names)
+    async for chunk in stream:
+        if isinstance(chunk, ModelReasoningChunk | ModelToolRequest):
+            continue
+
+        for event in parser.feed(chunk):
+            yield event
+
+    for event in parser.finish():
+        yield event
@@ -4,6 +4,11 @@ from draive.multimodal.content import (
     MultimodalContent,
     MultimodalContentPart,
     MultimodalTag,
+    MultimodalTagClosed,
+    MultimodalTagDelta,
+    MultimodalTagEvent,
+    MultimodalTagOpened,
+    MultimodalTagsParser,
 )
 from draive.multimodal.templates import (
     Template,
@@ -23,6 +28,11 @@ __all__ = (
     "MultimodalContent",
     "MultimodalContentPart",
     "MultimodalTag",
+    "MultimodalTagClosed",
+    "MultimodalTagDelta",
+    "MultimodalTagEvent",
+    "MultimodalTagOpened",
+    "MultimodalTagsParser",
     "Template",
     "TemplateDeclaration",
     "TemplateDefining",
@@ -1,6 +1,6 @@
-from collections.abc import Callable, Collection, Generator, Mapping, Sequence
+from collections.abc import Callable, Collection, Generator, Iterable, Mapping, Sequence
 from dataclasses import dataclass
-from typing import ClassVar, Literal, Self, cast, final, overload
+from typing import ClassVar, Final, Literal, Self, cast, final, overload
 
 from haiway import MISSING, BasicValue, Meta, MetaValues, Missing, State
 
@@ -13,6 +13,11 @@ __all__ = (
     "MultimodalContent",
     "MultimodalContentPart",
     "MultimodalTag",
+    "MultimodalTagClosed",
+    "MultimodalTagDelta",
+    "MultimodalTagEvent",
+    "MultimodalTagOpened",
+    "MultimodalTagsParser",
 )
 
 
@@ -425,7 +430,19 @@ class MultimodalContent(State, serializable=True):
         MultimodalTag | None
             The matching tag, or ``None`` when no tag satisfies the filter.
         """
-        tags = _collect_tags(self, name)
+        index: _TagsIndex = _tags_index(self)
+        if index.tags is not None:
+            return next(
+                (tag for tag in index.tags if name is None or tag.name == name),
+                None,
+            )
+
+        # stop scanning as soon as the first matching tag is known
+        tags = _collect_tags(
+            index.tokens,
+            name,
+            first=True,
+        )
         return tags[0] if tags else None
 
     def tags(
@@ -447,7 +464,7 @@ class MultimodalContent(State, serializable=True):
         Sequence[MultimodalTag]
             Parsed tags in order of appearance that satisfy the filter.
         """
-        return _collect_tags(self, name)
+        return _tags_index(self).tags_named(name)
 
     def replacing_tag(  # noqa: C901, PLR0912, PLR0915
         self,
@@ -485,7 +502,7 @@ class MultimodalContent(State, serializable=True):
             _parts_from_elements((replacement,))
         )
 
-        tokens = _tokenize_content(self.parts)
+        tokens = _tags_index(self).tokens
         result_parts: list[MultimodalContentPart] = []
         stack: list[_ActiveContext] = []
         replaced_count = 0
@@ -734,6 +751,297 @@ atomic parts, and raw ``str`` values that are normalized into
 """
 
 
+@final
+class MultimodalTagOpened(State, serializable=True):
+    """
+    Streaming event emitted when an opening tag was parsed.
+
+    Attributes
+    ----------
+    name : str
+        Name of the opened tag.
+    meta : Meta
+        Tag attributes expressed as structured metadata.
+    """
+
+    name: str
+    meta: Meta = Meta.empty
+
+
+@final
+class MultimodalTagDelta(State, serializable=True):
+    """
+    Streaming event carrying a content fragment of an open tag.
+
+    Attributes
+    ----------
+    name : str
+        Name of the innermost open tag the fragment belongs to.
+    content : MultimodalContentPart
+        Content fragment, raw markup of untracked nested tags is included as text.
+    """
+
+    name: str
+    content: MultimodalContentPart
+
+
+@final
+class MultimodalTagClosed(State, serializable=True):
+    """
+    Streaming event emitted when a tag was closed.
+
+    Attributes
+    ----------
+    tag : MultimodalTag
+        Complete tag, equal to the one extracted by ``MultimodalContent.tags``.
+    """
+
+    tag: MultimodalTag
+
+
+MultimodalTagEvent = MultimodalTagOpened | MultimodalTagDelta | MultimodalTagClosed
+
+
+class MultimodalTagsParser:
+    """
+    Incremental tag parser for streamed multimodal content.
+
+    Parts are fed as they arrive and are tokenized using the same rules as
+    ``MultimodalContent.tags``. Markup split across parts is held back until it
+    can be decided, while content of open tags is reported as soon as possible.
+    Deltas are attributed to the innermost open tag of interest; tags which are
+    never matched by a closing tag do not produce a closed event.
+    """
+
+    __slots__ = ("_names", "_pending_meta", "_pending_texts", "_stack")
+
+    def __init__(
+        self,
+        names: Collection[str] | None = None,
+    ) -> None:
+        """
+        Prepare a new parser.
+
+        Parameters
+        ----------
+        names : Collection[str] | None, optional
+            Names of tags to report events for. When ``None``, all tags are reported.
+        """
+        self._names: frozenset[str] | None = frozenset(names) if names is not None else None
+        self._pending_texts: list[str] = []
+        self._pending_meta: Meta | None = None
+        self._stack: list[_ActiveContext] = []
+
+    def feed(
+        self,
+        part: MultimodalContentPart,
+        /,
+    ) -> Sequence[MultimodalTagEvent]:
+        """
+        Consume the next content part.
+
+        Parameters
+        ----------
+        part : MultimodalContentPart
+            Next part of the streamed content.
+
+        Returns
+        -------
+        Sequence[MultimodalTagEvent]
+            Events resolved by the consumed part, in stream order.
+        """
+        events: list[MultimodalTagEvent] = []
+        if isinstance(part, TextContent):
+            if self._pending_meta is not None and self._pending_meta != part.meta:
+                self._drain(events, final=True)
+
+            self._pending_texts.append(part.text)
+            self._pending_meta = part.meta
+            self._drain(events, final=False)
+
+        else:
+            self._drain(events, final=True)
+            self._process(part, events)
+
+        return events
+
+    def finish(self) -> Sequence[MultimodalTagEvent]:
+        """
+        Resolve remaining buffered content at the end of the stream.
+
+        Returns
+        -------
+        Sequence[MultimodalTagEvent]
+            Events resolved by flushing buffered content.
+        """
+        events: list[MultimodalTagEvent] = []
+        self._drain(events, final=True)
+        return events
+
+    def _drain(
+        self,
+        events: list[MultimodalTagEvent],
+        *,
+        final: bool,
+    ) -> None:
+        meta: Meta | None = self._pending_meta
+        if meta is None:
+            return
+
+        text: str = "".join(self._pending_texts)
+        length: int = len(text)
+        pos: int = 0
+        while pos < length:
+            lt_pos: int = text.find("<", pos)
+            if lt_pos == -1:
+                self._process(_TextToken(text=text[pos:], meta=meta), events)
+                pos = length
+                break
+
+            if lt_pos > pos:
+                self._process(_TextToken(text=text[pos:lt_pos], meta=meta), events)
+
+            parsed = _parse_tag_at(text, lt_pos, meta)
+            if parsed is None:
+                if (
+                    not final
+                    and length - lt_pos <= _STREAMED_TAG_LIMIT
+                    and _tag_incomplete(text[lt_pos:], meta)
+                ):
+                    pos = lt_pos
+                    break  # wait for the rest of the markup
+
+                self._process(_TextToken(text="<", meta=meta), events)
+                pos = lt_pos + 1
+                continue
+
+            token, pos = parsed
+            self._process(token, events)
+
+        if pos < length:
+            self._pending_texts = [text[pos:]]
+
+        else:
+            self._pending_texts = []
+            self._pending_meta = None
+
+    def _tracked(
+        self,
+        name: str,
+    ) -> bool:
+        return self._names is None or name in self._names
+
+    def _delta(
+        self,
+        part: MultimodalContentPart,
+        events: list[MultimodalTagEvent],
+    ) -> None:
+        for context in reversed(self._stack):
+            if self._tracked(context.name):
+                events.append(MultimodalTagDelta(name=context.name, content=part))
+                return
+
+    def _process(  # noqa: C901, PLR0912
+        self,
+        token: Token,
+        events: list[MultimodalTagEvent],
+    ) -> None:
+        stack: list[_ActiveContext] = self._stack
+        if isinstance(token, _TextToken):
+            if token.text and stack:
+                part = TextContent(text=token.text, meta=token.meta)
+                stack[-1].parts.append(part)
+                self._delta(part, events)
+
+        elif isinstance(token, ResourceReference | ResourceContent | ArtifactContent):
+            if stack:
+                stack[-1].parts.append(token)
+                self._delta(token, events)
+
+        elif isinstance(token, _OpenToken):
+            if self._tracked(token.name):
+                events.append(MultimodalTagOpened(name=token.name, meta=token.attrs))
+
+            else:
+                self._delta(TextContent(text=token.raw, meta=token.meta), events)
+
+            stack.append(
+                _ActiveContext(
+                    name=token.name,
+                    attrs=token.attrs,
+                    opening_meta=token.meta,
+                    opening_raw=token.raw,
+                    start_index=0,
+                    parts=[],
+                )
+            )
+
+        elif isinstance(token, _SelfClosingToken):
+            if self._tracked(token.name):
+                events.append(MultimodalTagOpened(name=token.name, meta=token.attrs))
+                events.append(
+                    MultimodalTagClosed(
+                        tag=MultimodalTag(
+                            name=token.name,
+                            content=MultimodalContent.empty,
+                            meta=token.attrs,
+                        )
+                    )
+                )
+
+            if stack:
+                part = TextContent(text=token.raw, meta=token.meta)
+                stack[-1].parts.append(part)
+                if not self._tracked(token.name):
+                    self._delta(part, events)
+
+        elif isinstance(token, _CloseToken):
+            match_index: int | None = _find_matching_context(stack, token.name)
+            if match_index is None:
+                if stack:
+                    part = TextContent(text=token.raw, meta=token.meta)
+                    stack[-1].parts.append(part)
+                    self._delta(part, events)
+
+                return
+
+            while len(stack) - 1 > match_index:
+                unmatched = stack.pop()
+                parent_parts = stack[-1].parts
+                parent_parts.append(
+                    TextContent(text=unmatched.opening_raw, meta=unmatched.opening_meta)
+                )
+                parent_parts.extend(unmatched.parts)
+
+            context = stack.pop()
+            if stack:
+                parent_parts = stack[-1].parts
+                parent_parts.append(
+                    TextContent(text=context.opening_raw, meta=context.opening_meta)
+                )
+                parent_parts.extend(context.parts)
+                parent_parts.append(TextContent(text=token.raw, meta=token.meta))
+
+            if self._tracked(context.name):
+                events.append(
+                    MultimodalTagClosed(
+                        tag=MultimodalTag(
+                            name=context.name,
+                            content=MultimodalContent.empty
+                            if not context.parts
+                            else MultimodalContent.of(*context.parts),
+                            meta=context.attrs,
+                        )
+                    )
+                )
+
+            else:
+                self._delta(TextContent(text=token.raw, meta=token.meta), events)
+
+        else:  # pragma: no cover - future-proofing for new token types
+            raise TypeError(f"Unsupported token: {type(token)!r}")
+
+
 type Token = "_TextToken | _OpenToken | _CloseToken | _SelfClosingToken | MultimodalContentPart"
 
 
@@ -776,24 +1084,71 @@ class _ActiveContext:
     parts: list[MultimodalContentPart]
 
 
-def _collect_tags(  # noqa: C901, PLR0912
+@dataclass(slots=True)
+class _TagsIndex:
+    tokens: Sequence[Token]
+    tags: tuple[MultimodalTag, ...] | None = None
+    named: dict[str, tuple[MultimodalTag, ...]] | None = None
+
+    def tags_named(
+        self,
+        name: str | None,
+        /,
+    ) -> tuple[MultimodalTag, ...]:
+        if self.tags is None:
+            self.tags = _collect_tags(self.tokens, None)
+
+        if name is None:
+            return self.tags
+
+        if self.named is None:
+            self.named = {}
+
+        named: tuple[MultimodalTag, ...] | None = self.named.get(name)
+        if named is None:
+            named = tuple(tag for tag in self.tags if tag.name == name)
+            self.named[name] = named
+
+        return named
+
+
+def _tags_index(
     content: MultimodalContent,
+) -> _TagsIndex:
+    # parsed tags are cached lazily on the immutable content instance itself,
+    # the private attribute is not a State field and is never serialized
+    index: _TagsIndex | None = cast(_TagsIndex | None, getattr(content, "_tags_index", None))
+    if index is None:
+        index = _TagsIndex(tokens=_tokenize_content(content.parts))
+        object.__setattr__(content, "_tags_index", index)
+
+    return index
+
+
+def _collect_tags(  # noqa: C901, PLR0912
+    tokens: Iterable[Token],
     name: str | None,
+    *,
+    first: bool = False,
 ) -> tuple[MultimodalTag, ...]:
-    tokens = _tokenize_content(content.parts)
+    # top level content is not needed, only parts inside open tags are kept
     stack: list[_ActiveContext] = []
-    top_level: list[MultimodalContentPart] = []
     collected: list[tuple[int, MultimodalTag]] = []
 
-    for index, token in enumerate(tokens):
-        current_parts = _current_parts(stack, top_level)
+    def completed() -> bool:
+        # no tag open at the moment can start before already collected ones
+        return bool(collected) and not any(
+            name is None or context.name == name for context in stack
+        )
 
+    for index, token in enumerate(tokens):
         if isinstance(token, _TextToken):
-            if token.text:
-                current_parts.append(TextContent(text=token.text, meta=token.meta))
+            if token.text and stack:
+                stack[-1].parts.append(TextContent(text=token.text, meta=token.meta))
 
         elif isinstance(token, ResourceReference | ResourceContent | ArtifactContent):
-            current_parts.append(token)
+            if stack:
+                stack[-1].parts.append(token)
 
         elif isinstance(token, _OpenToken):
             stack.append(
@@ -808,115 +1163,123 @@ def _collect_tags(  # noqa: C901, PLR0912
             )
 
         elif isinstance(token, _SelfClosingToken):
-            tag = MultimodalTag(
-                name=token.name,
-                content=MultimodalContent.empty,
-                meta=token.attrs,
-            )
-            if name is None or tag.name == name:
-                collected.append((index, tag))
+            if name is None or token.name == name:
+                collected.append(
+                    (
+                        index,
+                        MultimodalTag(
+                            name=token.name,
+                            content=MultimodalContent.empty,
+                            meta=token.attrs,
+                        ),
+                    )
+                )
+                if first and completed():
+                    break
 
-            current_parts.append(TextContent(text=token.raw, meta=token.meta))
+            if stack:
+                stack[-1].parts.append(TextContent(text=token.raw, meta=token.meta))
 
         elif isinstance(token, _CloseToken):
-            if not stack:
-                current_parts.append(TextContent(text=token.raw, meta=token.meta))
-                continue
-
-            match_index = _find_matching_context(stack, token.name)
+            match_index: int | None = _find_matching_context(stack, token.name)
             if match_index is None:
-                current_parts.append(TextContent(text=token.raw, meta=token.meta))
+                if stack:
+                    stack[-1].parts.append(TextContent(text=token.raw, meta=token.meta))
+
                 continue
 
             while len(stack) - 1 > match_index:
                 unmatched = stack.pop()
-                parent_parts = _current_parts(stack, top_level)
+                parent_parts = stack[-1].parts
                 parent_parts.append(
                     TextContent(text=unmatched.opening_raw, meta=unmatched.opening_meta)
                 )
                 parent_parts.extend(unmatched.parts)
 
             context = stack.pop()
-            tag_content = (
-                MultimodalContent.empty
-                if not context.parts
-                else MultimodalContent.of(*context.parts)
-            )
-            tag = MultimodalTag(name=context.name, content=tag_content, meta=context.attrs)
+            if name is None or context.name == name:
+                collected.append(
+                    (
+                        context.start_index,
+                        MultimodalTag(
+                            name=context.name,
+                            content=MultimodalContent.empty
+                            if not context.parts
+                            else MultimodalContent.of(*context.parts),
+                            meta=context.attrs,
+                        ),
+                    )
+                )
 
-            if name is None or tag.name == name:
-                collected.append((context.start_index, tag))
+            if stack:
+                parent_parts = stack[-1].parts
+                parent_parts.append(
+                    TextContent(text=context.opening_raw, meta=context.opening_meta)
+                )
+                parent_parts.extend(context.parts)
+                parent_parts.append(TextContent(text=token.raw, meta=token.meta))
 
-            parent_parts = _current_parts(stack, top_level)
-            parent_parts.append(TextContent(text=context.opening_raw, meta=context.opening_meta))
-            parent_parts.extend(context.parts)
-            parent_parts.append(TextContent(text=token.raw, meta=token.meta))
+            if first and completed():
+                break
 
         else:  # pragma: no cover - future-proofing for new token types
             raise TypeError(f"Unsupported token: {type(token)!r}")
 
-    while stack:
-        context = stack.pop()
-        target_parts = _current_parts(stack, top_level)
-        target_parts.append(TextContent(text=context.opening_raw, meta=context.opening_meta))
-        target_parts.extend(context.parts)
-
     collected.sort(key=lambda item: item[0])
+    if first:
+        return tuple(tag for _, tag in collected[:1])
+
     return tuple(tag for _, tag in collected)
 
 
 def _tokenize_content(
     parts: Sequence[MultimodalContentPart],
 ) -> list[Token]:
-    tokens: list[Token] = []
-    pending_text: str | None = None
-    pending_meta: Meta | None = None
+    return list(_iter_tokens(parts))
 
-    def flush_pending() -> None:
-        nonlocal pending_text, pending_meta
-        if pending_text is None or pending_meta is None or not pending_text:
-            pending_text = None
-            pending_meta = None
-            return
 
-        tokens.extend(_tokenize_text(pending_text, pending_meta))
-        pending_text = None
-        pending_meta = None
+def _iter_tokens(
+    parts: Sequence[MultimodalContentPart],
+) -> Generator[Token]:
+    pending_texts: list[str] = []
+    pending_meta: Meta | None = None
 
     for part in parts:
         if isinstance(part, TextContent):
             if pending_meta is None:
-                pending_text = part.text
+                pending_texts = [part.text]
                 pending_meta = part.meta
 
             elif pending_meta == part.meta:
-                if pending_text is None:
-                    pending_text = part.text
-                else:
-                    pending_text = f"{pending_text}{part.text}"
+                pending_texts.append(part.text)
 
             else:
-                flush_pending()
-                pending_text = part.text
+                yield from _tokenize_text("".join(pending_texts), pending_meta)
+                pending_texts = [part.text]
                 pending_meta = part.meta
 
         else:
-            flush_pending()
-            tokens.append(part)
+            if pending_meta is not None:
+                yield from _tokenize_text("".join(pending_texts), pending_meta)
+                pending_texts = []
+                pending_meta = None
+
+            yield part
 
-    flush_pending()
-    return tokens
+    if pending_meta is not None:
+        yield from _tokenize_text("".join(pending_texts), pending_meta)
 
 
 def _tokenize_text(
     text: str,
     meta: Meta,
-) -> list[Token]:
+) -> Generator[Token]:
     if "<" not in text:
-        return [_TextToken(text=text, meta=meta)] if text else []
+        if text:
+            yield _TextToken(text=text, meta=meta)
+
+        return
 
-    tokens: list[Token] = []
-    append = tokens.append
     length = len(text)
     pos = 0
 
@@ -924,23 +1287,46 @@ def _tokenize_text(
         lt_pos = text.find("<", pos)
         if lt_pos == -1:
             if pos < length:
-                append(_TextToken(text=text[pos:], meta=meta))
+                yield _TextToken(text=text[pos:], meta=meta)
             break
 
         if lt_pos > pos:
-            append(_TextToken(text=text[pos:lt_pos], meta=meta))
+            yield _TextToken(text=text[pos:lt_pos], meta=meta)
 
         parsed = _parse_tag_at(text, lt_pos, meta)
         if parsed is None:
-            append(_TextToken(text="<", meta=meta))
+            yield _TextToken(text="<", meta=meta)
             pos = lt_pos + 1
             continue
 
         token, new_pos = parsed
-        append(token)
+        yield token
         pos = new_pos
 
-    return tokens
+
+# streamed markup longer than that is not awaited and treated as plain text
+_STREAMED_TAG_LIMIT: Final[int] = 4096
+# minimal suffixes completing any well-formed markup prefix
+_TAG_COMPLETIONS: Final[tuple[str, ...]] = (
+    ">",
+    "/>",
+    "a>",
+    '">',
+    "'>",
+    '"">',
+    "''>",
+    '="">',
+)
+
+
+def _tag_incomplete(
+    text: str,
+    meta: Meta,
+) -> bool:
+    # text starts with "<" which could not be parsed, check if it is a prefix of valid markup
+    return any(
+        _parse_tag_at(text + completion, 0, meta) is not None for completion in _TAG_COMPLETIONS
+    )
 
 
 def _parse_tag_at(  # noqa: C901, PLR0911, PLR0912
@@ -1209,116 +1595,85 @@ def _formatted_tag_attribute_value(
     return str(value)
 
 
-def _parts_from_elements(  # noqa: C901, PLR0912, PLR0915
+def _parts_from_elements(  # noqa: C901
     elements: Collection[Multimodal],
     /,
 ) -> Generator[MultimodalContentPart]:
-    last_text: TextContent | None = None
-    for element in elements:
-        if isinstance(element, str):
-            if last_text is None:
-                last_text = TextContent(
-                    text=element,
-                    meta=Meta.empty,
-                )
+    # adjacent text with equal meta is collected into runs and joined once,
+    # keeping normalization linear for long sequences of streamed text deltas
+    run_texts: list[str] = []
+    run_meta: Meta = Meta.empty
+    run_first: TextContent | None = None
+
+    def flush() -> TextContent | None:
+        if run_first is None:
+            return None
 
-            elif not last_text.meta:
-                last_text = TextContent(
-                    text=last_text.text + element,
-                    meta=Meta.empty,
-                )
+        if len(run_texts) == 1:
+            return run_first  # reuse single element as is
 
-            else:
-                yield last_text
-                last_text = TextContent(
-                    text=element,
-                    meta=Meta.empty,
-                )
+        return TextContent(
+            text="".join(run_texts),
+            meta=run_meta,
+        )
 
-        elif isinstance(element, TextContent):
-            if last_text is None:
-                last_text = element
+    parts: Collection[MultimodalContentPart] | Generator[MultimodalContentPart]
+    if all(isinstance(element, TextContent) for element in elements):
+        parts = cast(Collection[TextContent], elements)  # fast path for text only
 
-            elif last_text.meta == element.meta:
-                # Preserve metadata when merging text parts with identical meta
-                last_text = TextContent(
-                    text=last_text.text + element.text,
-                    meta=last_text.meta,
-                )
+    else:
+        parts = _flat_parts(elements)
 
-            else:
-                yield last_text
-                last_text = element
+    for part in parts:
+        if isinstance(part, TextContent):
+            if run_first is None:
+                run_first = part
+                run_meta = part.meta
+                run_texts = [part.text]
 
-        elif isinstance(element, MultimodalContent):
-            for part in element.parts:
-                if isinstance(part, TextContent):
-                    if last_text is None:
-                        last_text = part
-
-                    elif last_text.meta == part.meta:
-                        # Preserve metadata when merging text parts with identical meta
-                        last_text = TextContent(
-                            text=last_text.text + part.text,
-                            meta=last_text.meta,
-                        )
+            elif run_meta == part.meta:
+                run_texts.append(part.text)
 
-                    else:
-                        yield last_text
-                        last_text = part
+            else:
+                if (text := flush()) is not None:
+                    yield text
 
-                else:
-                    assert isinstance(  # nosec: B101
-                        part,
-                        ResourceReference | ResourceContent | ArtifactContent,
-                    )
+                run_first = part
+                run_meta = part.meta
+                run_texts = [part.text]
 
-                    if last_text is not None:
-                        yield last_text
-                        last_text = None
+        else:
+            if (text := flush()) is not None:
+                yield text
+                run_first = None
+                run_texts = []
 
-                    yield part
+            yield part
 
-        elif isinstance(element, MultimodalTag):
-            for part in element.parts():
-                if isinstance(part, TextContent):
-                    if last_text is None:
-                        last_text = part
-
-                    elif last_text.meta == part.meta:
-                        # Preserve metadata when merging text parts with identical meta
-                        last_text = TextContent(
-                            text=last_text.text + part.text,
-                            meta=last_text.meta,
-                        )
+    if (text := flush()) is not None:
+        yield text
 
-                    else:
-                        yield last_text
-                        last_text = part
 
-                else:
-                    assert isinstance(  # nosec: B101
-                        part,
-                        ResourceReference | ResourceContent | ArtifactContent,
-                    )
+def _flat_parts(
+    elements: Collection[Multimodal],
+    /,
+) -> Generator[MultimodalContentPart]:
+    for element in elements:
+        if isinstance(element, str):
+            yield TextContent(
+                text=element,
+                meta=Meta.empty,
+            )
 
-                    if last_text is not None:
-                        yield last_text
-                        last_text = None
+        elif isinstance(element, MultimodalContent):
+            yield from element.parts
 
-                    yield part
+        elif isinstance(element, MultimodalTag):
+            yield from element.parts()
 
         else:
             assert isinstance(  # nosec: B101
                 element,
-                ResourceReference | ResourceContent | ArtifactContent,
+                TextContent | ResourceReference | ResourceContent | ArtifactContent,
             )
-
-            if last_text is not None:
-                yield last_text
-                last_text = None
-
             yield element
-
-    if last_text is not None:
-        yield last_text
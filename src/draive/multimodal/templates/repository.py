@@ -1,16 +1,20 @@
 import json
+import os
+import sys
+from asyncio import Lock
+from collections import OrderedDict
 from collections.abc import Mapping, MutableMapping, Sequence
 from pathlib import Path
-from typing import Any, Self, cast, final, overload
+from time import monotonic
+from typing import Any, Final, Self, cast, final, overload
 
 from haiway import (
-    File,
-    Files,
     Immutable,
     Meta,
     Paginated,
     Pagination,
     State,
+    asynchronous,
     ctx,
     statemethod,
 )
@@ -26,10 +30,14 @@ from draive.multimodal.templates.types import (
     TemplateMissing,
 )
 from draive.multimodal.templates.variables import (
+    CompiledTemplate,
+    compile_template,
     parse_template_variables,
-    resolve_multimodal_template,
-    resolve_text_template,
 )
+from draive.utils.files import write_atomically
+
+if sys.platform != "win32":
+    import fcntl
 
 __all__ = ("TemplatesRepository",)
 
@@ -64,6 +72,60 @@ async def _noop_defining(
     pass
 
 
+class _CompiledTemplates(Immutable):
+    _limit: int
+    _expiration: float | None
+    _entries: OrderedDict[tuple[str, Meta], tuple[CompiledTemplate, float | None]]
+
+    def get(
+        self,
+        identifier: str,
+        /,
+        *,
+        meta: Meta,
+    ) -> CompiledTemplate | None:
+        key: tuple[str, Meta] = (identifier, meta)
+        entry: tuple[CompiledTemplate, float | None] | None = self._entries.get(key)
+        if entry is None:
+            return None
+
+        template, deadline = entry
+        if deadline is not None and deadline < monotonic():
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return template
+
+    def put(
+        self,
+        identifier: str,
+        /,
+        *,
+        meta: Meta,
+        template: CompiledTemplate,
+    ) -> None:
+        if self._limit <= 0:
+            return  # caching disabled
+
+        key: tuple[str, Meta] = (identifier, meta)
+        self._entries[key] = (
+            template,
+            None if self._expiration is None else monotonic() + self._expiration,
+        )
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._limit:
+            self._entries.popitem(last=False)
+
+    def invalidate(
+        self,
+        identifier: str,
+        /,
+    ) -> None:
+        for key in [key for key in self._entries if key[0] == identifier]:
+            del self._entries[key]
+
+
 @final
 class TemplatesRepository(State):
     """Template storage and resolution backend.
@@ -117,14 +179,23 @@ class TemplatesRepository(State):
     def file(
         cls,
         path: Path | str,
+        *,
+        cache_limit: int = 64,
+        cache_expiration: float | None = 5.0,
     ) -> Self:
-        """Create a repository using a JSON file for persistence.
+        """Create a repository using a JSON lines journal file for persistence.
 
         Parameters
         ----------
         path : Path | str
             Filesystem path used to load and persist template declarations and
-            their contents.
+            their contents. Definitions are appended to the file and changes
+            made by other processes are picked up on access.
+        cache_limit : int, default=64
+            Maximum number of compiled templates kept in memory.
+        cache_expiration : float | None, default=5.0
+            Lifetime in seconds of compiled templates, bounding how long changes
+            made by other processes stay unnoticed.
 
         Returns
         -------
@@ -138,6 +209,8 @@ class TemplatesRepository(State):
             loading=file_storage.loading,
             defining=file_storage.defining,
             meta=Meta({"source": str(path)}),
+            cache_limit=cache_limit,
+            cache_expiration=cache_expiration,
         )
 
     @overload
@@ -241,40 +314,30 @@ class TemplatesRepository(State):
             If neither repository content nor ``default`` is available.
         """
         if isinstance(content, str):
-            return resolve_multimodal_template(
-                content,
+            return compile_template(content).resolve_multimodal(
                 arguments=await self._resolve_arguments(
                     arguments,
                     **extra,
                 ),
             )
 
-        loaded: str | None = await self._loading(
-            content.identifier,
-            meta=content.meta,
+        compiled: CompiledTemplate | None = await self._compiled(
+            content,
             **extra,
         )
 
-        if loaded is not None:
-            return resolve_multimodal_template(
-                loaded,
-                arguments=await self._resolve_arguments(
-                    {**content.arguments, **arguments} if arguments else content.arguments,
-                    **extra,
-                ),
-            )
+        if compiled is None:
+            if default is None:
+                raise TemplateMissing(identifier=content.identifier)
 
-        elif default is not None:
-            return resolve_multimodal_template(
-                default,
-                arguments=await self._resolve_arguments(
-                    {**content.arguments, **arguments} if arguments else content.arguments,
-                    **extra,
-                ),
-            )
+            compiled = compile_template(default)
 
-        else:
-            raise TemplateMissing(identifier=content.identifier)
+        return compiled.resolve_multimodal(
+            arguments=await self._resolve_arguments(
+                {**content.arguments, **arguments} if arguments else content.arguments,
+                **extra,
+            ),
+        )
 
     @overload
     @classmethod
@@ -336,40 +399,30 @@ class TemplatesRepository(State):
             If neither repository content nor ``default`` is available.
         """
         if isinstance(content, str):
-            return resolve_text_template(
-                content,
+            return compile_template(content).resolve_text(
                 arguments=await self._resolve_arguments(
                     arguments,
                     **extra,
                 ),
             )
 
-        loaded: str | None = await self._loading(
-            content.identifier,
-            meta=content.meta,
+        compiled: CompiledTemplate | None = await self._compiled(
+            content,
             **extra,
         )
 
-        if loaded is not None:
-            return resolve_text_template(
-                loaded,
-                arguments=await self._resolve_arguments(
-                    {**content.arguments, **arguments} if arguments else content.arguments,
-                    **extra,
-                ),
-            )
+        if compiled is None:
+            if default is None:
+                raise TemplateMissing(identifier=content.identifier)
 
-        elif default is not None:
-            return resolve_text_template(
-                default,
-                arguments=await self._resolve_arguments(
-                    {**content.arguments, **arguments} if arguments else content.arguments,
-                    **extra,
-                ),
-            )
+            compiled = compile_template(default)
 
-        else:
-            raise TemplateMissing(identifier=content.identifier)
+        return compiled.resolve_text(
+            arguments=await self._resolve_arguments(
+                {**content.arguments, **arguments} if arguments else content.arguments,
+                **extra,
+            ),
+        )
 
     @statemethod
     async def load(
@@ -397,16 +450,15 @@ class TemplatesRepository(State):
         TemplateMissing
             If the template content is not available.
         """
-        loaded: str | None = await self._loading(
-            template.identifier,
-            meta=template.meta,
+        compiled: CompiledTemplate | None = await self._compiled(
+            template,
             **extra,
         )
 
-        if loaded is None:
+        if compiled is None:
             raise TemplateMissing(identifier=template.identifier)
 
-        return loaded
+        return compiled.source
 
     @overload
     @classmethod
@@ -479,10 +531,12 @@ class TemplatesRepository(State):
             meta=template.meta,
             **extra,
         )
+        self._templates.invalidate(template.identifier)
 
     _listing: TemplateListing
     _loading: TemplateLoading
     _defining: TemplateDefining
+    _templates: _CompiledTemplates
     meta: Meta
 
     def __init__(
@@ -491,14 +545,78 @@ class TemplatesRepository(State):
         loading: TemplateLoading = _none_loading,
         defining: TemplateDefining = _noop_defining,
         meta: Meta = Meta.empty,
+        cache_limit: int = 0,
+        cache_expiration: float | None = None,
     ) -> None:
+        """Initialize the repository with storage callables.
+
+        Parameters
+        ----------
+        listing : TemplateListing, optional
+            Callable listing template declarations.
+        loading : TemplateLoading, optional
+            Callable loading template bodies.
+        defining : TemplateDefining, optional
+            Callable persisting template declarations and bodies.
+        meta : Meta, optional
+            Repository metadata.
+        cache_limit : int, default=0
+            Maximum number of compiled templates kept in memory, caching is
+            disabled by default so each resolve reloads from storage. Entries
+            are keyed by template identifier and meta, so revisions carried in
+            meta are cached separately.
+        cache_expiration : float | None, optional
+            Lifetime in seconds of compiled templates, entries are kept until
+            evicted or invalidated by ``define`` when omitted.
+        """
+        assert cache_limit >= 0  # nosec: B101
+        assert cache_expiration is None or cache_expiration > 0  # nosec: B101
         super().__init__(
             _listing=listing,
             _loading=loading,
             _defining=defining,
+            _templates=_CompiledTemplates(
+                _limit=cache_limit,
+                _expiration=cache_expiration,
+                _entries=OrderedDict(),
+            ),
             meta=meta,
         )
 
+    async def _compiled(
+        self,
+        template: Template,
+        /,
+        **extra: Any,
+    ) -> CompiledTemplate | None:
+        # extra arguments may alter loading, skip caching for such calls
+        if not extra:
+            cached: CompiledTemplate | None = self._templates.get(
+                template.identifier,
+                meta=template.meta,
+            )
+            if cached is not None:
+                return cached
+
+        loaded: str | None = await self._loading(
+            template.identifier,
+            meta=template.meta,
+            **extra,
+        )
+
+        if loaded is None:
+            return None
+
+        compiled: CompiledTemplate = CompiledTemplate.of(loaded)
+        if not extra:
+            self._templates.put(
+                template.identifier,
+                meta=template.meta,
+                template=compiled,
+            )
+
+        return compiled
+
     async def _resolve_arguments(
         self,
         arguments: Mapping[str, Template | Multimodal] | None,
@@ -611,35 +729,73 @@ class VolatileStorage(Immutable):
         self._contents[identifier] = content
 
 
+# journal is compacted when it holds at least this many records
+# and more than twice the number of live templates
+_JOURNAL_COMPACTION_THRESHOLD: Final[int] = 64
+
+
+class _JournalPosition(Immutable):
+    file_id: tuple[int, int]
+    modified: int
+    offset: int
+    records: int
+    legacy: bool
+
+
+class _JournalChanges(Immutable):
+    position: _JournalPosition
+    records: Sequence[bytes]
+    reset: bool
+
+
 class FileStorage(Immutable):
+    """Append-only JSON lines journal of template definitions.
+
+    Each ``define`` appends a single record, later records override earlier
+    ones for the same identifier. The journal is replayed lazily on first
+    access and afterwards only appended records are read when the file changes,
+    which includes updates from other processes. Writes are serialized across
+    processes with an advisory lock on a sidecar ``.lock`` file, where
+    supported. Journals holding mostly overridden records are compacted into
+    a fresh file. Files in the legacy
+    JSON array format are read as is and converted on the next write.
+    """
+
     _path: Path
-    _declarations: MutableMapping[str, TemplateDeclaration] | None
-    _contents: MutableMapping[str, str] | None
+    _lock: Lock
+    _declarations: MutableMapping[str, TemplateDeclaration]
+    _contents: MutableMapping[str, str]
+    _position: _JournalPosition | None
 
     def __init__(
         self,
         path: Path | str,
     ) -> None:
-        if isinstance(path, str):
-            object.__setattr__(
-                self,
-                "_path",
-                Path(path),
-            )
-
-        else:
-            object.__setattr__(
-                self,
-                "_path",
-                path,
-            )
-
+        object.__setattr__(
+            self,
+            "_path",
+            Path(path) if isinstance(path, str) else path,
+        )
+        object.__setattr__(
+            self,
+            "_lock",
+            Lock(),
+        )
         object.__setattr__(
             self,
             "_declarations",
+            {},
+        )
+        object.__setattr__(
+            self,
+            "_contents",
+            {},
+        )
+        object.__setattr__(
+            self,
+            "_position",
             None,
         )
-        object.__setattr__(self, "_contents", None)
 
     async def listing(
         self,
@@ -647,10 +803,7 @@ class FileStorage(Immutable):
         **extra: Any,
     ) -> Paginated[TemplateDeclaration]:
         _ = extra
-        if self._declarations is None:
-            await self._load_file()
-
-        assert self._declarations is not None  # nosec: B101
+        await self._refresh()
         return _paginate_declarations(
             tuple(self._declarations.values()),
             pagination=pagination,
@@ -663,10 +816,7 @@ class FileStorage(Immutable):
         meta: Meta,
         **extra: Any,
     ) -> str | None:
-        if self._contents is None:
-            await self._load_file()
-
-        assert self._contents is not None  # nosec: B101
+        await self._refresh()
         return self._contents.get(identifier)
 
     async def defining(
@@ -678,53 +828,111 @@ class FileStorage(Immutable):
         meta: Meta,
         **extra: Any,
     ) -> None:
-        if self._contents is None or self._declarations is None:
-            await self._load_file()
+        async with self._lock:
+            journal_lock: int = await _lock_journal(self._path)
+            try:
+                await self._define(
+                    _encode_journal_record(
+                        TemplateDeclaration(
+                            identifier=identifier,
+                            description=description,
+                            variables=variables,
+                            meta=meta,
+                        ),
+                        content=content,
+                    )
+                )
 
-        self._declarations[identifier] = TemplateDeclaration(  # pyright: ignore[reportOptionalSubscript]
-            identifier=identifier,
-            description=description,
-            variables=variables,
-            meta=meta,
+            finally:
+                await _unlock_journal(journal_lock)
+
+    async def _define(
+        self,
+        record: bytes,
+    ) -> None:
+        # refresh and write under the journal lock so compaction
+        # never drops records appended by other processes
+        await self._refresh()
+        assert self._position is not None  # nosec: B101
+        if self._position.legacy or (
+            self._position.records >= _JOURNAL_COMPACTION_THRESHOLD
+            and self._position.records >= 2 * len(self._contents)
+        ):
+            self._apply_record(record)
+            object.__setattr__(
+                self,
+                "_position",
+                await _compact_journal(
+                    self._path,
+                    records=[
+                        _encode_journal_record(
+                            declaration,
+                            content=self._contents[declaration.identifier],
+                        )
+                        for declaration in self._declarations.values()
+                    ],
+                ),
+            )
+
+        else:
+            await _append_journal(
+                self._path,
+                record=record,
+            )
+            # replay includes own record and any concurrently appended ones
+            await self._refresh()
+
+    async def _refresh(self) -> None:
+        changes: _JournalChanges | None = await _read_journal(
+            self._path,
+            position=self._position,
+        )
+        if changes is None:
+            return  # journal did not change
+
+        if changes.reset:
+            self._declarations.clear()
+            self._contents.clear()
+
+        if changes.position.legacy:
+            self._apply_legacy(b"".join(changes.records))
+
+        else:
+            for record in changes.records:
+                self._apply_record(record)
+
+        object.__setattr__(
+            self,
+            "_position",
+            changes.position,
         )
-        self._contents[identifier] = content  # pyright: ignore[reportOptionalSubscript]
-        await self._save_file()
 
-    async def _load_file(self) -> None:
-        file_contents: bytes
-        async with ctx.disposables(Files.access(self._path, create=True)):
-            file_contents = await File.read()
+    def _apply_record(
+        self,
+        record: bytes,
+    ) -> None:
+        if not record.strip():
+            return  # skip empty lines
 
-        if not file_contents.strip():
-            file_contents = b"[]"
+        try:
+            self._apply_element(json.loads(record))
+
+        except Exception as exc:
+            ctx.log_warning(
+                "Invalid templates file storage element, skipping...",
+                exception=exc,
+            )
 
-        declarations: MutableMapping[str, TemplateDeclaration] = {}
-        contents: MutableMapping[str, str] = {}
+    def _apply_legacy(
+        self,
+        data: bytes,
+    ) -> None:
         try:
-            match json.loads(file_contents):
+            match json.loads(data):
                 case [*elements]:
                     for element in elements:
                         try:
-                            match element:
-                                case {
-                                    "identifier": str() as identifier,
-                                    "description": str() | None as description,
-                                    "variables": {**variables},
-                                    "content": str() as content,
-                                    "meta": {**meta},
-                                }:
-                                    declarations[identifier] = TemplateDeclaration(
-                                        identifier=identifier,
-                                        variables=variables,
-                                        description=description,
-                                        meta=Meta.of(meta),
-                                    )
-                                    contents[identifier] = content
-
-                                case _:  # skip with warning
-                                    ctx.log_warning(
-                                        "Invalid templates file storage element, skipping..."
-                                    )
+                            self._apply_element(element)
 
                         except Exception as exc:
                             ctx.log_warning(
@@ -741,34 +949,188 @@ class FileStorage(Immutable):
                 exception=exc,
             )
 
-        object.__setattr__(
-            self,
-            "_declarations",
-            declarations,
+    def _apply_element(
+        self,
+        element: Any,
+    ) -> None:
+        match element:
+            case {
+                "identifier": str() as identifier,
+                "description": str() | None as description,
+                "variables": {**variables},
+                "content": str() as content,
+                "meta": {**meta},
+            }:
+                self._declarations[identifier] = TemplateDeclaration(
+                    identifier=identifier,
+                    variables=variables,
+                    description=description,
+                    meta=Meta.of(meta),
+                )
+                self._contents[identifier] = content
+
+            case _:  # skip with warning
+                ctx.log_warning("Invalid templates file storage element, skipping...")
+
+
+def _encode_journal_record(
+    declaration: TemplateDeclaration,
+    *,
+    content: str,
+) -> bytes:
+    return (
+        json.dumps(
+            {
+                "identifier": declaration.identifier,
+                "description": declaration.description,
+                "variables": declaration.variables,
+                "content": content,
+                "meta": declaration.meta,
+            }
+        ).encode()
+        + b"\n"
+    )
+
+
+@asynchronous
+def _read_journal(
+    path: Path,
+    *,
+    position: _JournalPosition | None,
+) -> _JournalChanges | None:
+    try:
+        status: os.stat_result = path.stat()
+
+    except FileNotFoundError:
+        if position is not None and position.offset == 0:
+            return None  # still missing
+
+        return _JournalChanges(
+            position=_JournalPosition(
+                file_id=(0, 0),
+                modified=0,
+                offset=0,
+                records=0,
+                legacy=False,
+            ),
+            records=(),
+            reset=True,
         )
 
-        object.__setattr__(
-            self,
-            "_contents",
-            contents,
+    file_id: tuple[int, int] = (status.st_dev, status.st_ino)
+    if (
+        position is not None
+        and position.file_id == file_id
+        and position.modified == status.st_mtime_ns
+        and position.offset == status.st_size
+    ):
+        return None  # nothing changed
+
+    # full replay when the file was replaced, truncated or not read yet
+    reset: bool = (
+        position is None
+        or position.file_id != file_id
+        or position.offset > status.st_size
+        or position.legacy
+    )
+    start: int = 0 if reset else position.offset  # pyright: ignore[reportOptionalMemberAccess]
+    with open(path, mode="rb") as file:
+        file.seek(start)
+        data: bytes = file.read()
+
+    if reset and data.lstrip().startswith(b"["):
+        return _JournalChanges(
+            position=_JournalPosition(
+                file_id=file_id,
+                modified=status.st_mtime_ns,
+                offset=start + len(data),
+                records=0,
+                legacy=True,
+            ),
+            records=(data,),
+            reset=True,
         )
 
-    async def _save_file(self) -> None:
-        if self._declarations is None or self._contents is None:
-            return  # nothing to save
-
-        file_contents: bytes = json.dumps(
-            [
-                {
-                    "identifier": declaration.identifier,
-                    "description": declaration.description,
-                    "variables": declaration.variables,
-                    "content": self._contents[declaration.identifier],
-                    "meta": declaration.meta,
-                }
-                for declaration in self._declarations.values()
-            ]
-        ).encode()
+    # leave trailing incomplete record for the next read unless it is complete
+    end: int = data.rfind(b"\n") + 1
+    if end < len(data):
+        try:
+            json.loads(data[end:])
+            end = len(data)
+
+        except ValueError:
+            pass  # record is still being written
+
+    records: Sequence[bytes] = data[:end].splitlines()
+    return _JournalChanges(
+        position=_JournalPosition(
+            file_id=file_id,
+            modified=status.st_mtime_ns,
+            offset=start + end,
+            records=(0 if reset else position.records) + len(records),  # pyright: ignore[reportOptionalMemberAccess]
+            legacy=False,
+        ),
+        records=records,
+        reset=reset,
+    )
+
+
+@asynchronous
+def _lock_journal(
+    path: Path,
+) -> int:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    descriptor: int = os.open(
+        path.with_name(f".{path.name}.lock"),
+        os.O_RDWR | os.O_CREAT,
+        0o644,
+    )
+    if sys.platform != "win32":
+        try:
+            fcntl.flock(descriptor, fcntl.LOCK_EX)
+
+        except BaseException:
+            os.close(descriptor)
+            raise
+
+    return descriptor
 
-        async with ctx.disposables(Files.access(self._path, create=True)):
-            await File.write(file_contents)
+
+@asynchronous
+def _unlock_journal(
+    descriptor: int,
+) -> None:
+    os.close(descriptor)  # closing releases the lock
+
+
+@asynchronous
+def _append_journal(
+    path: Path,
+    *,
+    record: bytes,
+) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, mode="ab+") as file:
+        if file.tell() > 0:
+            file.seek(-1, os.SEEK_END)
+            if file.read(1) != b"\n":
+                record = b"\n" + record  # terminate previous record
+
+        file.write(record)
+
+
+@asynchronous
+def _compact_journal(
+    path: Path,
+    *,
+    records: Sequence[bytes],
+) -> _JournalPosition:
+    write_atomically(path, b"".join(records))
+    status: os.stat_result = path.stat()
+    return _JournalPosition(
+        file_id=(status.st_dev, status.st_ino),
+        modified=status.st_mtime_ns,
+        offset=status.st_size,
+        records=len(records),
+        legacy=False,
+    )
@@ -1,6 +1,9 @@
 import re
 from collections.abc import Callable, Generator, Mapping, MutableSequence
-from typing import Final
+from functools import lru_cache
+from typing import Final, Self, final
+
+from haiway import Immutable
 
 from draive.multimodal.content import Multimodal, MultimodalContent
 
@@ -8,6 +11,8 @@ from draive.multimodal.content import Multimodal, MultimodalContent
 _VARIABLE_PATTERN: Final[re.Pattern[str]] = re.compile(r"{%([^\s%]+)%}")
 
 __all__ = (
+    "CompiledTemplate",
+    "compile_template",
     "parse_template_variables",
     "resolve_multimodal_template",
     "resolve_text_template",
@@ -21,38 +26,30 @@ def parse_template_variables(
         yield match.group(1)
 
 
-def resolve_text_template(
+def compile_template(
     template: str,
-    *,
-    arguments: Mapping[str, Multimodal],
-) -> str:
-    parts: MutableSequence[str] = []
-    append: Callable[[str], None] = parts.append
-    get_argument: Callable[[str], Multimodal | None] = arguments.get
-    cursor: int = 0
-
-    for match in _VARIABLE_PATTERN.finditer(template):
-        start, end = match.span()
-        if start > cursor:
-            append(template[cursor:start])
-
-        variable_name: str = match.group(1)
-        variable_value: Multimodal | None = get_argument(variable_name)
-        if variable_value is None:
-            raise KeyError(f"Missing template argument: {variable_name}")
-
-        if isinstance(variable_value, str):
-            append(variable_value)
+) -> CompiledTemplate:
+    """Compile template source, reusing recently compiled raw templates.
 
-        else:
-            append(variable_value.to_str())
+    Parameters
+    ----------
+    template : str
+        Raw template source.
 
-        cursor = end
+    Returns
+    -------
+    CompiledTemplate
+        Template split into literal segments and variable slots.
+    """
+    return _compile_cached(template)
 
-    if cursor < len(template):
-        append(template[cursor:])
 
-    return "".join(parts)
+def resolve_text_template(
+    template: str,
+    *,
+    arguments: Mapping[str, Multimodal],
+) -> str:
+    return compile_template(template).resolve_text(arguments=arguments)
 
 
 def resolve_multimodal_template(
@@ -60,25 +57,150 @@ def resolve_multimodal_template(
     *,
     arguments: Mapping[str, Multimodal],
 ) -> MultimodalContent:
-    parts: MutableSequence[Multimodal] = []
-    append: Callable[[Multimodal], None] = parts.append
-    get_argument: Callable[[str], Multimodal | None] = arguments.get
-    cursor: int = 0
+    return compile_template(template).resolve_multimodal(arguments=arguments)
+
+
+@final
+class CompiledTemplate(Immutable):
+    """Template source pre-split into literal segments and variable slots.
+
+    Literal segments interleave with variables, ``literals`` always holds one
+    element more than ``variables`` so that rendering does not need to scan the
+    source again.
+
+    Attributes
+    ----------
+    source : str
+        Raw template source.
+    literals : tuple[str, ...]
+        Literal text surrounding variable slots, possibly empty.
+    variables : tuple[str, ...]
+        Variable names in order of appearance.
+    """
+
+    @classmethod
+    def of(
+        cls,
+        template: str,
+    ) -> Self:
+        """Split the template source into literal segments and variable slots.
+
+        Parameters
+        ----------
+        template : str
+            Raw template source.
+
+        Returns
+        -------
+        Self
+            Compiled template.
+        """
+        literals: MutableSequence[str] = []
+        variables: MutableSequence[str] = []
+        cursor: int = 0
+        for match in _VARIABLE_PATTERN.finditer(template):
+            start, end = match.span()
+            literals.append(template[cursor:start])
+            variables.append(match.group(1))
+            cursor = end
+
+        literals.append(template[cursor:])
+
+        return cls(
+            source=template,
+            literals=tuple(literals),
+            variables=tuple(variables),
+        )
+
+    source: str
+    literals: tuple[str, ...]
+    variables: tuple[str, ...]
+
+    def resolve_text(
+        self,
+        *,
+        arguments: Mapping[str, Multimodal],
+    ) -> str:
+        """Render the template as text.
+
+        Parameters
+        ----------
+        arguments : Mapping[str, Multimodal]
+            Values used for variable slots.
+
+        Returns
+        -------
+        str
+            Rendered text.
+
+        Raises
+        ------
+        KeyError
+            If any of the variables is missing in ``arguments``.
+        """
+        if not self.variables:
+            return self.source
+
+        parts: MutableSequence[str] = [self.literals[0]]
+        append: Callable[[str], None] = parts.append
+        get_argument: Callable[[str], Multimodal | None] = arguments.get
+        for variable_name, literal in zip(self.variables, self.literals[1:], strict=True):
+            variable_value: Multimodal | None = get_argument(variable_name)
+            if variable_value is None:
+                raise KeyError(f"Missing template argument: {variable_name}")
+
+            if isinstance(variable_value, str):
+                append(variable_value)
+
+            else:
+                append(variable_value.to_str())
+
+            append(literal)
+
+        return "".join(parts)
+
+    def resolve_multimodal(
+        self,
+        *,
+        arguments: Mapping[str, Multimodal],
+    ) -> MultimodalContent:
+        """Render the template as multimodal content.
+
+        Parameters
+        ----------
+        arguments : Mapping[str, Multimodal]
+            Values used for variable slots.
+
+        Returns
+        -------
+        MultimodalContent
+            Rendered content preserving multimodal argument values.
+
+        Raises
+        ------
+        KeyError
+            If any of the variables is missing in ``arguments``.
+        """
+        parts: MutableSequence[Multimodal] = []
+        append: Callable[[Multimodal], None] = parts.append
+        get_argument: Callable[[str], Multimodal | None] = arguments.get
+        if self.literals[0]:
+            append(self.literals[0])
+
+        for variable_name, literal in zip(self.variables, self.literals[1:], strict=True):
+            variable_value: Multimodal | None = get_argument(variable_name)
+            if variable_value is None:
+                raise KeyError(f"Missing template argument: {variable_name}")
 
-    for match in _VARIABLE_PATTERN.finditer(template):
-        start, end = match.span()
-        if start > cursor:
-            append(template[cursor:start])
-
-        variable_name: str = match.group(1)
-        variable_value: Multimodal | None = get_argument(variable_name)
-        if variable_value is None:
-            raise KeyError(f"Missing template argument: {variable_name}")
+            append(variable_value)
+            if literal:
+                append(literal)
 
-        append(variable_value)
-        cursor = end
+        return MultimodalContent.of(*parts)
 
-    if cursor < len(template):
-        append(template[cursor:])
 
-    return MultimodalContent.of(*parts)
+@lru_cache(maxsize=256)
+def _compile_cached(
+    template: str,
+) -> CompiledTemplate:
+    return CompiledTemplate.of(template)
@@ -247,7 +247,7 @@ def _message_to_blocks(  # noqa: C901
     if getattr(message, "images", None):
         for img in message.images or []:
             if isinstance(img, bytes | bytearray):
-                accumulator.append(ResourceContent.of(bytes(img), mime_type="image/*"))
+                accumulator.append(ResourceContent.of(img, mime_type="image/*"))
             elif isinstance(img, str):
                 accumulator.append(ResourceReference.of(img, mime_type="image/*"))
 
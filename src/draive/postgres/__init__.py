@@ -8,7 +8,9 @@ from haiway.postgres import (
     PostgresValue,
 )
 
+from draive.postgres.evaluation_cache import PostgresEvaluationCache
 from draive.postgres.memory import PostgresConversationMemory
+from draive.postgres.step_cache import PostgresStepCache
 from draive.postgres.templates import PostgresTemplatesRepository
 from draive.postgres.vector_index import PostgresVectorIndex
 
@@ -18,8 +20,10 @@ __all__ = (
     "PostgresConnection",
     "PostgresConnectionPool",
     "PostgresConversationMemory",
+    "PostgresEvaluationCache",
     "PostgresException",
     "PostgresRow",
+    "PostgresStepCache",
     "PostgresTemplatesRepository",
     "PostgresValue",
     "PostgresVectorIndex",
@@ -0,0 +1,138 @@
+from typing import Any, NoReturn, cast, final
+
+from haiway import Meta, MetaValues
+from haiway.postgres import Postgres, PostgresConnection
+
+from draive.evaluation import EvaluationCache
+
+__all__ = ("PostgresEvaluationCache",)
+
+
+@final
+class PostgresEvaluationCache:
+    """PostgreSQL-backed evaluation cache factory.
+
+    Evaluation results are stored in the ``evaluation_cache`` table keyed by
+    the evaluation fingerprint, with optional expiration timestamps.
+    """
+
+    @staticmethod
+    async def migrate() -> None:
+        """Create database structures required by the evaluation cache."""
+        await PostgresConnection.execute(
+            """
+            CREATE TABLE IF NOT EXISTS evaluation_cache (
+                key TEXT NOT NULL,
+                entry JSONB NOT NULL,
+                expires TIMESTAMPTZ DEFAULT NULL,
+                created TIMESTAMPTZ NOT NULL DEFAULT CURRENT_TIMESTAMP,
+                PRIMARY KEY (key)
+            );
+
+            CREATE INDEX IF NOT EXISTS
+                evaluation_cache_expires_idx
+
+            ON
+                evaluation_cache (expires);
+            """
+        )
+
+    @staticmethod
+    def prepare(
+        *,
+        expiration: float | None = None,
+        bypass: bool = False,
+        meta: Meta | MetaValues | None = None,
+    ) -> EvaluationCache:
+        """Return a Postgres-backed evaluation cache.
+
+        Parameters
+        ----------
+        expiration : float | None, optional
+            Lifetime of stored entries in seconds, ``None`` for no expiration.
+        bypass : bool, optional
+            Whether stored entries are ignored and refreshed.
+        meta : Meta | MetaValues | None, optional
+            Cache metadata, defaults to the ``postgres`` source.
+
+        Returns
+        -------
+        EvaluationCache
+            Cache facade operating on the ``evaluation_cache`` Postgres table.
+        """
+
+        async def loading(
+            key: str,
+            **extra: Any,
+        ) -> str | None:
+            result = await Postgres.fetch_one(
+                """
+                SELECT
+                    entry::TEXT
+
+                FROM
+                    evaluation_cache
+
+                WHERE
+                    key = $1::TEXT
+                    AND (expires IS NULL OR expires > CURRENT_TIMESTAMP)
+
+                LIMIT 1;
+                """,
+                key,
+            )
+
+            if not result:
+                return None
+
+            return cast(str, result["entry"])
+
+        async def storing(
+            key: str,
+            entry: str,
+            *,
+            expiration: float | None,
+            **extra: Any,
+        ) -> None:
+            await Postgres.execute(
+                """
+                INSERT INTO
+                    evaluation_cache (
+                        key,
+                        entry,
+                        expires
+                    )
+
+                VALUES
+                    (
+                        $1::TEXT,
+                        $2::JSONB,
+                        CASE
+                            WHEN $3::DOUBLE PRECISION IS NULL THEN NULL
+                            ELSE CURRENT_TIMESTAMP
+                                + make_interval(secs => $3::DOUBLE PRECISION)
+                        END
+                    )
+
+                ON CONFLICT (key) DO UPDATE SET
+                    entry = EXCLUDED.entry,
+                    expires = EXCLUDED.expires,
+                    created = CURRENT_TIMESTAMP;
+                """,
+                key,
+                entry,
+                expiration,
+            )
+
+        return EvaluationCache(
+            loading=loading,
+            storing=storing,
+            expiration=expiration,
+            bypass=bypass,
+            meta=Meta.of(meta if meta is not None else {"source": "postgres"}),
+        )
+
+    __slots__ = ()
+
+    def __init__(self) -> NoReturn:
+        raise RuntimeError("PostgresEvaluationCache instantiation is forbidden")
@@ -0,0 +1,133 @@
+from typing import Any, NoReturn, cast, final
+
+from haiway import Meta, MetaValues, ctx
+from haiway.postgres import Postgres, PostgresConnection
+
+from draive.steps import StepCache, StepCacheEntry
+from draive.steps.cache import decode_step_cache_entry, encode_step_cache_entry
+
+__all__ = ("PostgresStepCache",)
+
+
+@final
+class PostgresStepCache:
+    """PostgreSQL-backed step cache factory.
+
+    Recorded step executions are stored in the ``step_cache`` table keyed by
+    the step state fingerprint, with optional expiration timestamps.
+    """
+
+    @staticmethod
+    async def migrate() -> None:
+        """Create database structures required by the step cache."""
+        await PostgresConnection.execute(
+            """
+            CREATE TABLE IF NOT EXISTS step_cache (
+                key TEXT NOT NULL,
+                entry JSONB NOT NULL,
+                expires TIMESTAMPTZ DEFAULT NULL,
+                created TIMESTAMPTZ NOT NULL DEFAULT CURRENT_TIMESTAMP,
+                PRIMARY KEY (key)
+            );
+
+            CREATE INDEX IF NOT EXISTS
+                step_cache_expires_idx
+
+            ON
+                step_cache (expires);
+            """
+        )
+
+    @staticmethod
+    def prepare(
+        meta: Meta | MetaValues | None = None,
+    ) -> StepCache:
+        """Return a Postgres-backed step cache.
+
+        Returns
+        -------
+        StepCache
+            Cache facade operating on the ``step_cache`` Postgres table.
+        """
+
+        async def loading(
+            key: str,
+            **extra: Any,
+        ) -> StepCacheEntry | None:
+            result = await Postgres.fetch_one(
+                """
+                SELECT
+                    entry::TEXT
+
+                FROM
+                    step_cache
+
+                WHERE
+                    key = $1::TEXT
+                    AND (expires IS NULL OR expires > CURRENT_TIMESTAMP)
+
+                LIMIT 1;
+                """,
+                key,
+            )
+
+            if not result:
+                return None
+
+            try:
+                return decode_step_cache_entry(cast(str, result["entry"]))
+
+            except Exception as exc:
+                ctx.log_warning(
+                    f"Invalid step cache entry {key}, ignoring...",
+                    exception=exc,
+                )
+                return None
+
+        async def storing(
+            key: str,
+            entry: StepCacheEntry,
+            *,
+            expiration: float | None,
+            **extra: Any,
+        ) -> None:
+            await Postgres.execute(
+                """
+                INSERT INTO
+                    step_cache (
+                        key,
+                        entry,
+                        expires
+                    )
+
+                VALUES
+                    (
+                        $1::TEXT,
+                        $2::JSONB,
+                        CASE
+                            WHEN $3::DOUBLE PRECISION IS NULL THEN NULL
+                            ELSE CURRENT_TIMESTAMP
+                                + make_interval(secs => $3::DOUBLE PRECISION)
+                        END
+                    )
+
+                ON CONFLICT (key) DO UPDATE SET
+                    entry = EXCLUDED.entry,
+                    expires = EXCLUDED.expires,
+                    created = CURRENT_TIMESTAMP;
+                """,
+                key,
+                encode_step_cache_entry(entry),
+                expiration,
+            )
+
+        return StepCache(
+            loading=loading,
+            storing=storing,
+            meta=Meta.of(meta if meta is not None else {"source": "postgres"}),
+        )
+
+    __slots__ = ()
+
+    def __init__(self) -> NoReturn:
+        raise RuntimeError("PostgresStepCache instantiation is forbidden")
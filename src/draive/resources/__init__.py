@@ -13,6 +13,9 @@ from draive.resources.types import (
     ResourceMissing,
     ResourceReference,
     ResourceReferenceTemplate,
+    ResourceRevisionChecking,
+    ResourceStream,
+    ResourceStreamFetching,
     ResourceUnresolveable,
     ResourceUploading,
 )
@@ -31,6 +34,9 @@ __all__ = (
     "ResourceMissing",
     "ResourceReference",
     "ResourceReferenceTemplate",
+    "ResourceRevisionChecking",
+    "ResourceStream",
+    "ResourceStreamFetching",
     "ResourceTemplate",
     "ResourceUnresolveable",
     "ResourceUploading",
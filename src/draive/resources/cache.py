@@ -0,0 +1,255 @@
+from asyncio import CancelledError, Future, Task, current_task, get_running_loop, shield
+from collections import OrderedDict
+from collections.abc import Collection, MutableMapping
+from hashlib import sha256
+from pathlib import Path
+from time import monotonic
+from typing import Any
+
+from haiway import Immutable, asynchronous, ctx
+
+from draive.resources.types import (
+    ResourceContent,
+    ResourceFetching,
+    ResourceReference,
+    ResourceRevisionChecking,
+)
+
+__all__ = ("ResourcesCache",)
+
+# nominal size of cached reference collections
+_REFERENCES_SIZE: int = 1024
+
+
+class _CacheEntry(Immutable):
+    revision: str | None
+    content: Collection[ResourceReference] | ResourceContent
+    size: int
+    stored: float
+
+
+class ResourcesCache(Immutable):
+    """Caching layer wrapping resource fetching.
+
+    Fetched resources are kept in a size-bounded memory tier and, when a disk
+    path is provided, resource contents are also stored on disk addressed by
+    their uri and revision (ETag or Last-Modified). Cached entries are
+    revalidated with a conditional revision check when available, and
+    concurrent fetches of the same uri are deduplicated.
+    """
+
+    _fetching: ResourceFetching
+    _revision_checking: ResourceRevisionChecking | None
+    _memory_limit: int
+    _memory_size: int
+    _entries: OrderedDict[str, _CacheEntry]
+    _pending: MutableMapping[str, Future[Collection[ResourceReference] | ResourceContent | None]]
+    _path: Path | None
+    _expiration: float | None
+
+    def __init__(
+        self,
+        fetching: ResourceFetching,
+        *,
+        revision_checking: ResourceRevisionChecking | None,
+        memory_limit: int,
+        path: Path | None,
+        expiration: float | None,
+    ) -> None:
+        object.__setattr__(self, "_fetching", fetching)
+        object.__setattr__(self, "_revision_checking", revision_checking)
+        object.__setattr__(self, "_memory_limit", memory_limit)
+        object.__setattr__(self, "_memory_size", 0)
+        object.__setattr__(self, "_entries", OrderedDict())
+        object.__setattr__(self, "_pending", {})
+        object.__setattr__(self, "_path", path)
+        object.__setattr__(self, "_expiration", expiration)
+
+    async def fetching(
+        self,
+        uri: str,
+        **extra: Any,
+    ) -> Collection[ResourceReference] | ResourceContent | None:
+        if extra:  # extra arguments may alter fetching, skip caching for such calls
+            return await self._fetching(
+                uri,
+                **extra,
+            )
+
+        entry: _CacheEntry | None = self._entries.get(uri)
+        if entry is not None and self._is_fresh(entry):
+            self._entries.move_to_end(uri)
+            return entry.content
+
+        while (pending := self._pending.get(uri)) is not None:
+            try:
+                return await shield(pending)
+
+            except CancelledError:
+                task: Task[Any] | None = current_task()
+                if not pending.cancelled() or (task is not None and task.cancelling()):
+                    raise  # cancelled on its own
+
+                # fetching task was cancelled, retry on our own
+
+        future: Future[Collection[ResourceReference] | ResourceContent | None]
+        future = get_running_loop().create_future()
+        self._pending[uri] = future
+        try:
+            fetched: Collection[ResourceReference] | ResourceContent | None = await self._fetch(
+                uri,
+                entry=entry,
+            )
+
+        except CancelledError:
+            future.cancel()
+            raise
+
+        except BaseException as exc:
+            future.set_exception(exc)
+            future.exception()  # mark as retrieved when there are no waiters
+            raise
+
+        else:
+            future.set_result(fetched)
+            return fetched
+
+        finally:
+            del self._pending[uri]
+
+    def _is_fresh(
+        self,
+        entry: _CacheEntry,
+    ) -> bool:
+        if self._expiration is None:
+            # without revision checks entries are valid until evicted
+            return self._revision_checking is None
+
+        return monotonic() - entry.stored < self._expiration
+
+    async def _fetch(
+        self,
+        uri: str,
+        *,
+        entry: _CacheEntry | None,
+    ) -> Collection[ResourceReference] | ResourceContent | None:
+        revision: str | None = None
+        if self._revision_checking is not None:
+            revision = await self._revision_checking(
+                uri,
+                revision=entry.revision if entry is not None else None,
+            )
+
+            if entry is not None and revision is not None and revision == entry.revision:
+                ctx.log_debug(f"Resource {uri} not modified, using cached")
+                self._store_memory(
+                    uri,
+                    revision=revision,
+                    content=entry.content,
+                )
+                return entry.content
+
+            if revision is not None and self._path is not None:
+                cached: ResourceContent | None = await _load_disk(
+                    self._path,
+                    key=_disk_key(uri, revision=revision),
+                )
+                if cached is not None:
+                    self._store_memory(
+                        uri,
+                        revision=revision,
+                        content=cached,
+                    )
+                    return cached
+
+        fetched: Collection[ResourceReference] | ResourceContent | None = await self._fetching(uri)
+        if fetched is None:
+            self._remove_memory(uri)
+            return None
+
+        self._store_memory(
+            uri,
+            revision=revision,
+            content=fetched,
+        )
+
+        if revision is not None and self._path is not None and isinstance(fetched, ResourceContent):
+            await _store_disk(
+                self._path,
+                key=_disk_key(uri, revision=revision),
+                content=fetched,
+            )
+
+        return fetched
+
+    def _store_memory(
+        self,
+        uri: str,
+        *,
+        revision: str | None,
+        content: Collection[ResourceReference] | ResourceContent,
+    ) -> None:
+        size: int = content.size if isinstance(content, ResourceContent) else _REFERENCES_SIZE
+        if size > self._memory_limit:
+            self._remove_memory(uri)
+            return  # too large to be kept in memory
+
+        self._remove_memory(uri)
+        self._entries[uri] = _CacheEntry(
+            revision=revision,
+            content=content,
+            size=size,
+            stored=monotonic(),
+        )
+        memory_size: int = self._memory_size + size
+        while memory_size > self._memory_limit:
+            _, evicted = self._entries.popitem(last=False)
+            memory_size -= evicted.size
+
+        object.__setattr__(self, "_memory_size", memory_size)
+
+    def _remove_memory(
+        self,
+        uri: str,
+    ) -> None:
+        removed: _CacheEntry | None = self._entries.pop(uri, None)
+        if removed is not None:
+            object.__setattr__(self, "_memory_size", self._memory_size - removed.size)
+
+
+def _disk_key(
+    uri: str,
+    *,
+    revision: str,
+) -> str:
+    return sha256(f"{uri}\n{revision}".encode()).hexdigest()
+
+
+@asynchronous
+def _load_disk(
+    path: Path,
+    *,
+    key: str,
+) -> ResourceContent | None:
+    try:
+        with open(path / f"{key}.json", mode="rb") as file:
+            return ResourceContent.from_json(file.read().decode())
+
+    except FileNotFoundError:
+        return None
+
+    except Exception:
+        return None  # treat corrupted entries as missing
+
+
+@asynchronous
+def _store_disk(
+    path: Path,
+    *,
+    key: str,
+    content: ResourceContent,
+) -> None:
+    # draive.utils depends on draive.multimodal which imports resources, import lazily
+    from draive.utils.files import write_atomically
+
+    write_atomically(path / f"{key}.json", content.to_json().encode())
@@ -1,3 +1,5 @@
+import re
+from collections.abc import AsyncIterator
 from typing import Any, Final
 from urllib.parse import urlparse
 
@@ -8,6 +10,7 @@ from draive.resources.types import (
     ResourceCorrupted,
     ResourceInaccessible,
     ResourceReference,
+    ResourceStream,
     ResourceUnresolveable,
 )
 
@@ -15,6 +18,8 @@ __all__ = (
     "http_resource_deleting",
     "http_resource_fetching",
     "http_resource_list_fetching",
+    "http_resource_revision_checking",
+    "http_resource_stream_fetching",
     "http_resource_uploading",
 )
 
@@ -23,9 +28,15 @@ HTTP_OK: Final[int] = 200
 HTTP_CREATED: Final[int] = 201
 HTTP_ACCEPTED: Final[int] = 202
 HTTP_NO_CONTENT: Final[int] = 204
+HTTP_PARTIAL_CONTENT: Final[int] = 206
+HTTP_NOT_MODIFIED: Final[int] = 304
 HTTP_UNAUTHORIZED: Final[int] = 401
 HTTP_FORBIDDEN: Final[int] = 403
 HTTP_NOT_FOUND: Final[int] = 404
+HTTP_RANGE_NOT_SATISFIABLE: Final[int] = 416
+
+# Match `bytes start-end/size` or `bytes */size` where size may be unknown.
+_CONTENT_RANGE_PATTERN: Final[re.Pattern[str]] = re.compile(r"bytes\s+(?:\d+-\d+|\*)/(\d+|\*)")
 
 
 async def http_resource_list_fetching(
@@ -52,17 +63,7 @@ async def http_resource_fetching(
     if response.status_code == HTTP_NOT_FOUND:
         return None
 
-    if response.status_code == HTTP_UNAUTHORIZED:
-        raise ResourceInaccessible(
-            uri=uri,
-            description="Unauthorized",
-        )
-
-    if response.status_code == HTTP_FORBIDDEN:
-        raise ResourceInaccessible(
-            uri=uri,
-            description="Forbidden",
-        )
+    _verify_fetch_response(uri, response=response)
 
     if response.status_code != HTTP_OK:
         raise ResourceCorrupted(uri=uri)
@@ -76,6 +77,206 @@ async def http_resource_fetching(
     )
 
 
+async def http_resource_stream_fetching(  # noqa: C901
+    uri: str,
+    *,
+    offset: int,
+    length: int | None,
+    chunk_size: int,
+    **extra: Any,
+) -> ResourceStream | None:
+    if urlparse(uri).scheme.lower() not in {"http", "https"}:
+        raise ResourceUnresolveable(uri=uri)
+
+    end: int | None = None if length is None else offset + length
+    headers: dict[str, str] = dict(extra.pop("headers", None) or {})
+
+    async def request_range(
+        start: int,
+        *,
+        validator: str | None = None,
+    ) -> HTTPResponse:
+        stop: int = start + chunk_size if end is None else min(start + chunk_size, end)
+        range_headers: dict[str, str] = {
+            **headers,
+            "range": f"bytes={start}-{stop - 1}",
+        }
+        if validator is not None:
+            # serve further ranges only from the same representation
+            range_headers["if-range"] = validator
+
+        response: HTTPResponse = await HTTPClient.get(
+            url=uri,
+            headers=range_headers,
+            **extra,
+        )
+        _verify_fetch_response(uri, response=response)
+        return response
+
+    response: HTTPResponse = await request_range(offset)
+    if response.status_code == HTTP_NOT_FOUND:
+        return None
+
+    mime_type: str = response.headers.get(
+        "content-type",
+        "application/octet-stream",
+    )
+
+    if response.status_code == HTTP_RANGE_NOT_SATISFIABLE:
+        return ResourceStream(
+            uri=uri,
+            mime_type=mime_type,
+            offset=offset,
+            size=_content_range_size(response),
+            meta=Meta.empty,
+            _chunks=_empty_chunks(),
+        )
+
+    if response.status_code == HTTP_OK:  # range requests are not supported
+        body: bytes = await response.body()
+
+        async def sliced_chunks() -> AsyncIterator[bytes]:
+            selected: memoryview = memoryview(body)[offset:end]
+            for start in range(0, len(selected), chunk_size):
+                yield bytes(selected[start : start + chunk_size])
+
+        return ResourceStream(
+            uri=uri,
+            mime_type=mime_type,
+            offset=offset,
+            size=len(body),
+            meta=Meta.empty,
+            _chunks=sliced_chunks(),
+        )
+
+    if response.status_code != HTTP_PARTIAL_CONTENT:
+        raise ResourceCorrupted(uri=uri)
+
+    size: int | None = _content_range_size(response)
+    validator: str | None = _range_validator(response)
+    first_chunk: bytes = await response.body()
+
+    async def ranged_chunks() -> AsyncIterator[bytes]:
+        chunk: bytes = first_chunk
+        position: int = offset
+        while chunk:
+            yield chunk
+            position += len(chunk)
+            if (end is not None and position >= end) or (size is not None and position >= size):
+                return  # requested range completed
+
+            next_response: HTTPResponse = await request_range(
+                position,
+                validator=validator,
+            )
+            if (
+                next_response.status_code == HTTP_RANGE_NOT_SATISFIABLE
+                and _content_range_size(next_response) == position
+            ):
+                return  # resource ended exactly at the current position
+
+            if next_response.status_code != HTTP_PARTIAL_CONTENT:
+                # full or unexpected response means the resource changed mid-stream
+                raise ResourceCorrupted(uri=uri)
+
+            chunk = await next_response.body()
+
+    return ResourceStream(
+        uri=uri,
+        mime_type=mime_type,
+        offset=offset,
+        size=size,
+        meta=Meta.empty,
+        _chunks=ranged_chunks(),
+    )
+
+
+async def http_resource_revision_checking(
+    uri: str,
+    *,
+    revision: str | None,
+    **extra: Any,
+) -> str | None:
+    if urlparse(uri).scheme.lower() not in {"http", "https"}:
+        raise ResourceUnresolveable(uri=uri)
+
+    headers: dict[str, str] = dict(extra.pop("headers", None) or {})
+    if revision is not None and _is_entity_tag(revision):
+        headers["if-none-match"] = revision
+
+    elif revision is not None:  # last-modified date
+        headers["if-modified-since"] = revision
+
+    response: HTTPResponse = await HTTPClient.request(
+        "HEAD",
+        url=uri,
+        headers=headers,
+        **extra,
+    )
+
+    if response.status_code == HTTP_NOT_MODIFIED:
+        return revision
+
+    if response.status_code != HTTP_OK:
+        return None  # revision can't be determined
+
+    return response.headers.get("etag") or response.headers.get("last-modified")
+
+
+def _is_entity_tag(
+    revision: str,
+) -> bool:
+    # entity tags are always quoted, optionally with the weak prefix
+    return revision.startswith(('"', 'W/"'))
+
+
+def _content_range_size(
+    response: HTTPResponse,
+) -> int | None:
+    content_range: str | None = response.headers.get("content-range")
+    if content_range is None:
+        return None
+
+    match: re.Match[str] | None = _CONTENT_RANGE_PATTERN.match(content_range)
+    if match is None or match.group(1) == "*":
+        return None
+
+    return int(match.group(1))
+
+
+def _range_validator(
+    response: HTTPResponse,
+) -> str | None:
+    etag: str | None = response.headers.get("etag")
+    if etag is not None and not etag.startswith("W/"):
+        return etag  # weak entity tags are not allowed in if-range
+
+    return response.headers.get("last-modified")
+
+
+async def _empty_chunks() -> AsyncIterator[bytes]:
+    return
+    yield  # make it a generator
+
+
+def _verify_fetch_response(
+    uri: str,
+    *,
+    response: HTTPResponse,
+) -> None:
+    if response.status_code == HTTP_UNAUTHORIZED:
+        raise ResourceInaccessible(
+            uri=uri,
+            description="Unauthorized",
+        )
+
+    if response.status_code == HTTP_FORBIDDEN:
+        raise ResourceInaccessible(
+            uri=uri,
+            description="Forbidden",
+        )
+
+
 async def http_resource_uploading(
     uri: str,
     content: ResourceContent,
@@ -1,12 +1,16 @@
-from collections.abc import Collection
-from typing import Any, Literal, final, overload
+from collections.abc import AsyncIterator, Collection
+from pathlib import Path
+from typing import Any, Literal, Self, final, overload
 
 from haiway import Meta, Paginated, Pagination, State, statemethod
 
+from draive.resources.cache import ResourcesCache
 from draive.resources.http import (
     http_resource_deleting,
     http_resource_fetching,
     http_resource_list_fetching,
+    http_resource_revision_checking,
+    http_resource_stream_fetching,
     http_resource_uploading,
 )
 from draive.resources.types import (
@@ -18,6 +22,9 @@ from draive.resources.types import (
     ResourceListFetching,
     ResourceMissing,
     ResourceReference,
+    ResourceRevisionChecking,
+    ResourceStream,
+    ResourceStreamFetching,
     ResourceUploading,
 )
 
@@ -26,6 +33,58 @@ __all__ = ("ResourcesRepository",)
 
 @final
 class ResourcesRepository(State):
+    def with_cache(
+        self,
+        *,
+        memory_limit: int = 64 * 1024 * 1024,
+        path: Path | str | None = None,
+        expiration: float | None = None,
+    ) -> Self:
+        """Return a repository caching fetched resources.
+
+        Fetched resources are kept in memory up to ``memory_limit`` bytes and
+        optionally on disk keyed by resource uri and revision. When revision
+        checking is available (``revision_checking`` or the default HTTP
+        backend), cached entries are revalidated with a conditional request
+        instead of fetching the resource again. Concurrent fetches of the same
+        uri share a single backend request.
+
+        Parameters
+        ----------
+        memory_limit : int, default=64 MiB
+            Maximal total size in bytes of resources kept in memory.
+        path : Path | str | None, optional
+            Directory used for the disk tier, disabled when omitted. Only
+            resources with a known revision are stored on disk.
+        expiration : float | None, optional
+            Time in seconds for which cached entries are used without any
+            revalidation. When omitted, entries are revalidated on each fetch
+            if revision checking is available, otherwise kept until evicted.
+
+        Returns
+        -------
+        Self
+            Repository with cached fetching.
+        """
+        assert memory_limit >= 0  # nosec: B101
+        assert expiration is None or expiration > 0  # nosec: B101
+        revision_checking: ResourceRevisionChecking | None = self.revision_checking
+        stream_fetching: ResourceStreamFetching | None = self.stream_fetching
+        if self.fetching is http_resource_fetching:  # use counterparts of default
+            revision_checking = revision_checking or http_resource_revision_checking
+            stream_fetching = stream_fetching or http_resource_stream_fetching
+
+        return self.updating(
+            stream_fetching=stream_fetching,
+            fetching=ResourcesCache(
+                self.fetching,
+                revision_checking=revision_checking,
+                memory_limit=memory_limit,
+                path=Path(path) if isinstance(path, str) else path,
+                expiration=expiration,
+            ).fetching,
+        )
+
     @overload
     @classmethod
     async def fetch_list(
@@ -148,6 +207,111 @@ class ResourcesRepository(State):
         else:
             return default
 
+    @overload
+    @classmethod
+    async def fetch_stream(
+        cls,
+        resource: ResourceReference | str,
+        /,
+        *,
+        offset: int = 0,
+        length: int | None = None,
+        chunk_size: int = 1024 * 1024,
+        **extra: Any,
+    ) -> ResourceStream: ...
+
+    @overload
+    async def fetch_stream(
+        self,
+        resource: ResourceReference | str,
+        /,
+        *,
+        offset: int = 0,
+        length: int | None = None,
+        chunk_size: int = 1024 * 1024,
+        **extra: Any,
+    ) -> ResourceStream: ...
+
+    @statemethod
+    async def fetch_stream(
+        self,
+        resource: ResourceReference | str,
+        /,
+        *,
+        offset: int = 0,
+        length: int | None = None,
+        chunk_size: int = 1024 * 1024,
+        **extra: Any,
+    ) -> ResourceStream:
+        """Fetch resource content as a stream of byte chunks.
+
+        Allows processing large resources in bounded memory. Repositories
+        without dedicated streaming support fall back to regular fetching and
+        stream slices of the fetched content.
+
+        Parameters
+        ----------
+        resource : ResourceReference | str
+            Resource reference or its uri.
+        offset : int, default=0
+            Position in bytes of the first byte to stream.
+        length : int | None, optional
+            Maximal number of bytes to stream, streams until the end when omitted.
+        chunk_size : int, default=1 MiB
+            Preferred size in bytes of streamed chunks.
+        **extra : Any
+            Extra arguments forwarded to the underlying fetching callable.
+
+        Returns
+        -------
+        ResourceStream
+            Stream of requested resource content.
+
+        Raises
+        ------
+        ResourceMissing
+            If the resource does not exist.
+        ResourceCorrupted
+            If the resource is not a content resource.
+        """
+        assert offset >= 0  # nosec: B101
+        assert length is None or length >= 0  # nosec: B101
+        assert chunk_size > 0  # nosec: B101
+        uri: str
+        if isinstance(resource, str):
+            uri = resource
+
+        else:
+            uri = resource.uri
+
+        stream_fetching: ResourceStreamFetching | None = self.stream_fetching
+        if stream_fetching is None and self.fetching is http_resource_fetching:
+            stream_fetching = http_resource_stream_fetching  # streaming variant of default
+
+        stream: ResourceStream | None
+        if stream_fetching is not None:
+            stream = await stream_fetching(
+                uri,
+                offset=offset,
+                length=length,
+                chunk_size=chunk_size,
+                **extra,
+            )
+
+        else:
+            stream = await self._fetch_sliced(
+                uri,
+                offset=offset,
+                length=length,
+                chunk_size=chunk_size,
+                **extra,
+            )
+
+        if stream is None:
+            raise ResourceMissing(uri=uri)
+
+        return stream
+
     @overload
     @classmethod
     async def upload(
@@ -196,6 +360,47 @@ class ResourcesRepository(State):
 
     list_fetching: ResourceListFetching = http_resource_list_fetching
     fetching: ResourceFetching = http_resource_fetching
+    stream_fetching: ResourceStreamFetching | None = None
+    revision_checking: ResourceRevisionChecking | None = None
     uploading: ResourceUploading = http_resource_uploading
     deleting: ResourceDeleting = http_resource_deleting
     meta: Meta = Meta.empty
+
+    async def _fetch_sliced(
+        self,
+        uri: str,
+        /,
+        *,
+        offset: int,
+        length: int | None,
+        chunk_size: int,
+        **extra: Any,
+    ) -> ResourceStream | None:
+        fetched: Collection[ResourceReference] | ResourceContent | None = await self.fetching(
+            uri,
+            **extra,
+        )
+
+        if fetched is None:
+            return None
+
+        if not isinstance(fetched, ResourceContent):
+            raise ResourceCorrupted(uri=uri)  # can't stream resource with references
+
+        content: bytes = fetched.to_bytes()
+
+        async def chunks() -> AsyncIterator[bytes]:
+            selected: memoryview = memoryview(content)[
+                offset : None if length is None else offset + length
+            ]
+            for start in range(0, len(selected), chunk_size):
+                yield bytes(selected[start : start + chunk_size])
+
+        return ResourceStream(
+            uri=uri,
+            mime_type=fetched.mime_type,
+            offset=offset,
+            size=len(content),
+            meta=fetched.meta,
+            _chunks=chunks(),
+        )
@@ -1,8 +1,12 @@
+import re
 from base64 import b64decode, b64encode
-from collections.abc import Collection
-from typing import Any, Literal, Protocol, Self, final, overload, runtime_checkable
+from collections.abc import AsyncIterable, AsyncIterator, Collection
+from tempfile import SpooledTemporaryFile
+from typing import Any, Final, Literal, Protocol, Self, final, overload, runtime_checkable
 
-from haiway import Meta, MetaValues, Paginated, Pagination, State
+from haiway import Immutable, Meta, MetaValues, Paginated, Pagination, State
+
+_BASE64_PATTERN: Final[re.Pattern[str]] = re.compile(r"[A-Za-z0-9+/]*={0,2}")
 
 __all__ = (
     "MimeType",
@@ -17,6 +21,9 @@ __all__ = (
     "ResourceMissing",
     "ResourceReference",
     "ResourceReferenceTemplate",
+    "ResourceRevisionChecking",
+    "ResourceStream",
+    "ResourceStreamFetching",
     "ResourceUnresolveable",
     "ResourceUploading",
 )
@@ -179,14 +186,14 @@ class ResourceContent(State, serializable=True):
     @classmethod
     def of(
         cls,
-        content: str | bytes,
+        content: str | bytes | bytearray | memoryview,
         /,
         *,
         mime_type: MimeType | None = None,
         meta: Meta | MetaValues | None = None,
     ) -> Self:
         if isinstance(content, str):
-            # Treat strings as base64
+            # Treat strings as base64, used as is without decoding
             assert validate_base64(content)  # nosec: B101
 
             return cls(
@@ -196,13 +203,18 @@ class ResourceContent(State, serializable=True):
             )
 
         else:
-            assert isinstance(content, bytes)  # nosec: B101
+            assert isinstance(content, bytes | bytearray | memoryview)  # nosec: B101
 
-            return cls(
+            resource: Self = cls(
                 data=b64encode(content).decode(),
                 mime_type=mime_type if mime_type is not None else "application/octet-stream",
                 meta=Meta.of(meta),
             )
+            if isinstance(content, bytes):
+                # immutable source bytes are reused instead of decoding them again
+                object.__setattr__(resource, "_decoded", content)
+
+            return resource
 
     data: str  # base64 encoded
     mime_type: str
@@ -232,8 +244,25 @@ class ResourceContent(State, serializable=True):
         else:
             return f"![{kind}]()"
 
+    @property
+    def size(self) -> int:
+        """Size in bytes of the decoded content, computed without decoding."""
+        length: int = len(self.data)
+        if length == 0:
+            return 0
+
+        padding: int = 2 if self.data.endswith("==") else 1 if self.data.endswith("=") else 0
+        return (length * 3) // 4 - padding
+
     def to_bytes(self) -> bytes:
-        return b64decode(self.data)
+        # decoded payload is cached lazily on the immutable instance itself,
+        # the private attribute is not a State field and is never serialized
+        decoded: bytes | None = getattr(self, "_decoded", None)
+        if decoded is None:
+            decoded = b64decode(self.data)
+            object.__setattr__(self, "_decoded", decoded)
+
+        return decoded
 
     def to_data_uri(self) -> str:
         return f"data:{self.mime_type};base64,{self.data}"
@@ -337,6 +366,125 @@ class ResourceFetching(Protocol):
     ) -> Collection[ResourceReference] | ResourceContent | None: ...
 
 
+@final
+class ResourceStream(Immutable):
+    """Resource content delivered as a stream of byte chunks.
+
+    The stream can be consumed only once, either by iterating chunks directly
+    or using one of the collecting helpers.
+
+    Attributes
+    ----------
+    uri : str
+        Identifier of the streamed resource.
+    mime_type : str
+        MIME type of the resource.
+    offset : int
+        Position in bytes of the first streamed byte within the resource.
+    size : int | None
+        Total size in bytes of the whole resource when known.
+    meta : Meta
+        Additional resource metadata.
+    """
+
+    uri: str
+    mime_type: MimeType
+    offset: int
+    size: int | None
+    meta: Meta
+    _chunks: AsyncIterable[bytes]
+
+    def __aiter__(self) -> AsyncIterator[bytes]:
+        return aiter(self._chunks)
+
+    async def read(self) -> bytes:
+        """Collect all remaining chunks in memory.
+
+        Returns
+        -------
+        bytes
+            Streamed content.
+        """
+        return b"".join([chunk async for chunk in self._chunks])
+
+    async def content(self) -> ResourceContent:
+        """Collect all remaining chunks into ``ResourceContent``.
+
+        Returns
+        -------
+        ResourceContent
+            Streamed content with the stream MIME type and metadata.
+        """
+        return ResourceContent.of(
+            await self.read(),
+            mime_type=self.mime_type,
+            meta=self.meta,
+        )
+
+    async def spool(
+        self,
+        *,
+        threshold: int = 8 * 1024 * 1024,  # 8 MiB
+    ) -> SpooledTemporaryFile[bytes]:
+        """Collect all remaining chunks into a temporary file.
+
+        Content is kept in memory until it exceeds ``threshold`` bytes and is
+        moved to a file on disk afterwards. The returned file is rewound and has
+        to be closed by the caller.
+
+        Parameters
+        ----------
+        threshold : int, default=8 MiB
+            Maximal size in bytes kept in memory.
+
+        Returns
+        -------
+        SpooledTemporaryFile[bytes]
+            Temporary file holding streamed content.
+        """
+        file: SpooledTemporaryFile[bytes] = SpooledTemporaryFile(max_size=threshold)
+        try:
+            async for chunk in self._chunks:
+                file.write(chunk)
+
+        except BaseException:
+            file.close()
+            raise
+
+        file.seek(0)
+        return file
+
+
+@runtime_checkable
+class ResourceStreamFetching(Protocol):
+    async def __call__(
+        self,
+        uri: str,
+        *,
+        offset: int,
+        length: int | None,
+        chunk_size: int,
+        **extra: Any,
+    ) -> ResourceStream | None: ...
+
+
+@runtime_checkable
+class ResourceRevisionChecking(Protocol):
+    """Return current revision (e.g. ETag) of a resource or None when unknown.
+
+    Implementations should use ``revision`` for conditional requests when
+    possible, returning it unchanged when the resource was not modified.
+    """
+
+    async def __call__(
+        self,
+        uri: str,
+        *,
+        revision: str | None,
+        **extra: Any,
+    ) -> str | None: ...
+
+
 @runtime_checkable
 class ResourceUploading(Protocol):
     async def __call__(
@@ -357,10 +505,5 @@ class ResourceDeleting(Protocol):
 
 
 def validate_base64(data: str) -> bool:
-    try:
-        b64decode(data, validate=True)
-
-    except Exception:
-        return False
-
-    return True
+    # match the alphabet instead of decoding to avoid copying large payloads
+    return len(data) % 4 == 0 and _BASE64_PATTERN.fullmatch(data) is not None
@@ -1,8 +1,11 @@
+from draive.skills.catalog import SkillDescription, SkillsCatalog
 from draive.skills.types import Skill, SkillException, SkillResource, SkillResourceMissing
 
 __all__ = (
     "Skill",
+    "SkillDescription",
     "SkillException",
     "SkillResource",
     "SkillResourceMissing",
+    "SkillsCatalog",
 )
@@ -0,0 +1,429 @@
+import json
+from collections.abc import Mapping, MutableMapping, Sequence
+from pathlib import Path
+from typing import Any, Self, cast, final
+
+from haiway import Immutable, Meta, State, asynchronous, ctx, execute_concurrently
+
+from draive.models import ModelInstructions
+from draive.skills.types import (
+    ParsedFrontmatter,
+    ParsedSkillFile,
+    Skill,
+    SkillException,
+    _file_identity,  # pyright: ignore[reportPrivateUsage]
+)
+from draive.utils import write_atomically
+
+__all__ = (
+    "SkillDescription",
+    "SkillsCatalog",
+)
+
+
+@final
+class SkillDescription(State, serializable=True):
+    """Discovery metadata of a cataloged skill.
+
+    Parameters
+    ----------
+    name : str
+        Skill name.
+    description : str
+        Human-readable skill description.
+    path : str
+        Skill root directory path.
+    meta : Meta, optional
+        Additional skill metadata.
+    """
+
+    name: str
+    description: str
+    path: str
+    meta: Meta = Meta.empty
+
+
+class _CatalogEntry(Immutable):
+    path: Path
+    modified: int
+    size: int
+    frontmatter: ParsedFrontmatter
+    instructions: ModelInstructions
+
+
+@final
+class SkillsCatalog(Immutable):
+    """Catalog of skills loaded from multiple directories.
+
+    Only `SKILL.md` files are read when loading a catalog, allowing skill
+    descriptions to be presented before skill instructions and resources are
+    needed. Parsed files are kept keyed by path, modification time and size,
+    optionally persisted in a cache file to survive restarts, and revalidated
+    whenever instructions or skills are requested.
+    """
+
+    @classmethod
+    async def load(
+        cls,
+        *paths: Path | str,
+        cache_path: Path | str | None = None,
+        concurrent_tasks: int = 16,
+    ) -> Self:
+        """Load skill directories concurrently.
+
+        Parameters
+        ----------
+        *paths : Path | str
+            Skill root directory paths, each containing `SKILL.md`.
+        cache_path : Path | str | None, optional
+            File used to persist parsed `SKILL.md` files between restarts.
+        concurrent_tasks : int, optional
+            Maximum number of skill files processed concurrently.
+
+        Returns
+        -------
+        catalog : Self
+            Catalog containing all requested skills.
+
+        Raises
+        ------
+        ValueError
+            When any `SKILL.md` is missing or malformed, or when skill names are duplicated.
+        """
+        assert concurrent_tasks > 0  # nosec: B101
+        catalog: Self = cls(
+            cache_path=Path(cache_path) if cache_path is not None else None,
+            concurrent_tasks=concurrent_tasks,
+        )
+        persisted: Mapping[str, Any] = {}
+        if catalog._cache_path is not None:
+            persisted = await _load_cache(catalog._cache_path)
+
+        async def load_entry(
+            path: Path | str,
+        ) -> _CatalogEntry:
+            root_path: Path = Path(path).absolute()
+            try:
+                return await _catalog_entry(
+                    root_path,
+                    persisted=persisted,
+                )
+
+            except FileNotFoundError as exc:
+                raise ValueError(f"Missing SKILL.md in skill directory: {root_path}") from exc
+
+        async with ctx.scope("skills.catalog"):
+            entries: Sequence[_CatalogEntry] = await execute_concurrently(
+                load_entry,
+                paths,
+                concurrent_tasks=concurrent_tasks,
+            )
+
+        for entry in entries:
+            if entry.frontmatter.name in catalog._entries:
+                raise ValueError(f"Duplicate skill name in catalog: {entry.frontmatter.name}")
+
+            catalog._entries[entry.frontmatter.name] = entry
+
+        await catalog._persist()
+        return catalog
+
+    _entries: MutableMapping[str, _CatalogEntry]
+    _cache_path: Path | None
+    _concurrent_tasks: int
+
+    def __init__(
+        self,
+        *,
+        cache_path: Path | None,
+        concurrent_tasks: int,
+    ) -> None:
+        object.__setattr__(self, "_entries", {})
+        object.__setattr__(self, "_cache_path", cache_path)
+        object.__setattr__(self, "_concurrent_tasks", concurrent_tasks)
+
+    @property
+    def descriptions(self) -> Sequence[SkillDescription]:
+        """Descriptions of all cataloged skills without loading their bodies."""
+        return tuple(_description(entry) for entry in self._entries.values())
+
+    def description(
+        self,
+        name: str,
+        /,
+    ) -> SkillDescription:
+        """Get description of a cataloged skill.
+
+        Parameters
+        ----------
+        name : str
+            Skill name.
+
+        Returns
+        -------
+        description : SkillDescription
+            Skill discovery metadata.
+
+        Raises
+        ------
+        SkillException
+            When the skill is not part of the catalog.
+        """
+        return _description(self._entry(name))
+
+    async def instructions(
+        self,
+        name: str,
+        /,
+    ) -> ModelInstructions:
+        """Get up to date instructions of a cataloged skill.
+
+        Parameters
+        ----------
+        name : str
+            Skill name.
+
+        Returns
+        -------
+        instructions : ModelInstructions
+            Instructions from `SKILL.md`, parsed again when the file changed.
+
+        Raises
+        ------
+        SkillException
+            When the skill is not part of the catalog or was renamed to the name
+            of another cataloged skill.
+        """
+        return (await self._revalidated(name)).instructions
+
+    async def skill(
+        self,
+        name: str,
+        /,
+        *,
+        lazy: bool = False,
+    ) -> Skill:
+        """Load a cataloged skill with its resources.
+
+        Parameters
+        ----------
+        name : str
+            Skill name.
+        lazy : bool, optional
+            Whether to index resources as local file references read on first access.
+
+        Returns
+        -------
+        skill : Skill
+            Skill loaded from its directory.
+
+        Raises
+        ------
+        SkillException
+            When the skill is not part of the catalog or was renamed to the name
+            of another cataloged skill.
+        """
+        entry: _CatalogEntry = await self._revalidated(name)
+        return await Skill.from_directory(
+            entry.path,
+            lazy=lazy,
+        )
+
+    async def refresh(self) -> None:
+        """Revalidate all cataloged skills, parsing changed `SKILL.md` files again.
+
+        Skills whose directories were removed are dropped from the catalog, as are
+        skills renamed to the name of another cataloged skill.
+        """
+
+        async def refresh_entry(
+            entry: _CatalogEntry,
+        ) -> _CatalogEntry | None:
+            try:
+                return await _catalog_entry(
+                    entry.path,
+                    persisted={},
+                    current=entry,
+                )
+
+            except FileNotFoundError:
+                ctx.log_warning(f"Skill {entry.frontmatter.name} removed from {entry.path}")
+                return None
+
+        async with ctx.scope("skills.catalog.refresh"):
+            current: Sequence[_CatalogEntry] = tuple(self._entries.values())
+            refreshed: Sequence[_CatalogEntry | None] = await execute_concurrently(
+                refresh_entry,
+                current,
+                concurrent_tasks=self._concurrent_tasks,
+            )
+
+        # skills keeping their names take precedence over skills renamed to a cataloged name
+        kept: set[str] = {
+            entry.frontmatter.name
+            for previous, entry in zip(current, refreshed, strict=True)
+            if entry is not None and entry.frontmatter.name == previous.frontmatter.name
+        }
+        self._entries.clear()
+        for previous, entry in zip(current, refreshed, strict=True):
+            if entry is None:
+                continue
+
+            if entry.frontmatter.name != previous.frontmatter.name and (
+                entry.frontmatter.name in kept or entry.frontmatter.name in self._entries
+            ):
+                ctx.log_error(
+                    f"Skill {previous.frontmatter.name} from {entry.path} was renamed to"
+                    f" an already cataloged skill {entry.frontmatter.name}, dropping it"
+                )
+                continue
+
+            self._entries[entry.frontmatter.name] = entry
+
+        await self._persist()
+
+    def _entry(
+        self,
+        name: str,
+    ) -> _CatalogEntry:
+        if entry := self._entries.get(name):
+            return entry
+
+        raise SkillException(
+            f"Missing skill - {name}",
+            skill=name,
+        )
+
+    async def _revalidated(
+        self,
+        name: str,
+    ) -> _CatalogEntry:
+        entry: _CatalogEntry = self._entry(name)
+        refreshed: _CatalogEntry = await _catalog_entry(
+            entry.path,
+            persisted={},
+            current=entry,
+        )
+        if refreshed is entry:
+            return entry
+
+        if refreshed.frontmatter.name != name:
+            if refreshed.frontmatter.name in self._entries:
+                raise SkillException(
+                    f"Skill {name} was renamed to an already cataloged skill"
+                    f" - {refreshed.frontmatter.name}",
+                    skill=name,
+                )
+
+            del self._entries[name]
+
+        self._entries[refreshed.frontmatter.name] = refreshed
+        await self._persist()
+        return refreshed
+
+    async def _persist(self) -> None:
+        if self._cache_path is None:
+            return
+
+        await _store_cache(
+            self._cache_path,
+            entries={
+                str(entry.path): {
+                    "modified": entry.modified,
+                    "size": entry.size,
+                    "frontmatter": entry.frontmatter.to_json(),
+                    "instructions": entry.instructions,
+                }
+                for entry in self._entries.values()
+            },
+        )
+
+
+def _description(
+    entry: _CatalogEntry,
+) -> SkillDescription:
+    return SkillDescription(
+        name=entry.frontmatter.name,
+        description=entry.frontmatter.description,
+        path=str(entry.path),
+        meta=entry.frontmatter.metadata,
+    )
+
+
+async def _catalog_entry(
+    path: Path,
+    *,
+    persisted: Mapping[str, Any],
+    current: _CatalogEntry | None = None,
+) -> _CatalogEntry:
+    skill_file: Path = path / "SKILL.md"
+    modified: int
+    size: int
+    try:
+        modified, size = await _file_identity(skill_file)
+
+    except NotADirectoryError as exc:
+        raise ValueError(f"Skill path is not a directory: {path}") from exc
+
+    if current is not None and current.modified == modified and current.size == size:
+        return current
+
+    match persisted.get(str(path)):
+        case {
+            "modified": int() as cached_modified,
+            "size": int() as cached_size,
+            "frontmatter": str() as frontmatter,
+            "instructions": str() as instructions,
+        } if (cached_modified, cached_size) == (modified, size):
+            try:
+                return _CatalogEntry(
+                    path=path,
+                    modified=modified,
+                    size=size,
+                    frontmatter=ParsedFrontmatter.from_json(frontmatter),
+                    instructions=instructions,
+                )
+
+            except Exception as exc:
+                ctx.log_warning(f"Ignoring invalid cached skill {path}", exception=exc)
+
+        case _:
+            pass  # missing or outdated cache entry
+
+    parsed: ParsedSkillFile = await ParsedSkillFile.from_path(skill_file)
+    return _CatalogEntry(
+        path=path,
+        modified=modified,
+        size=size,
+        frontmatter=parsed.frontmatter,
+        instructions=parsed.instructions,
+    )
+
+
+@asynchronous
+def _load_cache(
+    path: Path,
+) -> Mapping[str, Any]:
+    try:
+        with open(path, mode="rb") as file:
+            loaded: Any = json.loads(file.read())
+
+    except FileNotFoundError:
+        return {}
+
+    except ValueError:
+        return {}  # treat corrupted cache as empty
+
+    if isinstance(loaded, Mapping):
+        return cast(Mapping[str, Any], loaded)
+
+    return {}  # unexpected cache structure
+
+
+@asynchronous
+def _store_cache(
+    path: Path,
+    *,
+    entries: Mapping[str, Any],
+) -> None:
+    write_atomically(path, json.dumps(entries).encode())
@@ -1,14 +1,34 @@
 import mimetypes
+import os
 import re
-from collections.abc import Iterator, Mapping, MutableSequence, Sequence
+from asyncio import gather
+from collections import OrderedDict
+from collections.abc import (
+    Callable,
+    Hashable,
+    Iterator,
+    Mapping,
+    MutableMapping,
+    MutableSequence,
+    Sequence,
+)
 from pathlib import Path, PurePosixPath
-from typing import Annotated, Self, final
+from typing import Annotated, Final, Self, cast, final
 
 import yaml
-from haiway import Directory, Files, Map, Meta, MetaValues, State, Verifier
+from haiway import (
+    Immutable,
+    Map,
+    Meta,
+    MetaValues,
+    State,
+    Verifier,
+    asynchronous,
+    execute_concurrently,
+)
 
 from draive.models import ModelInstructions
-from draive.resources import ResourceContent
+from draive.resources import ResourceContent, ResourceReference
 from draive.tools.function import tool
 from draive.tools.types import Tool
 
@@ -77,8 +97,10 @@ class SkillResource(State, serializable=True):
     ----------
     path : str
         Relative resource path in POSIX format.
-    content : ResourceContent
-        Resource payload.
+    content : ResourceContent | None, optional
+        Resource payload, ``None`` for resources loaded lazily.
+    reference : ResourceReference | None, optional
+        Local ``file://`` reference providing the payload of lazy resources.
     meta : Meta | MetaValues | None, optional
         Additional resource metadata.
     """
@@ -88,7 +110,8 @@ class SkillResource(State, serializable=True):
         cls,
         path: str,
         *,
-        content: ResourceContent,
+        content: ResourceContent | None = None,
+        reference: ResourceReference | None = None,
         meta: Meta | MetaValues | None = None,
     ) -> Self:
         """Create a skill resource with normalized path and metadata.
@@ -97,8 +120,11 @@ class SkillResource(State, serializable=True):
         ----------
         path : str
             Relative resource path in POSIX format.
-        content : ResourceContent
+        content : ResourceContent | None, optional
             Resource payload.
+        reference : ResourceReference | None, optional
+            Local ``file://`` reference read on first access when content is
+            not provided.
         meta : Meta | MetaValues | None, optional
             Additional resource metadata.
 
@@ -112,16 +138,74 @@ class SkillResource(State, serializable=True):
         ValueError
             If `path` is invalid, absolute, or traverses outside skill root.
         """
+        assert content is not None or reference is not None  # nosec: B101
         return cls(
             path=_normalize_path(path),
             content=content,
+            reference=reference,
             meta=Meta.of(meta),
         )
 
     path: str
-    content: ResourceContent
+    content: ResourceContent | None = None
+    reference: ResourceReference | None = None
     meta: Meta = Meta.empty
 
+    @property
+    def mime_type(self) -> str:
+        """Resource MIME type."""
+        if self.content is not None:
+            return self.content.mime_type
+
+        assert self.reference is not None  # nosec: B101
+        return self.reference.mime_type
+
+    @property
+    def size(self) -> int | None:
+        """Resource size in bytes, for lazy resources as of loading the skill."""
+        if self.content is not None:
+            return self.content.size
+
+        assert self.reference is not None  # nosec: B101
+        return self.reference.meta.get_int("size")
+
+    async def load(
+        self,
+        *,
+        cached: bool = True,
+    ) -> ResourceContent:
+        """Resolve resource content, reading the referenced file of lazy resources.
+
+        Parameters
+        ----------
+        cached : bool, optional
+            Whether to use the shared, size-bounded cache of loaded files.
+
+        Returns
+        -------
+        content : ResourceContent
+            Resource payload.
+
+        Raises
+        ------
+        FileNotFoundError
+            When the referenced file no longer exists.
+        ValueError
+            When the resource refers to a non-local uri.
+        """
+        if self.content is not None:
+            return self.content
+
+        assert self.reference is not None  # nosec: B101
+        if not self.reference.uri.startswith("file:"):
+            raise ValueError(f"Unsupported skill resource uri: {self.reference.uri}")
+
+        return await _load_file(
+            Path.from_uri(self.reference.uri),
+            mime_type=self.reference.mime_type,
+            cached=cached,
+        )
+
 
 @final
 class Skill(State, serializable=True):
@@ -185,13 +269,23 @@ class Skill(State, serializable=True):
         cls,
         path: Path | str,
         /,
+        *,
+        lazy: bool = False,
     ) -> Self:
         """Load a skill from a directory with `SKILL.md` and bundled files.
 
+        Bundled files are read concurrently. Loaded skills are remembered
+        together with a manifest of directory and file modification times,
+        unchanged directories are not traversed and read again.
+
         Parameters
         ----------
         path : Path | str
             Skill root directory path.
+        lazy : bool, optional
+            Whether to index bundled files as local file references with size
+            and MIME metadata instead of reading them, their content is read on
+            first access with ``SkillResource.load``.
 
         Returns
         -------
@@ -206,47 +300,56 @@ class Skill(State, serializable=True):
             frontmatter is malformed.
         """
         root_path: Path = Path(path)
-        skill_file_path: Path = root_path / "SKILL.md"
+        manifest_key: tuple[str, bool] = (str(root_path.absolute()), lazy)
+        manifest: _SkillManifest | None = _SKILL_MANIFESTS.get(manifest_key)
+        if manifest is not None and await _manifest_unchanged(manifest):
+            return cast(Self, manifest.skill)
+
         try:
-            root_entries = await Files.traverse(root_path)
+            scan: _SkillScan = await _scan_skill(root_path)
 
         except NotADirectoryError as exc:
             raise ValueError(f"Skill path is not a directory: {root_path}") from exc
 
-        root_files: tuple[Path, ...] = tuple(
-            entry.path for entry in root_entries if not isinstance(entry, Directory)
-        )
-        if skill_file_path not in root_files:
+        if scan.skill_file is None:
             raise ValueError(f"Missing SKILL.md in skill directory: {root_path}")
 
-        parsed_skill: ParsedSkillFile
-        async with Files.access(skill_file_path) as file:
-            parsed_skill = ParsedSkillFile.from_file((await file.read()).decode("utf-8"))
-
-        resources: MutableSequence[SkillResource] = []
-        for entry in await Files.traverse(root_path, recursive=True):
-            if isinstance(entry, Directory):
-                continue
+        parsed_skill: ParsedSkillFile = _parsed_skill_file(
+            scan.skill_file_path,
+            identity=scan.files[scan.skill_file_path],
+            content=scan.skill_file,
+        )
 
-            file_path: Path = entry.path
-            async with Files.access(file_path) as file:
-                mime_type: str | None
-                mime_type, _ = mimetypes.guess_type(file_path.name)
-                resources.append(
-                    SkillResource.of(
-                        file_path.relative_to(root_path).as_posix(),
-                        content=ResourceContent.of(
-                            await file.read(),
-                            mime_type=mime_type or "application/octet-stream",
-                        ),
-                    )
+        async def resource(
+            reference: ResourceReference,
+        ) -> SkillResource:
+            relative_path: str = (
+                Path.from_uri(reference.uri).relative_to(root_path.absolute()).as_posix()
+            )
+            if lazy:
+                return SkillResource.of(
+                    relative_path,
+                    reference=reference,
                 )
 
-        return cls.of(
+            return SkillResource.of(
+                relative_path,
+                content=await _load_file(
+                    Path.from_uri(reference.uri),
+                    mime_type=reference.mime_type,
+                    cached=False,
+                ),
+            )
+
+        skill: Self = cls.of(
             name=parsed_skill.frontmatter.name,
             description=parsed_skill.frontmatter.description,
             instructions=parsed_skill.instructions,
-            resources=tuple(resources),
+            resources=await execute_concurrently(
+                resource,
+                scan.references,
+                concurrent_tasks=_CONCURRENT_READS,
+            ),
             meta=Meta.of(
                 {
                     **parsed_skill.frontmatter.metadata,
@@ -254,6 +357,52 @@ class Skill(State, serializable=True):
                 }
             ),
         )
+        _SKILL_MANIFESTS.put(
+            manifest_key,
+            _SkillManifest(
+                directories=scan.directories,
+                files=scan.files,
+                skill=skill,
+            ),
+        )
+
+        return skill
+
+    @classmethod
+    def configure_cache(
+        cls,
+        *,
+        files_limit: int | None = None,
+        skills_limit: int | None = None,
+        skill_files_limit: int | None = None,
+    ) -> None:
+        """Configure limits of process-wide caches used when loading skills.
+
+        Parameters
+        ----------
+        files_limit : int | None, optional
+            Total size in bytes of resource files kept by ``SkillResource.load``,
+            32 MiB by default.
+        skills_limit : int | None, optional
+            Number of skills remembered by ``from_directory``, 256 by default.
+        skill_files_limit : int | None, optional
+            Number of parsed `SKILL.md` files kept, 256 by default.
+        """
+        if files_limit is not None:
+            _FILES_CACHE.resize(files_limit)
+
+        if skills_limit is not None:
+            _SKILL_MANIFESTS.resize(skills_limit)
+
+        if skill_files_limit is not None:
+            _PARSED_SKILL_FILES.resize(skill_files_limit)
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Drop all entries of process-wide caches used when loading skills."""
+        _FILES_CACHE.clear()
+        _SKILL_MANIFESTS.clear()
+        _PARSED_SKILL_FILES.clear()
 
     name: str
     description: str
@@ -312,6 +461,67 @@ class Skill(State, serializable=True):
         """
         return _normalize_path(path) in self.resources
 
+    async def load_resource(
+        self,
+        path: str,
+        /,
+        *,
+        cached: bool = True,
+    ) -> ResourceContent:
+        """Load resource content by a relative path-like identifier.
+
+        Parameters
+        ----------
+        path : str
+            Relative POSIX-like path. Supports `./` path segments.
+        cached : bool, optional
+            Whether to use the shared, size-bounded cache of loaded files.
+
+        Returns
+        -------
+        content : ResourceContent
+            Resource payload.
+
+        Raises
+        ------
+        SkillResourceMissing
+            When no resource exists under the normalized path or its file was removed.
+        """
+        try:
+            return await self.resource(path).load(cached=cached)
+
+        except FileNotFoundError as exc:
+            raise SkillResourceMissing(
+                self.name,
+                path=path,
+            ) from exc
+
+    async def load_resources(
+        self,
+        *paths: str,
+        cached: bool = True,
+    ) -> Sequence[ResourceContent]:
+        """Load multiple resources concurrently.
+
+        Parameters
+        ----------
+        *paths : str
+            Relative POSIX-like paths.
+        cached : bool, optional
+            Whether to use the shared, size-bounded cache of loaded files.
+
+        Returns
+        -------
+        contents : Sequence[ResourceContent]
+            Resource payloads in the order of requested paths.
+
+        Raises
+        ------
+        SkillResourceMissing
+            When any of requested resources can't be resolved.
+        """
+        return await gather(*(self.load_resource(path, cached=cached) for path in paths))
+
     def resources_tool(
         self,
         name: str = "read_resource",
@@ -338,7 +548,8 @@ class Skill(State, serializable=True):
         async def load_resource(
             path: str,
         ) -> str:
-            return self.resource(path).content.to_bytes().decode("utf-8", errors="replace")
+            content: ResourceContent = await self.load_resource(path)
+            return content.to_bytes().decode("utf-8", errors="replace")
 
         return load_resource
 
@@ -368,6 +579,40 @@ class ParsedFrontmatter(State):
 
 @final
 class ParsedSkillFile(State):
+    @classmethod
+    async def from_path(
+        cls,
+        path: Path,
+    ) -> ParsedSkillFile:
+        """Read and parse a `SKILL.md` file, reusing results for unchanged files.
+
+        Parameters
+        ----------
+        path : Path
+            Path to the `SKILL.md` file.
+
+        Returns
+        -------
+        parsed : ParsedSkillFile
+            Parsed frontmatter and instructions.
+
+        Raises
+        ------
+        ValueError
+            When frontmatter is missing or malformed.
+        """
+        key: str = str(path.absolute())
+        identity: tuple[int, int] = await _file_identity(path)
+        if parsed := _PARSED_SKILL_FILES.get((key, *identity)):
+            return parsed
+
+        modified, size, content = await _read_file(path)
+        return _parsed_skill_file(
+            key,
+            identity=(modified, size),
+            content=content,
+        )
+
     @classmethod
     def from_file(
         cls,
@@ -410,6 +655,95 @@ class ParsedSkillFile(State):
     instructions: ModelInstructions
 
 
+class _BoundedCache[Key: Hashable, Value](Immutable):
+    # least recently used entries are evicted first once total weight exceeds the limit
+    _limit: int
+    _size: int
+    _weight: Callable[[Value], int]
+    _entries: OrderedDict[Key, tuple[Value, int]]
+
+    def __init__(
+        self,
+        limit: int,
+        *,
+        weight: Callable[[Value], int] = lambda _: 1,
+    ) -> None:
+        assert limit >= 0  # nosec: B101
+        object.__setattr__(self, "_limit", limit)
+        object.__setattr__(self, "_size", 0)
+        object.__setattr__(self, "_weight", weight)
+        object.__setattr__(self, "_entries", OrderedDict())
+
+    def get(
+        self,
+        key: Key,
+    ) -> Value | None:
+        entry: tuple[Value, int] | None = self._entries.get(key)
+        if entry is None:
+            return None
+
+        self._entries.move_to_end(key)
+        return entry[0]
+
+    def put(
+        self,
+        key: Key,
+        value: Value,
+    ) -> None:
+        weight: int = self._weight(value)
+        if weight > self._limit:
+            return  # too large to be cached
+
+        size: int = self._size + weight
+        if replaced := self._entries.pop(key, None):
+            size -= replaced[1]
+
+        self._entries[key] = (value, weight)
+        object.__setattr__(self, "_size", size)
+        self._evict()
+
+    def resize(
+        self,
+        limit: int,
+    ) -> None:
+        assert limit >= 0  # nosec: B101
+        object.__setattr__(self, "_limit", limit)
+        self._evict()
+
+    def clear(self) -> None:
+        self._entries.clear()
+        object.__setattr__(self, "_size", 0)
+
+    def _evict(self) -> None:
+        size: int = self._size
+        while size > self._limit:
+            _, (_, weight) = self._entries.popitem(last=False)
+            size -= weight
+
+        object.__setattr__(self, "_size", size)
+
+
+# parsed SKILL.md files keyed by path, modification time and size
+_PARSED_SKILL_FILES: Final[_BoundedCache[tuple[str, int, int], ParsedSkillFile]] = _BoundedCache(
+    limit=256
+)
+
+
+def _parsed_skill_file(
+    path: str,
+    *,
+    identity: tuple[int, int],
+    content: bytes,
+) -> ParsedSkillFile:
+    key: tuple[str, int, int] = (path, *identity)
+    if parsed := _PARSED_SKILL_FILES.get(key):
+        return parsed
+
+    parsed = ParsedSkillFile.from_file(content.decode("utf-8"))
+    _PARSED_SKILL_FILES.put(key, parsed)
+    return parsed
+
+
 def _normalize_path(path: str) -> str:
     normalized_path: PurePosixPath = PurePosixPath(path)
 
@@ -424,3 +758,145 @@ def _normalize_path(path: str) -> str:
             raise ValueError(f"Invalid resource path: {path}")
 
     return str(normalized_path)
+
+
+class _SkillScan(Immutable):
+    directories: Mapping[str, int]
+    # modification time and size of all regular files including SKILL.md
+    files: Mapping[str, tuple[int, int]]
+    skill_file: bytes | None
+    skill_file_path: str
+    references: Sequence[ResourceReference]
+
+
+class _SkillManifest(Immutable):
+    # modification times of all skill directories catch added and removed files,
+    # file identities catch files rewritten in place
+    directories: Mapping[str, int]
+    files: Mapping[str, tuple[int, int]]
+    skill: Skill
+
+
+# loaded skills keyed by root path and laziness
+_SKILL_MANIFESTS: Final[_BoundedCache[tuple[str, bool], _SkillManifest]] = _BoundedCache(limit=256)
+# maximum number of resource files read at once
+_CONCURRENT_READS: Final[int] = 16
+
+
+@asynchronous
+def _manifest_unchanged(
+    manifest: _SkillManifest,
+) -> bool:
+    try:
+        if any(
+            os.stat(path).st_mtime_ns != modified for path, modified in manifest.directories.items()
+        ):
+            return False
+
+        for path, identity in manifest.files.items():
+            stat: os.stat_result = os.stat(path)
+            if (stat.st_mtime_ns, stat.st_size) != identity:
+                return False
+
+        return True
+
+    except OSError:
+        return False
+
+
+@asynchronous
+def _scan_skill(
+    root_path: Path,
+) -> _SkillScan:
+    root: Path = root_path.absolute()
+    directories: MutableMapping[str, int] = {str(root): os.stat(root).st_mtime_ns}
+    files: MutableMapping[str, tuple[int, int]] = {}
+    references: MutableSequence[ResourceReference] = []
+    skill_file: bytes | None = None
+    pending: MutableSequence[Path] = [root]
+    while pending:
+        directory: Path = pending.pop()
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.is_symlink():
+                    continue  # links may point outside of the skill
+
+                if entry.is_dir():
+                    pending.append(Path(entry.path))
+                    directories[entry.path] = entry.stat().st_mtime_ns
+                    continue
+
+                file_path: Path = Path(entry.path)
+                stat: os.stat_result = entry.stat()
+                files[entry.path] = (stat.st_mtime_ns, stat.st_size)
+                if file_path.relative_to(root).as_posix() == "SKILL.md":
+                    skill_file = file_path.read_bytes()
+
+                mime_type: str | None
+                mime_type, _ = mimetypes.guess_type(file_path.name)
+                references.append(
+                    ResourceReference.of(
+                        file_path.as_uri(),
+                        mime_type=mime_type or "application/octet-stream",
+                        meta={"size": stat.st_size},
+                    )
+                )
+
+    return _SkillScan(
+        directories=directories,
+        files=files,
+        skill_file=skill_file,
+        skill_file_path=str(root / "SKILL.md"),
+        references=references,
+    )
+
+
+# loaded files are shared across skills, keyed by path, modification time and size
+_FILES_CACHE: Final[_BoundedCache[tuple[str, int, int], ResourceContent]] = _BoundedCache(
+    limit=32 * 1024 * 1024,
+    weight=lambda content: content.size,
+)
+
+
+async def _load_file(
+    path: Path,
+    *,
+    mime_type: str,
+    cached: bool,
+) -> ResourceContent:
+    if cached:
+        modified, size = await _file_identity(path)
+        cached_content: ResourceContent | None = _FILES_CACHE.get((str(path), modified, size))
+        if cached_content is not None:
+            return cached_content
+
+    data: bytes
+    modified, size, data = await _read_file(path)
+    content: ResourceContent = ResourceContent.of(
+        data,
+        mime_type=mime_type,
+    )
+    if cached:
+        _FILES_CACHE.put(
+            (str(path), modified, size),
+            content,
+        )
+
+    return content
+
+
+@asynchronous
+def _file_identity(
+    path: Path,
+) -> tuple[int, int]:
+    stat: os.stat_result = os.stat(path)
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+@asynchronous
+def _read_file(
+    path: Path,
+) -> tuple[int, int, bytes]:
+    with open(path, mode="rb") as file:
+        stat: os.stat_result = os.fstat(file.fileno())
+        return (stat.st_mtime_ns, stat.st_size, file.read())
@@ -1,8 +1,13 @@
-from draive.steps.state import StepState
+from draive.steps.cache import StepCache
+from draive.steps.state import StepContext, StepState
 from draive.steps.step import Step, step
 from draive.steps.types import (
+    StepCacheEntry,
+    StepCacheLoading,
+    StepCacheStoring,
     StepException,
     StepExecuting,
+    StepGraphNode,
     StepOutputChunk,
     StepStatePreserving,
     StepStateRestoring,
@@ -11,8 +16,14 @@ from draive.steps.types import (
 
 __all__ = (
     "Step",
+    "StepCache",
+    "StepCacheEntry",
+    "StepCacheLoading",
+    "StepCacheStoring",
+    "StepContext",
     "StepException",
     "StepExecuting",
+    "StepGraphNode",
     "StepOutputChunk",
     "StepState",
     "StepStatePreserving",
@@ -0,0 +1,438 @@
+import json
+from collections.abc import Collection, Mapping, Sequence
+from hashlib import sha256
+from pathlib import Path
+from typing import Any, Self, cast, final, overload
+
+from haiway import BasicValue, Meta, State, statemethod
+from haiway.attributes import AttributesJSONEncoder
+
+from draive.models import (
+    ModelContext,
+    ModelInput,
+    ModelOutput,
+    ModelReasoningChunk,
+    ModelToolRequest,
+    ModelToolResponse,
+)
+from draive.multimodal import ArtifactContent, TextContent
+from draive.resources import ResourceContent, ResourceReference
+from draive.steps.state import StepState
+from draive.steps.types import (
+    StepCacheEntry,
+    StepCacheLoading,
+    StepCacheStoring,
+    StepOutputChunk,
+)
+from draive.utils import FileKeyedStorage, ProcessingEvent, VolatileKeyedStorage
+
+__all__ = (
+    "StepCache",
+    "decode_step_cache_entry",
+    "encode_step_cache_entry",
+    "step_state_fingerprint",
+)
+
+
+async def _none_loading(
+    key: str,
+    **extra: Any,
+) -> StepCacheEntry | None:
+    return None
+
+
+async def _noop_storing(
+    key: str,
+    entry: StepCacheEntry,
+    *,
+    expiration: float | None,
+    **extra: Any,
+) -> None:
+    pass
+
+
+@final
+class StepCache(State):
+    """Storage backend for recorded step executions used by ``Step.with_cache``.
+
+    The default instance does not cache anything. Convenience constructors
+    supply in-memory and file-backed implementations, Postgres storage is
+    available through ``draive.postgres.PostgresStepCache``.
+    """
+
+    @classmethod
+    def volatile(
+        cls,
+        *,
+        limit: int = 128,
+    ) -> Self:
+        """Create an in-memory LRU cache.
+
+        Parameters
+        ----------
+        limit : int, optional
+            Maximum number of entries kept at once. Least recently used entries
+            are evicted first.
+
+        Returns
+        -------
+        Self
+            Cache backed by process-local storage.
+        """
+        assert limit > 0  # nosec: B101
+        storage: VolatileKeyedStorage[StepCacheEntry] = VolatileKeyedStorage(limit)
+
+        return cls(
+            loading=storage.loading,
+            storing=storage.storing,
+            meta=Meta({"source": "volatile"}),
+        )
+
+    @classmethod
+    def file(
+        cls,
+        path: Path | str,
+    ) -> Self:
+        """Create a cache storing each entry as a JSON file in a directory.
+
+        Parameters
+        ----------
+        path : Path | str
+            Directory used to persist cache entries. Created when missing.
+
+        Returns
+        -------
+        Self
+            Cache backed by the given directory.
+        """
+        storage: FileKeyedStorage[StepCacheEntry] = FileKeyedStorage(
+            path,
+            encoding=encode_step_cache_entry,
+            decoding=decode_step_cache_entry,
+        )
+
+        return cls(
+            loading=storage.loading,
+            storing=storage.storing,
+            meta=Meta({"source": str(path)}),
+        )
+
+    @overload
+    @classmethod
+    async def load(
+        cls,
+        key: str,
+        /,
+        **extra: Any,
+    ) -> StepCacheEntry | None: ...
+
+    @overload
+    async def load(
+        self,
+        key: str,
+        /,
+        **extra: Any,
+    ) -> StepCacheEntry | None: ...
+
+    @statemethod
+    async def load(
+        self,
+        key: str,
+        /,
+        **extra: Any,
+    ) -> StepCacheEntry | None:
+        """Load a recorded execution.
+
+        Parameters
+        ----------
+        key : str
+            Fingerprint of the execution input.
+        **extra : Any
+            Extra arguments forwarded to the underlying loading callable.
+
+        Returns
+        -------
+        StepCacheEntry | None
+            Recorded execution or ``None`` when missing or expired.
+        """
+        return await self._loading(
+            key,
+            **extra,
+        )
+
+    @overload
+    @classmethod
+    async def store(
+        cls,
+        key: str,
+        /,
+        entry: StepCacheEntry,
+        *,
+        expiration: float | None = None,
+        **extra: Any,
+    ) -> None: ...
+
+    @overload
+    async def store(
+        self,
+        key: str,
+        /,
+        entry: StepCacheEntry,
+        *,
+        expiration: float | None = None,
+        **extra: Any,
+    ) -> None: ...
+
+    @statemethod
+    async def store(
+        self,
+        key: str,
+        /,
+        entry: StepCacheEntry,
+        *,
+        expiration: float | None = None,
+        **extra: Any,
+    ) -> None:
+        """Store a recorded execution.
+
+        Parameters
+        ----------
+        key : str
+            Fingerprint of the execution input.
+        entry : StepCacheEntry
+            Recorded execution.
+        expiration : float | None, optional
+            Lifetime of the entry in seconds, ``None`` keeps it until evicted.
+        **extra : Any
+            Extra arguments forwarded to the underlying storing callable.
+        """
+        await self._storing(
+            key,
+            entry,
+            expiration=expiration,
+            **extra,
+        )
+
+    _loading: StepCacheLoading
+    _storing: StepCacheStoring
+    meta: Meta
+
+    def __init__(
+        self,
+        loading: StepCacheLoading = _none_loading,
+        storing: StepCacheStoring = _noop_storing,
+        meta: Meta = Meta.empty,
+    ) -> None:
+        super().__init__(
+            _loading=loading,
+            _storing=storing,
+            meta=meta,
+        )
+
+
+def step_state_fingerprint(
+    state: StepState,
+    /,
+    *,
+    key: str,
+    context: bool = True,
+    artifacts: Collection[str] | None = None,
+) -> str:
+    """Compute a stable fingerprint of the selected parts of a step state.
+
+    Parameters
+    ----------
+    state : StepState
+        State to fingerprint.
+    key : str
+        Namespace distinguishing cached steps from each other.
+    context : bool, optional
+        Whether model context elements are included.
+    artifacts : Collection[str] | None, optional
+        Artifact keys included in the fingerprint, ``None`` includes all
+        available artifacts.
+
+    Returns
+    -------
+    str
+        Hex encoded SHA-256 digest.
+    """
+    hasher = sha256(key.encode())
+    if context:
+        for element in state.context:
+            hasher.update(b"\x1e")
+            hasher.update(_json_bytes(element.to_mapping(recursive=True)))
+
+    hasher.update(b"\x1d")
+    for name in sorted(state.artifacts if artifacts is None else artifacts):
+        hasher.update(b"\x1e")
+        hasher.update(name.encode())
+        hasher.update(b"\x1f")
+        artifact: ArtifactContent | None = state.artifacts.get(name)
+        if artifact is not None:
+            hasher.update(_json_bytes(artifact.to_mapping(recursive=True)))
+
+    return hasher.hexdigest()
+
+
+_CHUNK_TYPES: Mapping[str, type[State]] = {
+    "text": TextContent,
+    "resource_reference": ResourceReference,
+    "resource": ResourceContent,
+    "artifact": ArtifactContent,
+    "reasoning": ModelReasoningChunk,
+    "tool_request": ModelToolRequest,
+    "tool_response": ModelToolResponse,
+    "event": ProcessingEvent,
+}
+
+
+def encode_step_cache_entry(
+    entry: StepCacheEntry,
+    /,
+) -> str:
+    """Serialize a cache entry into JSON.
+
+    Parameters
+    ----------
+    entry : StepCacheEntry
+        Entry to serialize.
+
+    Returns
+    -------
+    str
+        JSON representation accepted by ``decode_step_cache_entry``.
+    """
+    return json.dumps(
+        {
+            "chunks": [_encoded_chunk(chunk) for chunk in entry.chunks],
+            "appended_context": _encoded_context(entry.appended_context),
+            "replaced_context": (
+                _encoded_context(entry.replaced_context)
+                if entry.replaced_context is not None
+                else None
+            ),
+            "artifacts": {
+                key: artifact.to_mapping(recursive=True)
+                for key, artifact in entry.artifacts.items()
+            },
+            "removed_artifacts": list(entry.removed_artifacts),
+        },
+        cls=AttributesJSONEncoder,
+    )
+
+
+def decode_step_cache_entry(
+    payload: str | bytes,
+    /,
+) -> StepCacheEntry:
+    """Deserialize a cache entry from JSON.
+
+    Parameters
+    ----------
+    payload : str | bytes
+        JSON produced by ``encode_step_cache_entry``.
+
+    Returns
+    -------
+    StepCacheEntry
+        Decoded cache entry.
+
+    Raises
+    ------
+    ValueError
+        When the payload does not describe a valid cache entry.
+    """
+    match json.loads(payload):
+        case {
+            "chunks": [*chunks],
+            "appended_context": [*appended_context],
+            "replaced_context": [*_] | None as replaced_context,
+            "artifacts": {**artifacts},
+            "removed_artifacts": [*removed_artifacts],
+        }:
+            return StepCacheEntry(
+                chunks=tuple(_decoded_chunk(chunk) for chunk in chunks),
+                appended_context=_decoded_context(appended_context),
+                replaced_context=(
+                    _decoded_context(replaced_context) if replaced_context is not None else None
+                ),
+                artifacts={
+                    key: ArtifactContent.from_mapping(artifact)
+                    for key, artifact in artifacts.items()
+                },
+                removed_artifacts=tuple(str(key) for key in removed_artifacts),
+            )
+
+        case _:
+            raise ValueError("Invalid step cache entry")
+
+
+def _json_bytes(
+    value: Mapping[str, BasicValue],
+    /,
+) -> bytes:
+    return json.dumps(
+        value,
+        cls=AttributesJSONEncoder,
+        sort_keys=True,
+    ).encode()
+
+
+def _encoded_chunk(
+    chunk: StepOutputChunk,
+    /,
+) -> Mapping[str, Any]:
+    for kind, chunk_type in _CHUNK_TYPES.items():
+        if isinstance(chunk, chunk_type):
+            assert isinstance(chunk, State)  # nosec: B101
+            return {
+                "kind": kind,
+                "value": chunk.to_mapping(recursive=True),
+            }
+
+    raise ValueError(f"Unsupported step output chunk: {type(chunk)!r}")
+
+
+def _decoded_chunk(
+    chunk: Any,
+    /,
+) -> StepOutputChunk:
+    match chunk:
+        case {"kind": str() as kind, "value": {**value}} if kind in _CHUNK_TYPES:
+            return cast(StepOutputChunk, _CHUNK_TYPES[kind].from_mapping(value))
+
+        case _:
+            raise ValueError("Invalid step cache entry chunk")
+
+
+def _encoded_context(
+    context: ModelContext,
+    /,
+) -> Sequence[Mapping[str, Any]]:
+    return [
+        {
+            "kind": "input" if isinstance(element, ModelInput) else "output",
+            "value": element.to_mapping(recursive=True),
+        }
+        for element in context
+    ]
+
+
+def _decoded_context(
+    context: Sequence[Any],
+    /,
+) -> ModelContext:
+    decoded: list[ModelInput | ModelOutput] = []
+    for element in context:
+        match element:
+            case {"kind": "input", "value": {**value}}:
+                decoded.append(ModelInput.from_mapping(value))
+
+            case {"kind": "output", "value": {**value}}:
+                decoded.append(ModelOutput.from_mapping(value))
+
+            case _:
+                raise ValueError("Invalid step cache entry context")
+
+    return tuple(decoded)
@@ -1,13 +1,271 @@
-from collections.abc import Mapping
-from typing import Literal, Self, overload
-
-from haiway import State
+from abc import ABCMeta
+from collections.abc import Iterator, Mapping, Sequence
+from typing import (
+    TYPE_CHECKING,
+    Annotated,
+    Any,
+    ClassVar,
+    Final,
+    Literal,
+    Self,
+    cast,
+    final,
+    overload,
+)
+
+from haiway import State, Validator
 
 from draive.models import ModelContext
 from draive.models.types import ModelContextElement
 from draive.multimodal import ArtifactContent
 
-__all__ = ("StepState",)
+__all__ = (
+    "StepContext",
+    "StepState",
+)
+
+_CONTEXT_CHUNK_SIZE: Final[int] = 32
+
+if TYPE_CHECKING:
+    _ContextSequence = Sequence[ModelContextElement]
+
+else:  # State metaclass can't be mixed with ABCMeta, Sequence is registered below
+    _ContextSequence = object
+
+
+@final
+class StepContext(State, _ContextSequence, serializable=True):
+    """Persistent, append-optimized model context used by ``StepState``.
+
+    Elements are kept in a chain of immutable chunks where each instance
+    shares its sealed predecessor instead of copying it. Appending copies at
+    most a single bounded trailing chunk, keeping long step pipelines linear
+    while the value still behaves as an immutable ``ModelContext`` sequence.
+
+    Attributes
+    ----------
+    prefix : StepContext | None
+        Shared context preceding ``elements``.
+    elements : ModelContext
+        Trailing context elements owned by this instance.
+    """
+
+    empty: ClassVar[Self]  # defined after the class
+
+    @classmethod
+    def of(
+        cls,
+        context: ModelContext = (),
+        /,
+    ) -> Self:
+        """Create persistent context from any context sequence.
+
+        Parameters
+        ----------
+        context : ModelContext, optional
+            Context elements in order. Existing ``StepContext`` instances are
+            returned as-is.
+
+        Returns
+        -------
+        Self
+            Persistent context containing provided elements.
+        """
+        if isinstance(context, cls):
+            return context
+
+        if not context:
+            return cls.empty
+
+        return cls(elements=tuple(context))
+
+    prefix: StepContext | None = None
+    elements: ModelContext = ()
+    _length: int = 0
+
+    def __init__(
+        self,
+        prefix: StepContext | None = None,
+        elements: ModelContext = (),
+    ) -> None:
+        super().__init__(
+            prefix=prefix,
+            elements=elements,
+            # total length is derived to keep instances consistent
+            _length=(prefix._length if prefix is not None else 0) + len(elements),
+        )
+
+    def __replace__(
+        self,
+        **kwargs: Any,
+    ) -> Self:
+        return self.__class__(
+            prefix=kwargs.get("prefix", self.prefix),
+            elements=kwargs.get("elements", self.elements),
+        )
+
+    def to_mapping(
+        self,
+        recursive: bool = True,
+    ) -> Mapping[str, Any]:
+        # serialized flat, sharing is an in-memory optimization only
+        if recursive:
+            return {"elements": [element.to_mapping(recursive=True) for element in self]}
+
+        return {"elements": tuple(self)}
+
+    def appending(
+        self,
+        *elements: ModelContextElement,
+    ) -> Self:
+        """Return context extended with additional elements.
+
+        Parameters
+        ----------
+        *elements : ModelContextElement
+            Context elements appended in order.
+
+        Returns
+        -------
+        Self
+            Extended context sharing the current structure. Returns ``self``
+            when no elements are given.
+        """
+        if not elements:
+            return self
+
+        if not self._length:
+            return self.__class__(elements=elements)
+
+        if len(self.elements) + len(elements) <= _CONTEXT_CHUNK_SIZE:
+            # extend trailing chunk, the prefix remains shared
+            return self.__class__(
+                prefix=self.prefix,
+                elements=(*self.elements, *elements),
+            )
+
+        # seal current instance and share it as a new prefix
+        return self.__class__(
+            prefix=self,
+            elements=elements,
+        )
+
+    def _chunks(self) -> Sequence[ModelContext]:
+        chunks: list[ModelContext] = []
+        current: StepContext | None = self
+        while current is not None:
+            if current.elements:
+                chunks.append(current.elements)
+
+            current = current.prefix
+
+        chunks.reverse()
+        return chunks
+
+    def __iter__(self) -> Iterator[ModelContextElement]:
+        for chunk in self._chunks():
+            yield from chunk
+
+    def __reversed__(self) -> Iterator[ModelContextElement]:
+        current: StepContext | None = self
+        while current is not None:
+            yield from reversed(current.elements)
+            current = current.prefix
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __bool__(self) -> bool:
+        return self._length > 0
+
+    @overload
+    def __getitem__(
+        self,
+        index: int,
+    ) -> ModelContextElement: ...
+
+    @overload
+    def __getitem__(
+        self,
+        index: slice,
+    ) -> ModelContext: ...
+
+    def __getitem__(
+        self,
+        index: int | slice,
+    ) -> ModelContextElement | ModelContext:
+        if isinstance(index, slice):
+            return tuple(self)[index]
+
+        position: int = index + self._length if index < 0 else index
+        if position < 0 or position >= self._length:
+            raise IndexError("StepContext index out of range")
+
+        offset: int = self._length
+        current: StepContext | None = self
+        while current is not None:
+            offset -= len(current.elements)
+            if position >= offset:
+                return current.elements[position - offset]
+
+            current = current.prefix
+
+        raise IndexError("StepContext index out of range")
+
+    def __contains__(
+        self,
+        value: object,
+    ) -> bool:
+        return any(value in chunk for chunk in self._chunks())
+
+    def index(
+        self,
+        value: Any,
+        start: int = 0,
+        stop: int | None = None,
+    ) -> int:
+        return tuple(self).index(value, start, self._length if stop is None else stop)
+
+    def count(
+        self,
+        value: Any,
+    ) -> int:
+        return sum(chunk.count(value) for chunk in self._chunks())
+
+    def __eq__(
+        self,
+        other: object,
+    ) -> bool:
+        if other is self:
+            return True
+
+        if not isinstance(other, Sequence) or isinstance(other, str | bytes):
+            return False
+
+        if len(other) != self._length:  # pyright: ignore[reportUnknownArgumentType]
+            return False
+
+        return all(
+            element == other_element
+            for element, other_element in zip(self, other, strict=True)  # pyright: ignore[reportUnknownVariableType, reportUnknownArgumentType]
+        )
+
+    def __hash__(self) -> int:
+        return hash(tuple(self))
+
+
+StepContext.empty = StepContext()
+cast(ABCMeta, Sequence).register(StepContext)
+
+
+def _validated_context(
+    value: Any,
+) -> Any:
+    # accept plain context sequences, including flat serialized context
+    if isinstance(value, StepContext | Mapping) or not isinstance(value, Sequence):
+        return cast(Any, value)
+
+    return {"elements": cast(Sequence[Any], value)}
 
 
 class StepState(State, serializable=True):
@@ -19,8 +277,9 @@ class StepState(State, serializable=True):
 
     Attributes
     ----------
-    context : ModelContext
+    context : StepContext
         Ordered model context elements accumulated for downstream processing.
+        Stored as a persistent sequence so appending shares existing elements.
     artifacts : Mapping[str, ArtifactContent]
         Named artifact payloads available to subsequent steps.
     """
@@ -53,16 +312,27 @@ class StepState(State, serializable=True):
             Newly constructed step state instance.
         """
         return cls(
-            context=context,
+            context=StepContext.of(context),
             artifacts={
                 **{item.__class__.__name__: ArtifactContent.of(item) for item in artifacts},
                 **{key: ArtifactContent.of(value) for key, value in keyed_artifacts.items()},
             },
         )
 
-    context: ModelContext = ()
+    context: Annotated[StepContext, Validator(_validated_context)] = StepContext.empty
     artifacts: Mapping[str, ArtifactContent]
 
+    def to_mapping(
+        self,
+        recursive: bool = True,
+    ) -> Mapping[str, Any]:
+        mapping: Mapping[str, Any] = super().to_mapping(recursive=recursive)
+        # keep context serialized as a plain list of elements
+        return {
+            **mapping,
+            "context": mapping["context"]["elements"] if recursive else self.context,
+        }
+
     @overload
     def get[Content: State](
         self,
@@ -197,12 +467,13 @@ class StepState(State, serializable=True):
         -------
         Self
             Updated state instance. Returns ``self`` when no elements are given.
+            Existing context elements are shared, not copied.
         """
         if not elements:
             return self
 
         return self.updating(
-            context=(*self.context, *elements),
+            context=self.context.appending(*elements),
         )
 
     def replacing_context(
@@ -222,4 +493,4 @@ class StepState(State, serializable=True):
             Updated state instance. Returns ``self`` when ``context`` is empty.
         """
 
-        return self.updating(context=context)
+        return self.updating(context=StepContext.of(context))
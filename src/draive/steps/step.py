@@ -1,4 +1,4 @@
-from asyncio import ALL_COMPLETED, Task, sleep, wait
+from asyncio import FIRST_COMPLETED, Task, sleep, wait
 from collections.abc import (
     AsyncIterable,
     AsyncIterator,
@@ -6,12 +6,14 @@ from collections.abc import (
     Collection,
     Coroutine,
     Iterable,
+    Iterator,
     Mapping,
     MutableSequence,
     Sequence,
 )
+from heapq import heappop, heappush
 from inspect import iscoroutinefunction
-from typing import Any, ClassVar, NoReturn, Protocol, Self, final, overload, runtime_checkable
+from typing import Any, ClassVar, NoReturn, Protocol, Self, cast, final, overload, runtime_checkable
 
 from haiway import (
     AsyncStream,
@@ -54,12 +56,16 @@ from draive.multimodal import (
     Template,
     TemplatesRepository,
 )
-from draive.steps.state import StepState
+from draive.steps.cache import StepCache, step_state_fingerprint
+from draive.steps.state import StepContext, StepState
 from draive.steps.types import (
+    StepCacheEntry,
     StepConditionVerifying,
     StepContextMutating,
     StepException,
     StepExecuting,
+    StepFolding,
+    StepGraphNode,
     StepLoopConditionVerifying,
     StepMerging,
     StepOutputChunk,
@@ -203,12 +209,7 @@ class Step:
         async def step(
             state: StepState,
         ) -> StepStream:
-            yield state.updating(
-                context=(
-                    *state.context,
-                    *elements,
-                )
-            )
+            yield state.appending_context(*elements)
 
         return cls(step)
 
@@ -239,14 +240,15 @@ class Step:
             async def step(
                 state: StepState,
             ) -> StepStream:
-                yield state.updating(context=await context())
+                yield state.replacing_context(await context())
 
         else:
+            step_context: StepContext = StepContext.of(cast(ModelContext, context))
 
             async def step(
                 state: StepState,
             ) -> StepStream:
-                yield state.updating(context=context)
+                yield state.updating(context=step_context)
 
         return cls(step)
 
@@ -276,9 +278,7 @@ class Step:
         async def step(
             state: StepState,
         ) -> StepStream:
-            yield state.updating(
-                context=await mutation(state.context),
-            )
+            yield state.replacing_context(await mutation(state.context))
 
         return cls(step)
 
@@ -578,34 +578,56 @@ class Step:
         return cls(step)
 
     @classmethod
-    def concurrent(
+    def concurrent(  # noqa: C901, PLR0915
         cls,
         *steps: Self | StepExecuting,
-        merge: StepMerging,
+        merge: StepMerging | None = None,
+        fold: StepFolding | None = None,
+        concurrent_tasks: int | None = None,
+        sufficient: StepConditionVerifying | None = None,
     ) -> Self:
         """Run branch steps concurrently and merge resulting states.
 
+        Exactly one of ``merge`` or ``fold`` has to be provided. ``merge``
+        receives all completed branch states at once in declaration order,
+        ``fold`` incorporates each branch state into an accumulator as soon as
+        the branch completes, without holding completed branch states.
+
         Parameters
         ----------
         *steps : Self | StepExecuting
             Branch steps or raw step callables.
-        merge : StepMerging
+        merge : StepMerging | None
             Async callable receiving all completed branch states and returning
             the merged state.
+        fold : StepFolding | None
+            Async callable receiving the accumulated state (initially the input
+            state) and a completed branch state, returning the new accumulated
+            state. Branches are folded in completion order.
+        concurrent_tasks : int | None
+            Maximum number of branches executed at once, ``None`` runs all
+            branches at once.
+        sufficient : StepConditionVerifying | None
+            Optional predicate checked against each completed branch state.
+            When it passes, branches still running are cancelled and all
+            branches completed by then are merged.
 
         Returns
         -------
         Self
             A concurrent branch step, or ``Step.noop`` for empty branches.
         """
+        assert (merge is None) != (fold is None)  # nosec: B101
+        assert concurrent_tasks is None or concurrent_tasks > 0  # nosec: B101
         if not steps:
             return cls.noop
 
         executions: Sequence[StepExecuting] = tuple(
             step._executing if isinstance(step, Step) else step for step in steps
         )
+        tasks_limit: int = min(concurrent_tasks or len(executions), len(executions))
 
-        async def step(
+        async def step(  # noqa: C901, PLR0915
             state: StepState,
         ) -> StepStream:
             async with ctx.scope("step.concurrent"):
@@ -626,23 +648,82 @@ class Step:
                         return state
 
                 async with ContextTaskGroup():  # local task group for more granular management
-                    branches: Sequence[Task[StepState]] = [
-                        ctx.spawn(branch, state, execution) for execution in executions
-                    ]
+                    pending: Iterator[tuple[int, StepExecuting]] = iter(enumerate(executions))
+                    running: dict[Task[StepState], int] = {}
+
+                    def spawn_next() -> None:
+                        next_branch: tuple[int, StepExecuting] | None = next(pending, None)
+                        if next_branch is None:
+                            return  # nothing left to run
+
+                        index, execution = next_branch
+                        running[ctx.spawn(branch, state, execution)] = index
 
-                    async def merge_branches() -> StepState:
+                    async def merge_branches() -> StepState:  # noqa: C901, PLR0912
+                        completed: dict[int, StepState] = {}
+                        accumulated: StepState = state
                         try:
-                            await wait(
-                                branches,
-                                return_when=ALL_COMPLETED,
-                            )
+                            for _ in range(tasks_limit):
+                                spawn_next()
+
+                            while running:
+                                done, _ = await wait(
+                                    running,
+                                    return_when=FIRST_COMPLETED,
+                                )
+
+                                stop: bool = False
+                                # process in declaration order for determinism
+                                for task in sorted(done, key=running.__getitem__):
+                                    index: int = running.pop(task)
+                                    branch_state: StepState = task.result()
+
+                                    if fold is not None:
+                                        accumulated = await fold(
+                                            accumulated=accumulated,
+                                            branch=branch_state,
+                                        )
+
+                                    else:
+                                        completed[index] = branch_state
+
+                                    # keep processing the batch, branches already
+                                    # finished are merged even after sufficient passes
+                                    if (
+                                        not stop
+                                        and sufficient is not None
+                                        and await sufficient(state=branch_state)
+                                    ):
+                                        stop = True
+
+                                if stop:
+                                    break
+
+                                while len(running) < tasks_limit:
+                                    running_count: int = len(running)
+                                    spawn_next()
+                                    if len(running) == running_count:
+                                        break  # no more branches
+
                             output_stream.finish()
 
                         except BaseException as exc:
                             output_stream.finish(exc)
                             raise  # reraise original
 
-                        return await merge(branches=(branch.result() for branch in branches))
+                        finally:
+                            for task in running:
+                                task.cancel()
+
+                            if running:
+                                await wait(running)
+
+                        if merge is not None:
+                            return await merge(
+                                branches=(completed[index] for index in sorted(completed))
+                            )
+
+                        return accumulated
 
                     merged: Task[StepState] = ctx.spawn(merge_branches)
                     async for chunk in output_stream:
@@ -652,6 +733,164 @@ class Step:
 
         return cls(step)
 
+    @classmethod
+    def graph(  # noqa: C901, PLR0915
+        cls,
+        *nodes: StepGraphNode,
+        concurrent_tasks: int | None = None,
+    ) -> Self:
+        """Run steps as a dependency graph derived from declared artifacts.
+
+        Nodes declare artifacts they read and write (see ``Step.graph_node``).
+        A node depends on every preceding node writing an artifact it reads or
+        writes, and on every preceding node reading an artifact it writes.
+        Nodes without pending dependencies run concurrently. Artifact results
+        match executing all nodes sequentially in declaration order as long as
+        nodes write and remove only their declared output artifacts, any other
+        artifact change fails the graph.
+
+        Declared output artifacts are merged deterministically. Context elements
+        appended by nodes are added to the resulting context in declaration
+        order, nodes see only the initial context, which differs from
+        sequential execution where each step sees context appended before.
+
+        Parameters
+        ----------
+        *nodes : StepGraphNode
+            Graph nodes in their logical (sequential) order.
+        concurrent_tasks : int | None
+            Maximum number of nodes executed at once, ``None`` runs all ready
+            nodes at once.
+
+        Returns
+        -------
+        Self
+            A step executing the graph, or ``Step.noop`` when no nodes are
+            provided.
+
+        Raises
+        ------
+        StepException
+            When a node modifies context other than by appending elements or
+            changes artifacts not declared as its outputs.
+        """
+        assert concurrent_tasks is None or concurrent_tasks > 0  # nosec: B101
+        if not nodes:
+            return cls.noop
+
+        dependents: Sequence[MutableSequence[int]] = tuple([] for _ in nodes)
+        dependencies_count: MutableSequence[int] = [0 for _ in nodes]
+        for index, node in enumerate(nodes):
+            for previous_index, previous in enumerate(nodes[:index]):
+                if (
+                    previous.outputs & (node.inputs | node.outputs)
+                    or previous.inputs & node.outputs
+                ):
+                    dependents[previous_index].append(index)
+                    dependencies_count[index] += 1
+
+        tasks_limit: int = min(concurrent_tasks or len(nodes), len(nodes))
+
+        async def step(  # noqa: C901
+            state: StepState,
+        ) -> StepStream:
+            async with ctx.scope("step.graph"):
+                output_stream: AsyncStream[StepOutputChunk] = AsyncStream()
+
+                async def execute_node(
+                    state: StepState,
+                    execution: StepExecuting,
+                ) -> StepState:
+                    async with ctx.scope("step.graph.node"):
+                        async for chunk in execution(state=state):
+                            if isinstance(chunk, StepState):
+                                state = chunk
+
+                            else:
+                                await output_stream.send(chunk)
+
+                        return state
+
+                async with ContextTaskGroup():  # local task group for more granular management
+
+                    async def execute_graph() -> StepState:  # noqa: C901
+                        artifacts: dict[str, ArtifactContent] = dict(state.artifacts)
+                        appended_context: dict[int, ModelContext] = {}
+                        remaining: MutableSequence[int] = list(dependencies_count)
+                        ready: list[int] = [
+                            index for index, count in enumerate(remaining) if count == 0
+                        ]
+                        running: dict[Task[StepState], tuple[int, StepState]] = {}
+                        try:
+                            while ready or running:
+                                while ready and len(running) < tasks_limit:
+                                    index: int = heappop(ready)
+                                    node_input: StepState = state.updating(
+                                        artifacts=dict(artifacts)
+                                    )
+                                    running[
+                                        ctx.spawn(
+                                            execute_node,
+                                            node_input,
+                                            nodes[index].executing,
+                                        )
+                                    ] = (index, node_input)
+
+                                done, _ = await wait(
+                                    running,
+                                    return_when=FIRST_COMPLETED,
+                                )
+
+                                # process in declaration order for determinism
+                                for task in sorted(done, key=lambda task: running[task][0]):
+                                    index, node_input = running.pop(task)
+                                    changes: StepCacheEntry = _node_changes(
+                                        nodes[index],
+                                        initial=node_input,
+                                        final=task.result(),
+                                    )
+                                    appended_context[index] = changes.appended_context
+
+                                    for key in sorted(changes.artifacts):
+                                        artifacts[key] = changes.artifacts[key]
+
+                                    for key in changes.removed_artifacts:
+                                        artifacts.pop(key, None)
+
+                                    for dependent in dependents[index]:
+                                        remaining[dependent] -= 1
+                                        if remaining[dependent] == 0:
+                                            heappush(ready, dependent)
+
+                            output_stream.finish()
+
+                        except BaseException as exc:
+                            output_stream.finish(exc)
+                            raise  # reraise original
+
+                        finally:
+                            for task in running:
+                                task.cancel()
+
+                            if running:
+                                await wait(running)
+
+                        return state.updating(artifacts=artifacts).appending_context(
+                            *(
+                                element
+                                for index in sorted(appended_context)
+                                for element in appended_context[index]
+                            )
+                        )
+
+                    executed: Task[StepState] = ctx.spawn(execute_graph)
+                    async for chunk in output_stream:
+                        yield chunk
+
+                    yield await executed
+
+        return cls(step)
+
     @classmethod
     def generating_completion(  # noqa: C901
         cls,
@@ -1075,6 +1314,34 @@ class Step:
             executing,
         )
 
+    def graph_node(
+        self,
+        *,
+        inputs: Collection[type[State] | str] = (),
+        outputs: Collection[type[State] | str] = (),
+    ) -> StepGraphNode:
+        """Declare this step as a ``Step.graph`` node.
+
+        Parameters
+        ----------
+        inputs : Collection[type[State] | str]
+            Artifacts read by this step, given as artifact types (keyed by
+            class name like in ``StepState.get``) or explicit keys.
+        outputs : Collection[type[State] | str]
+            Artifacts written by this step, given as artifact types or
+            explicit keys.
+
+        Returns
+        -------
+        StepGraphNode
+            Graph node executing this step.
+        """
+        return StepGraphNode(
+            executing=self._executing,
+            inputs=frozenset(_artifact_key(item) for item in inputs),
+            outputs=frozenset(_artifact_key(item) for item in outputs),
+        )
+
     def with_ctx(
         self,
         *ctx_state: State,
@@ -1270,6 +1537,103 @@ class Step:
 
         return self.__class__(step)
 
+    def with_cache(
+        self,
+        key: str,
+        /,
+        *,
+        context: bool = True,
+        artifacts: Collection[str] | None = None,
+        fingerprint: Callable[[StepState], str] | None = None,
+        expiration: float | None = None,
+        cache: StepCache | None = None,
+    ) -> Self:
+        """Replay recorded execution when the same input state was seen before.
+
+        The incoming state is fingerprinted using the selected context and
+        artifacts. On a cache hit recorded output chunks are emitted again and
+        recorded state changes are applied without executing the step. On a
+        miss the step executes normally and its result is recorded.
+
+        Parameters
+        ----------
+        key : str
+            Namespace distinguishing this step from other cached steps.
+        context : bool
+            Whether model context is part of the fingerprint.
+        artifacts : Collection[str] | None
+            Artifact keys included in the fingerprint, ``None`` includes all.
+        fingerprint : Callable[[StepState], str] | None
+            Custom fingerprint function replacing the default one, its result
+            is still namespaced by ``key``.
+        expiration : float | None
+            Lifetime of recorded entries in seconds, ``None`` for no expiration.
+        cache : StepCache | None
+            Cache backend to use, defaults to ``StepCache`` from the current
+            context scope.
+
+        Returns
+        -------
+        Self
+            A step wrapper replaying recorded executions.
+        """
+        executing: StepExecuting = self._executing
+
+        async def step(
+            state: StepState,
+        ) -> StepStream:
+            async with ctx.scope("step.cache"):
+                step_cache: StepCache = cache if cache is not None else ctx.state(StepCache)
+                cache_key: str = (
+                    f"{key}:{fingerprint(state)}"
+                    if fingerprint is not None
+                    else step_state_fingerprint(
+                        state,
+                        key=key,
+                        context=context,
+                        artifacts=artifacts,
+                    )
+                )
+
+                cached: StepCacheEntry | None = await step_cache.load(cache_key)
+                if cached is not None:
+                    ctx.log_debug("Replaying cached step execution")
+                    for chunk in cached.chunks:
+                        yield chunk
+
+                    yield cached.replaying(state)
+                    return  # replayed
+
+                current: StepState = state
+                chunks: MutableSequence[StepOutputChunk] = []
+                async for chunk in executing(state=state):
+                    yield chunk
+
+                    if isinstance(chunk, StepState):
+                        current = chunk
+
+                    else:
+                        chunks.append(chunk)
+
+                try:
+                    await step_cache.store(
+                        cache_key,
+                        StepCacheEntry.recorded(
+                            initial=state,
+                            final=current,
+                            chunks=chunks,
+                        ),
+                        expiration=expiration,
+                    )
+
+                except Exception as exc:  # the step already completed, caching is best effort
+                    ctx.log_warning(
+                        "Failed to store step cache entry, skipping...",
+                        exception=exc,
+                    )
+
+        return self.__class__(step)
+
     def with_isolated_context(
         self,
         context: Callable[[], Coroutine[None, None, ModelContext]] | ModelContext = (),
@@ -1300,7 +1664,7 @@ class Step:
             async def step(
                 state: StepState,
             ) -> StepStream:
-                async for chunk in executing(state=state.updating(context=await context())):
+                async for chunk in executing(state=state.replacing_context(await context())):
                     if isinstance(chunk, StepState):
                         yield chunk.updating(context=state.context)
 
@@ -1308,11 +1672,12 @@ class Step:
                         yield chunk
 
         else:
+            isolated_context: StepContext = StepContext.of(cast(ModelContext, context))
 
             async def step(
                 state: StepState,
             ) -> StepStream:
-                async for chunk in executing(state=state.updating(context=context)):
+                async for chunk in executing(state=state.updating(context=isolated_context)):
                     if isinstance(chunk, StepState):
                         yield chunk.updating(context=state.context)
 
@@ -1373,7 +1738,7 @@ class Step:
                         element for element in chunk.context if not element.contains_tools
                     )
                     if chunk.context != updated:
-                        yield chunk.updating(context=updated)
+                        yield chunk.replacing_context(updated)
 
                 else:
                     yield chunk
@@ -1861,6 +2226,44 @@ def step(
     return Step(executing)
 
 
+def _artifact_key(
+    artifact: type[State] | str,
+    /,
+) -> str:
+    if isinstance(artifact, str):
+        return artifact
+
+    return artifact.__name__
+
+
+def _node_changes(
+    node: StepGraphNode,
+    /,
+    *,
+    initial: StepState,
+    final: StepState,
+) -> StepCacheEntry:
+    changes: StepCacheEntry = StepCacheEntry.recorded(
+        initial=initial,
+        final=final,
+        chunks=(),
+    )
+    if changes.replaced_context is not None:
+        raise StepException(
+            "Graph nodes can only append elements to the context",
+            state=final,
+        )
+
+    undeclared: set[str] = (set(changes.artifacts) | set(changes.removed_artifacts)) - node.outputs
+    if undeclared:
+        raise StepException(
+            f"Graph node changed undeclared artifacts: {', '.join(sorted(undeclared))}",
+            state=final,
+        )
+
+    return changes
+
+
 async def _noop_stream() -> StepStream:
     return  # do not emit anything
     yield  # converts to AsyncGenerator
@@ -1,7 +1,7 @@
-from collections.abc import AsyncIterable, Iterable
-from typing import Protocol, runtime_checkable
+from collections.abc import AsyncIterable, Iterable, Mapping, Sequence
+from typing import Any, Protocol, Self, runtime_checkable
 
-from haiway import Meta, MetaValues
+from haiway import Immutable, Meta, MetaValues, State
 
 from draive.models import (
     ModelContext,
@@ -9,15 +9,20 @@ from draive.models import (
     ModelToolRequest,
     ModelToolResponse,
 )
-from draive.multimodal import MultimodalContentPart
+from draive.multimodal import ArtifactContent, MultimodalContentPart
 from draive.steps.state import StepState
 from draive.utils import ProcessingEvent
 
 __all__ = (
+    "StepCacheEntry",
+    "StepCacheLoading",
+    "StepCacheStoring",
     "StepConditionVerifying",
     "StepContextMutating",
     "StepException",
     "StepExecuting",
+    "StepFolding",
+    "StepGraphNode",
     "StepLoopConditionVerifying",
     "StepMerging",
     "StepOutputChunk",
@@ -138,6 +143,15 @@ class StepMerging(Protocol):
     ) -> StepState: ...
 
 
+@runtime_checkable
+class StepFolding(Protocol):
+    async def __call__(
+        self,
+        accumulated: StepState,
+        branch: StepState,
+    ) -> StepState: ...
+
+
 @runtime_checkable
 class StepStatePreserving(Protocol):
     async def __call__(
@@ -151,3 +165,158 @@ class StepStateRestoring(Protocol):
     async def __call__(
         self,
     ) -> StepState: ...
+
+
+class StepCacheEntry(State):
+    """Recorded step execution replayed on cache hits.
+
+    The entry keeps emitted output chunks together with the state changes the
+    step applied, so replay can be performed against any matching input state.
+
+    Attributes
+    ----------
+    chunks : Sequence[StepOutputChunk]
+        Output chunks emitted by the recorded execution, in order.
+    appended_context : ModelContext
+        Context elements appended by the recorded execution.
+    replaced_context : ModelContext | None
+        Complete replacement context when the recorded execution did not only
+        append to the context, ``None`` otherwise.
+    artifacts : Mapping[str, ArtifactContent]
+        Artifacts added or replaced by the recorded execution.
+    removed_artifacts : Sequence[str]
+        Keys of artifacts removed by the recorded execution.
+    """
+
+    @classmethod
+    def recorded(
+        cls,
+        *,
+        initial: StepState,
+        final: StepState,
+        chunks: Sequence[StepOutputChunk],
+    ) -> Self:
+        """Record changes between initial and final state of an execution.
+
+        Parameters
+        ----------
+        initial : StepState
+            State passed to the recorded execution.
+        final : StepState
+            Last state emitted by the recorded execution.
+        chunks : Sequence[StepOutputChunk]
+            Output chunks emitted by the recorded execution.
+
+        Returns
+        -------
+        Self
+            Entry describing the recorded execution.
+        """
+        initial_length: int = len(initial.context)
+        appended_context: ModelContext = ()
+        replaced_context: ModelContext | None = None
+        if final.context is initial.context:
+            pass  # context unchanged
+
+        elif (
+            len(final.context) >= initial_length
+            and final.context[:initial_length] == initial.context
+        ):
+            appended_context = tuple(final.context[initial_length:])
+
+        else:
+            replaced_context = tuple(final.context)
+
+        return cls(
+            chunks=tuple(chunks),
+            appended_context=appended_context,
+            replaced_context=replaced_context,
+            artifacts={
+                key: artifact
+                for key, artifact in final.artifacts.items()
+                if initial.artifacts.get(key) != artifact
+            },
+            removed_artifacts=tuple(key for key in initial.artifacts if key not in final.artifacts),
+        )
+
+    chunks: Sequence[StepOutputChunk]
+    appended_context: ModelContext = ()
+    replaced_context: ModelContext | None = None
+    artifacts: Mapping[str, ArtifactContent]
+    removed_artifacts: Sequence[str] = ()
+
+    def replaying(
+        self,
+        state: StepState,
+        /,
+    ) -> StepState:
+        """Apply recorded state changes to the provided state.
+
+        Parameters
+        ----------
+        state : StepState
+            State receiving recorded changes.
+
+        Returns
+        -------
+        StepState
+            State equivalent to the recorded execution result.
+        """
+        if self.replaced_context is not None:
+            state = state.replacing_context(self.replaced_context)
+
+        else:
+            state = state.appending_context(*self.appended_context)
+
+        if not self.artifacts and not self.removed_artifacts:
+            return state
+
+        return state.updating(
+            artifacts={
+                **{
+                    key: artifact
+                    for key, artifact in state.artifacts.items()
+                    if key not in self.removed_artifacts
+                },
+                **self.artifacts,
+            }
+        )
+
+
+@runtime_checkable
+class StepCacheLoading(Protocol):
+    async def __call__(
+        self,
+        key: str,
+        **extra: Any,
+    ) -> StepCacheEntry | None: ...
+
+
+@runtime_checkable
+class StepCacheStoring(Protocol):
+    async def __call__(
+        self,
+        key: str,
+        entry: StepCacheEntry,
+        *,
+        expiration: float | None,
+        **extra: Any,
+    ) -> None: ...
+
+
+class StepGraphNode(Immutable):
+    """Step execution with declared artifact dependencies used by ``Step.graph``.
+
+    Attributes
+    ----------
+    executing : StepExecuting
+        Step execution of this node.
+    inputs : frozenset[str]
+        Artifact keys read by the node.
+    outputs : frozenset[str]
+        Artifact keys written by the node.
+    """
+
+    executing: StepExecuting
+    inputs: frozenset[str]
+    outputs: frozenset[str]
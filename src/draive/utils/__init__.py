@@ -1,7 +1,12 @@
 from draive.utils.event import ProcessingEvent
+from draive.utils.files import write_atomically
 from draive.utils.schema import simplified_schema
+from draive.utils.storage import FileKeyedStorage, VolatileKeyedStorage
 
 __all__ = (
+    "FileKeyedStorage",
     "ProcessingEvent",
+    "VolatileKeyedStorage",
     "simplified_schema",
+    "write_atomically",
 )
@@ -0,0 +1,23 @@
+import os
+from pathlib import Path
+from uuid import uuid4
+
+__all__ = ("write_atomically",)
+
+
+def write_atomically(
+    path: Path,
+    data: bytes,
+) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # unique temporary name keeps concurrent writers from sharing a file
+    temporary_path: Path = path.with_name(f".{path.name}.{os.getpid()}.{uuid4().hex}.tmp")
+    try:
+        with open(temporary_path, mode="wb") as file:
+            file.write(data)
+
+        temporary_path.replace(path)  # atomic swap for concurrent readers
+
+    except BaseException:
+        temporary_path.unlink(missing_ok=True)
+        raise
@@ -0,0 +1,184 @@
+import json
+from collections import OrderedDict
+from collections.abc import Callable
+from hashlib import sha256
+from pathlib import Path
+from time import monotonic, time
+from typing import Any
+
+from haiway import Immutable, asynchronous, ctx
+
+from draive.utils.files import write_atomically
+
+__all__ = (
+    "FileKeyedStorage",
+    "VolatileKeyedStorage",
+)
+
+
+class VolatileKeyedStorage[Entry](Immutable):
+    """In-memory LRU storage of entries keyed by strings with optional expiration.
+
+    Provides ``loading`` and ``storing`` callables used as cache backends.
+
+    Parameters
+    ----------
+    limit : int
+        Maximum number of entries kept at once. Least recently used entries
+        are evicted first.
+    """
+
+    _limit: int
+    _entries: OrderedDict[str, tuple[Entry, float | None]]
+
+    def __init__(
+        self,
+        limit: int,
+    ) -> None:
+        assert limit > 0  # nosec: B101
+        object.__setattr__(self, "_limit", limit)
+        object.__setattr__(self, "_entries", OrderedDict())
+
+    async def loading(
+        self,
+        key: str,
+        **extra: Any,
+    ) -> Entry | None:
+        cached: tuple[Entry, float | None] | None = self._entries.get(key)
+        if cached is None:
+            return None
+
+        entry, deadline = cached
+        if deadline is not None and deadline < monotonic():
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return entry
+
+    async def storing(
+        self,
+        key: str,
+        entry: Entry,
+        *,
+        expiration: float | None,
+        **extra: Any,
+    ) -> None:
+        self._entries[key] = (
+            entry,
+            monotonic() + expiration if expiration is not None else None,
+        )
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._limit:
+            self._entries.popitem(last=False)
+
+
+class FileKeyedStorage[Entry](Immutable):
+    """Storage of entries keyed by strings, each kept as a JSON file in a directory.
+
+    Provides ``loading`` and ``storing`` callables used as cache backends.
+    Invalid files are logged and treated as missing entries.
+
+    Parameters
+    ----------
+    path : Path | str
+        Directory used to persist entries. Created when missing.
+    encoding : Callable[[Entry], str]
+        Function serializing entries.
+    decoding : Callable[[str], Entry]
+        Function deserializing entries, raising for invalid payloads.
+    """
+
+    _path: Path
+    _encoding: Callable[[Entry], str]
+    _decoding: Callable[[str], Entry]
+
+    def __init__(
+        self,
+        path: Path | str,
+        *,
+        encoding: Callable[[Entry], str],
+        decoding: Callable[[str], Entry],
+    ) -> None:
+        object.__setattr__(
+            self,
+            "_path",
+            Path(path) if isinstance(path, str) else path,
+        )
+        object.__setattr__(self, "_encoding", encoding)
+        object.__setattr__(self, "_decoding", decoding)
+
+    async def loading(
+        self,
+        key: str,
+        **extra: Any,
+    ) -> Entry | None:
+        try:
+            return await self._file_load(key)
+
+        except Exception as exc:
+            ctx.log_warning(
+                f"Invalid cache entry {key} in {self._path}, ignoring...",
+                exception=exc,
+            )
+            return None
+
+    async def storing(
+        self,
+        key: str,
+        entry: Entry,
+        *,
+        expiration: float | None,
+        **extra: Any,
+    ) -> None:
+        await self._file_save(
+            key,
+            entry=entry,
+            deadline=time() + expiration if expiration is not None else None,
+        )
+
+    def _entry_path(
+        self,
+        key: str,
+    ) -> Path:
+        # keys may contain arbitrary characters, use digest as a safe file name
+        return self._path / f"{sha256(key.encode()).hexdigest()}.json"
+
+    @asynchronous
+    def _file_load(
+        self,
+        key: str,
+    ) -> Entry | None:
+        entry_path: Path = self._entry_path(key)
+        if not entry_path.exists():
+            return None
+
+        with open(entry_path, mode="rb") as file:
+            match json.loads(file.read()):
+                case {"deadline": float() | int() | None as deadline, "entry": str() as entry}:
+                    if deadline is not None and deadline < time():
+                        entry_path.unlink(missing_ok=True)
+                        return None
+
+                    return self._decoding(entry)
+
+                case _:
+                    raise ValueError("Invalid cache file")
+
+    @asynchronous
+    def _file_save(
+        self,
+        key: str,
+        *,
+        entry: Entry,
+        deadline: float | None,
+    ) -> None:
+        write_atomically(
+            self._entry_path(key),
+            json.dumps(
+                {
+                    "deadline": deadline,
+                    "entry": self._encoding(entry),
+                }
+            ).encode("utf-8"),
+        )
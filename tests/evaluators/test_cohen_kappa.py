@@ -1,9 +1,11 @@
+import numpy as np
 import pytest
 
 from draive.evaluation import (
     EvaluationScore,
     EvaluationScoreValue,
     EvaluatorResult,
+    agreement_estimate,
     cohen_kappa,
     quadratic_weighted_kappa,
 )
@@ -22,6 +24,32 @@ def test_cohen_kappa_textbook_example() -> None:
     assert quadratic_weighted_kappa(rater_a, rater_b, categories=categories) == pytest.approx(0.4)
 
 
+def test_agreement_estimate_bootstraps_intervals() -> None:
+    rater_a = np.array([1] * 25 + [0] * 25)
+    rater_b = np.array([1] * 20 + [0] * 5 + [1] * 10 + [0] * 15)
+    categories = ("none", "perfect")
+
+    estimate = agreement_estimate(rater_a, rater_b, categories=categories, seed=7)
+    repeated = agreement_estimate(rater_a, rater_b, categories=categories, seed=7)
+
+    assert estimate.cohen_kappa == pytest.approx(0.4)
+    assert estimate.quadratic_weighted_kappa == pytest.approx(0.4)
+    assert estimate.exact_agreement == pytest.approx(0.7)
+    assert estimate.sample_count == 50
+    assert estimate.cohen_kappa_interval is not None
+    lower, upper = estimate.cohen_kappa_interval
+    assert lower < 0.4 < upper
+    assert repeated == estimate
+
+
+def test_agreement_estimate_rejects_unknown_labels() -> None:
+    with pytest.raises(ValueError, match="Unknown category in second sequence"):
+        agreement_estimate(["good"], ["great"], resamples=None)
+
+    with pytest.raises(ValueError, match="Unknown category in first sequence: None"):
+        agreement_estimate(["good", None], ["good", "poor"], resamples=None)  # pyright: ignore[reportArgumentType]
+
+
 @pytest.mark.asyncio
 async def test_cohen_kappa_evaluator_perfect_agreement() -> None:
     ratings: list[EvaluationScoreValue] = ["poor", "good", "excellent", "perfect", "fair"]
@@ -0,0 +1,61 @@
+from collections.abc import AsyncIterator
+from typing import Any
+
+import pytest
+
+from draive import GenerativeModel, TextContent, ctx
+from draive.evaluators import EvaluationCriterion, criteria_evaluator
+from draive.models import ModelOutputChunk
+
+
+@pytest.mark.asyncio
+async def test_criteria_evaluator_rates_all_criteria_in_single_call() -> None:
+    calls: list[str] = []
+
+    async def response() -> AsyncIterator[ModelOutputChunk]:
+        yield TextContent.of(
+            '<evaluation criterion="fluency">'
+            "<comment>Reads naturally.</comment><rating>perfect</rating>"
+            "</evaluation>\n"
+            '<evaluation criterion="coherence">'
+            "<comment>Some gaps.</comment><rating>fair</rating>"
+            "</evaluation>"
+        )
+
+    def generating(
+        *,
+        instructions: str,
+        **extra: Any,
+    ) -> AsyncIterator[ModelOutputChunk]:
+        calls.append(instructions)
+        return response()
+
+    async with ctx.scope("test", GenerativeModel(generating=generating)):
+        results = await criteria_evaluator(
+            "The ferry departs every hour.",
+            criteria=(
+                EvaluationCriterion.builtin("coherence", threshold="good"),
+                EvaluationCriterion.builtin("fluency"),
+                EvaluationCriterion.builtin("helpfulness"),
+                EvaluationCriterion.builtin("relevance"),
+            ),
+            reference="Ferry schedule.",
+        )
+
+    assert len(calls) == 1
+    assert 'name="coherence"' in calls[0]
+    assert 'name="helpfulness"' not in calls[0]
+    assert [result.evaluator for result in results] == [
+        "coherence",
+        "fluency",
+        "helpfulness",
+        "relevance",
+    ]
+    assert not results[0].passed
+    assert results[0].meta["comment"] == "Some gaps."
+    assert results[1].passed
+    assert results[2].score == 0.0
+    assert results[2].meta["comment"] == "User query was empty!"
+    # missing criterion in response is reported as failed evaluation
+    assert results[3].score == 0.0
+    assert results[3].meta.error is not None
@@ -0,0 +1,86 @@
+from collections.abc import Sequence
+from typing import Any
+
+import pytest
+from haiway import ctx
+
+from draive.embedding import Embedded, TextEmbedding
+from draive.evaluation import EvaluationCache
+from draive.evaluators import text_vector_similarity_batch, text_vector_similarity_evaluator
+
+_VECTORS: dict[str, Sequence[float]] = {
+    "cat": [1.0, 0.0],
+    "kitten": [0.8, 0.6],
+    "car": [0.0, 1.0],
+}
+
+
+@pytest.mark.asyncio
+async def test_text_vector_similarity_batch_embeds_unique_texts_once() -> None:
+    requests: list[Sequence[str]] = []
+
+    async def embedding(
+        values: Sequence[str],
+        /,
+        **extra: Any,
+    ) -> Sequence[Embedded[str]]:
+        requests.append(tuple(values))
+        return [Embedded(value=value, vector=_VECTORS[value]) for value in values]
+
+    async with ctx.scope("test", TextEmbedding(embedding=embedding)):
+        results = await text_vector_similarity_batch(
+            [
+                ("kitten", "cat"),
+                ("car", "cat"),
+                ("cat", "cat"),
+                ("", "cat"),
+            ],
+            threshold=0.5,
+        )
+        single = await text_vector_similarity_evaluator("kitten", reference="cat")
+
+    assert requests[0] == ("kitten", "cat", "car")
+    assert [result.score for result in results] == pytest.approx([0.8, 0.0, 1.0, 0.0])
+    assert [result.passed for result in results] == [True, False, True, False]
+    assert results[0].evaluator == single.evaluator
+    assert results[0].score == pytest.approx(single.score)
+
+
+@pytest.mark.asyncio
+async def test_text_vector_similarity_batch_scores_failures_as_zero() -> None:
+    async def embedding(
+        values: Sequence[str],
+        /,
+        **extra: Any,
+    ) -> Sequence[Embedded[str]]:
+        raise RuntimeError("unavailable")
+
+    async with ctx.scope("test", TextEmbedding(embedding=embedding)):
+        results = await text_vector_similarity_batch([("kitten", "cat"), ("car", "cat")])
+
+    assert [result.score for result in results] == [0.0, 0.0]
+    assert all("error" in result.meta for result in results)
+
+
+@pytest.mark.asyncio
+async def test_text_vector_similarity_batch_shares_evaluator_cache() -> None:
+    requests: list[Sequence[str]] = []
+
+    async def embedding(
+        values: Sequence[str],
+        /,
+        **extra: Any,
+    ) -> Sequence[Embedded[str]]:
+        requests.append(tuple(values))
+        return [Embedded(value=value, vector=_VECTORS[value]) for value in values]
+
+    async with ctx.scope("test", TextEmbedding(embedding=embedding), EvaluationCache.volatile()):
+        single = await text_vector_similarity_evaluator("kitten", reference="cat")
+        results = await text_vector_similarity_batch([("kitten", "cat"), ("car", "cat")])
+        repeated = await text_vector_similarity_batch([("kitten", "cat"), ("car", "cat")])
+
+    assert requests == [("cat", "kitten"), ("car", "cat")]
+    assert results[0].score == pytest.approx(single.score)
+    assert [result.score for result in repeated] == pytest.approx(
+        [result.score for result in results]
+    )
@@ -0,0 +1,143 @@
+from collections.abc import Sequence
+from pathlib import Path
+
+import pytest
+from haiway import State, ctx
+
+from draive.evaluation import (
+    EvaluationCache,
+    EvaluationScoreValue,
+    EvaluatorResult,
+    EvaluatorScenarioResult,
+    EvaluatorSuiteCase,
+    evaluator,
+    evaluator_scenario,
+    evaluator_suite,
+)
+
+
+@pytest.mark.asyncio
+async def test_evaluator_replays_cached_result() -> None:
+    calls: list[str] = []
+
+    @evaluator(name="length", threshold=0.5)
+    async def length(value: str) -> EvaluationScoreValue:
+        calls.append(value)
+        return min(1.0, len(value) / 10)
+
+    async with ctx.scope("test", EvaluationCache.volatile()):
+        first = await length("hello")
+        second = await length("hello")
+        other = await length("hello world")
+
+    assert calls == ["hello", "hello world"]
+    assert first == second
+    assert second.score == pytest.approx(0.5)
+    assert other.score == pytest.approx(1.0)
+
+
+@pytest.mark.asyncio
+async def test_evaluator_cache_distinguishes_thresholds_and_arguments() -> None:
+    calls: list[str | None] = []
+
+    @evaluator(name="guided")
+    async def guided(value: str, guidelines: str | None = None) -> EvaluationScoreValue:
+        calls.append(guidelines)
+        return 1.0
+
+    async with ctx.scope("test", EvaluationCache.volatile()):
+        await guided("value")
+        await guided("value", guidelines="strict")
+        await guided.with_threshold(0.5)("value")
+        await guided("value", guidelines="strict")
+
+    assert calls == [None, "strict", None]
+
+
+@pytest.mark.asyncio
+async def test_evaluator_cache_bypass_refreshes_entries(tmp_path: Path) -> None:
+    calls: list[str] = []
+
+    @evaluator(name="counting")
+    async def counting(value: str) -> EvaluationScoreValue:
+        calls.append(value)
+        return 1.0
+
+    async with ctx.scope("test", EvaluationCache.file(tmp_path)):
+        await counting("value")
+
+    async with ctx.scope("test", EvaluationCache.file(tmp_path, bypass=True)):
+        await counting("value")
+
+    async with ctx.scope("test", EvaluationCache.file(tmp_path)):
+        await counting("value")
+
+    assert calls == ["value", "value"]
+
+
+@pytest.mark.asyncio
+async def test_evaluator_cache_skips_failed_results() -> None:
+    calls: list[str] = []
+
+    @evaluator(name="failing")
+    async def failing(value: str) -> EvaluationScoreValue:
+        calls.append(value)
+        raise ValueError("failure")
+
+    async with ctx.scope("test", EvaluationCache.volatile()):
+        await failing("value")
+        await failing("value")
+
+    assert calls == ["value", "value"]
+
+
+@pytest.mark.asyncio
+async def test_scenario_replays_cached_result() -> None:
+    calls: list[str] = []
+
+    @evaluator_scenario(name="scenario")
+    async def scenario(value: str) -> Sequence[EvaluatorResult]:
+        calls.append(value)
+        return (EvaluatorResult.of("check", score=1.0, threshold=1.0),)
+
+    async with ctx.scope("test", EvaluationCache.volatile()):
+        first = await scenario("value")
+        second = await scenario("value")
+
+    assert calls == ["value"]
+    assert first == second
+
+
+class _Question(State, serializable=True):
+    text: str
+
+
+@pytest.mark.asyncio
+async def test_suite_reevaluates_changed_outputs_of_cached_cases() -> None:
+    answers: dict[str, str] = {"question": "short"}
+    evaluated: list[str] = []
+
+    @evaluator(name="length", threshold=0.5)
+    async def length(value: str) -> EvaluationScoreValue:
+        evaluated.append(value)
+        return min(1.0, len(value) / 10)
+
+    async def definition(
+        parameters: _Question,
+    ) -> Sequence[EvaluatorScenarioResult | EvaluatorResult]:
+        return [await length(answers[parameters.text])]
+
+    suite = evaluator_suite(
+        _Question,
+        storage=[EvaluatorSuiteCase(parameters=_Question(text="question"))],
+    )(definition)
+
+    async with ctx.scope("test", EvaluationCache.volatile()):
+        first = await suite()
+        await suite()  # unchanged output is replayed from the cache
+        answers["question"] = "much longer answer"
+        changed = await suite()
+
+    assert evaluated == ["short", "much longer answer"]
+    assert not first.passed
+    assert changed.passed
@@ -0,0 +1,56 @@
+import json
+from collections.abc import Sequence
+from typing import Any
+
+import pytest
+from haiway import State, ctx
+
+from draive.embedding import Embedded, TextEmbedding
+from draive.generation.model import ModelGeneration
+from draive.helpers.evaluation_case_generation import generate_case_parameters
+
+
+class Person(State):
+    name: str
+
+
+@pytest.mark.asyncio
+async def test_generate_case_parameters_rejects_near_duplicates() -> None:
+    names: list[str] = ["Ada", "Ada", "Ada", "Bob", "Ada", "Cy"]
+
+    async def generating(
+        generated: type[State],
+        /,
+        **extra: Any,
+    ) -> State:
+        return Person(name=names.pop(0))
+
+    async def embedding(
+        values: Sequence[str],
+        /,
+        **extra: Any,
+    ) -> Sequence[Embedded[str]]:
+        axes: tuple[str, ...] = ("Ada", "Bob", "Cy", "Eve")
+        return [
+            Embedded(
+                value=value,
+                vector=[1.0 if json.loads(value)["name"] == axis else 0.0 for axis in axes],
+            )
+            for value in values
+        ]
+
+    async with ctx.scope(
+        "test",
+        ModelGeneration(generating=generating),
+        TextEmbedding(embedding=embedding),
+    ):
+        results = await generate_case_parameters(
+            Person,
+            count=2,
+            examples=[Person(name="Eve")],
+            concurrent_generations=2,
+            similarity_threshold=0.9,
+        )
+
+    assert sorted(person.name for person in results) == ["Ada", "Bob"]
+    assert names == ["Ada", "Cy"]
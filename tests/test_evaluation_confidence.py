@@ -0,0 +1,122 @@
+import asyncio
+from collections.abc import Sequence
+
+import pytest
+from haiway import State, ctx
+
+from draive.evaluation import (
+    EvaluatorResult,
+    EvaluatorScenarioResult,
+    EvaluatorSuiteCase,
+    EvaluatorSuiteEarlyStopping,
+    bootstrap_interval,
+    evaluator_suite,
+    wilson_interval,
+)
+
+
+def test_wilson_interval_matches_reference_values() -> None:
+    lower, upper = wilson_interval(8, 10, confidence=0.95)
+    assert lower == pytest.approx(0.4902, abs=1e-4)
+    assert upper == pytest.approx(0.9433, abs=1e-4)
+
+
+def test_wilson_interval_stays_within_unit_range() -> None:
+    assert wilson_interval(0, 0) == (0.0, 1.0)
+    lower, upper = wilson_interval(20, 20)
+    assert 0.0 < lower < 1.0
+    assert upper == pytest.approx(1.0)
+
+
+def test_wilson_interval_rejects_invalid_counts() -> None:
+    with pytest.raises(ValueError):
+        wilson_interval(3, 2)
+
+
+def test_bootstrap_interval_contains_mean() -> None:
+    values = [float(value % 10) for value in range(100)]
+    lower, upper = bootstrap_interval(values, seed=42)
+    assert lower < 4.5 < upper
+
+
+def test_bootstrap_interval_of_constant_values_is_degenerate() -> None:
+    assert bootstrap_interval([0.7, 0.7, 0.7], seed=0) == (
+        pytest.approx(0.7),
+        pytest.approx(0.7),
+    )
+
+
+class _Case(State, serializable=True):
+    passing: bool
+
+
+@pytest.mark.asyncio
+async def test_suite_stops_once_decision_is_settled() -> None:
+    evaluated: list[bool] = []
+
+    async def definition(
+        parameters: _Case,
+    ) -> Sequence[EvaluatorScenarioResult | EvaluatorResult]:
+        evaluated.append(parameters.passing)
+        return [
+            EvaluatorResult.of(
+                "check",
+                score=1.0 if parameters.passing else 0.0,
+                threshold=1.0,
+            )
+        ]
+
+    suite = evaluator_suite(
+        _Case,
+        storage=[EvaluatorSuiteCase(parameters=_Case(passing=False)) for _ in range(200)],
+    )(definition).with_early_stopping(
+        EvaluatorSuiteEarlyStopping(
+            pass_rate=0.9,
+            batch_size=10,
+            min_cases=10,
+        )
+    )
+
+    async with ctx.scope("test"):
+        result = await suite()
+
+    assert len(evaluated) == 10
+    assert len(result.results) == 10
+    assert result.meta["settled"] is True
+    assert result.meta["selected"] == 200
+    assert result.decision is False
+    assert not result.passed
+
+
+@pytest.mark.asyncio
+async def test_early_stopping_keeps_concurrent_evaluations_across_batches() -> None:
+    running: list[int] = [0]
+    peak: list[int] = [0]
+
+    async def definition(
+        parameters: _Case,
+    ) -> Sequence[EvaluatorScenarioResult | EvaluatorResult]:
+        running[0] += 1
+        peak[0] = max(peak[0], running[0])
+        await asyncio.sleep(0.001)
+        running[0] -= 1
+        return [EvaluatorResult.of("check", score=1.0, threshold=1.0)]
+
+    suite = evaluator_suite(
+        _Case,
+        storage=[EvaluatorSuiteCase(parameters=_Case(passing=True)) for _ in range(20)],
+        concurrent_evaluations=4,
+    )(definition).with_early_stopping(
+        EvaluatorSuiteEarlyStopping(
+            pass_rate=0.5,
+            batch_size=3,
+            min_cases=100,  # never settles, all cases are evaluated
+        )
+    )
+
+    async with ctx.scope("test"):
+        result = await suite()
+
+    assert len(result.results) == 20
+    assert peak[0] == 4  # batches smaller than concurrency do not limit it
+    assert result.passed
@@ -7,7 +7,14 @@ from datetime import datetime
 import pytest
 from haiway import State, ctx
 
-from draive.evaluation import EvaluatorResult, EvaluatorScenarioResult, evaluator_suite
+from draive.evaluation import (
+    EvaluatorResult,
+    EvaluatorScenarioResult,
+    EvaluatorSuiteCase,
+    evaluator_suite,
+    volatile_queue,
+)
+from draive.evaluation.suite import _EvaluatorSuiteJSONLStorage
 
 
 class _DatetimeCase(State):
@@ -38,3 +45,217 @@ async def test_evaluator_suite_serializes_datetime(tmp_path) -> None:
 
     assert len(persisted) == 1
     assert persisted[0]["parameters"]["date"] == fixed_date.isoformat()
+
+
+class _NamedCase(State, serializable=True):
+    name: str
+
+
+@pytest.mark.asyncio
+async def test_evaluator_suite_resumes_from_checkpoint(tmp_path) -> None:
+    checkpoint_path = tmp_path / "checkpoint.jsonl"
+    evaluated: list[str] = []
+
+    async def definition(
+        parameters: _NamedCase,
+    ) -> Sequence[EvaluatorScenarioResult | EvaluatorResult]:
+        evaluated.append(parameters.name)
+        return [EvaluatorResult.of("check", score=1.0, threshold=1.0)]
+
+    suite = evaluator_suite(
+        _NamedCase,
+        storage=[
+            EvaluatorSuiteCase(identifier=name, parameters=_NamedCase(name=name))
+            for name in ("a", "b", "c")
+        ],
+    )(definition).with_checkpoint(checkpoint_path)
+
+    async with ctx.scope("test"):
+        partial = await suite(["a"])
+        resumed = await suite()
+
+    assert evaluated == ["a", "b", "c"]
+    assert [result.case_identifier for result in partial.results] == ["a"]
+    assert sorted(result.case_identifier for result in resumed.results) == ["a", "b", "c"]
+    assert len(checkpoint_path.read_text().splitlines()) == 3
+
+    async with ctx.scope("test"):
+        streamed = [result async for result in suite.stream()]
+
+    assert streamed == []  # every case is already present in the checkpoint
+    assert evaluated == ["a", "b", "c"]
+
+
+@pytest.mark.asyncio
+async def test_evaluator_suite_resumes_sampled_selection(tmp_path) -> None:
+    checkpoint_path = tmp_path / "checkpoint.jsonl"
+    evaluated: list[str] = []
+
+    async def definition(
+        parameters: _NamedCase,
+    ) -> Sequence[EvaluatorScenarioResult | EvaluatorResult]:
+        evaluated.append(parameters.name)
+        return [EvaluatorResult.of("check", score=1.0, threshold=1.0)]
+
+    suite = evaluator_suite(
+        _NamedCase,
+        storage=[
+            EvaluatorSuiteCase(identifier=str(index), parameters=_NamedCase(name=str(index)))
+            for index in range(20)
+        ],
+    )(definition).with_checkpoint(checkpoint_path)
+
+    async with ctx.scope("test"):
+        first = await suite(3)
+        sampled = sorted(result.case_identifier for result in first.results)
+        # interrupted append leaves a torn line which must not corrupt later records
+        with open(checkpoint_path, mode="a", encoding="utf-8") as file:
+            file.write('{"case_identifier": "torn"')
+
+        other = next(str(index) for index in range(20) if str(index) not in sampled)
+        await suite([other])
+        resumed = await suite(3)
+
+    assert len(evaluated) == 4
+    assert sorted(result.case_identifier for result in resumed.results) == sampled
+    assert json.loads(checkpoint_path.read_text().splitlines()[-1])["case_identifier"] == other
+
+
+@pytest.mark.asyncio
+async def test_evaluator_suite_dispatches_cases_to_workers() -> None:
+    evaluated: list[str] = []
+
+    async def definition(
+        parameters: _NamedCase,
+        suffix: str,
+    ) -> Sequence[EvaluatorScenarioResult | EvaluatorResult]:
+        evaluated.append(f"{parameters.name}{suffix}")
+        return [EvaluatorResult.of("check", score=1.0, threshold=1.0)]
+
+    suite = evaluator_suite(
+        _NamedCase,
+        storage=[
+            EvaluatorSuiteCase(identifier=name, parameters=_NamedCase(name=name))
+            for name in ("a", "b", "c")
+        ],
+    )(definition)
+    tasks = volatile_queue()
+    results = volatile_queue()
+
+    async with ctx.scope("test"):
+        worker = ctx.spawn(suite.serve, tasks, results, "!")
+        try:
+            result = await suite.dispatch(
+                tasks=tasks,
+                results=results,
+                timeout=5,
+            )
+
+        finally:
+            worker.cancel()
+
+    assert sorted(evaluated) == ["a!", "b!", "c!"]
+    assert [case.case_identifier for case in result.results] == ["a", "b", "c"]
+    assert result.passed
+
+
+@pytest.mark.asyncio
+async def test_evaluator_suite_workers_publish_failed_cases() -> None:
+    async def definition(
+        parameters: _NamedCase,
+    ) -> Sequence[EvaluatorScenarioResult | EvaluatorResult]:
+        if parameters.name == "b":
+            raise RuntimeError("broken case")
+
+        return [EvaluatorResult.of("check", score=1.0, threshold=1.0)]
+
+    suite = evaluator_suite(
+        _NamedCase,
+        storage=[
+            EvaluatorSuiteCase(identifier=name, parameters=_NamedCase(name=name))
+            for name in ("a", "b")
+        ],
+    )(definition)
+    tasks = volatile_queue()
+    results = volatile_queue()
+
+    async with ctx.scope("test"):
+        worker = ctx.spawn(suite.serve, tasks, results)
+        try:
+            result = await suite.dispatch(
+                tasks=tasks,
+                results=results,
+                timeout=5,
+            )
+
+        finally:
+            worker.cancel()
+
+    assert [case.case_identifier for case in result.results] == ["a", "b"]
+    assert result.results[0].passed
+    failed = result.results[1]
+    assert not failed.passed
+    assert isinstance(failed.results[0], EvaluatorResult)
+    assert "error" in failed.results[0].meta
+    assert not result.passed
+
+
+@pytest.mark.asyncio
+async def test_evaluator_suite_jsonl_storage_appends_and_removes(tmp_path) -> None:
+    storage_path = tmp_path / "suite.jsonl"
+
+    async def definition(
+        parameters: _NamedCase,
+    ) -> Sequence[EvaluatorScenarioResult | EvaluatorResult]:
+        return [EvaluatorResult.of("check", score=1.0, threshold=1.0)]
+
+    suite = evaluator_suite(
+        _NamedCase,
+        storage=storage_path,
+    )(definition)
+
+    async with ctx.scope("test"):
+        for name in ("a", "b", "c"):
+            await suite.add_case(_NamedCase(name=name), identifier=name)
+
+        await suite.remove_case("b")
+        selected = await suite(["c"])
+
+    lines = [json.loads(line) for line in storage_path.read_text().splitlines()]
+    assert len(lines) == 4
+    assert lines[-1] == {"removed": "b"}
+    assert [case.case_identifier for case in selected.results] == ["c"]
+
+    reloaded = evaluator_suite(
+        _NamedCase,
+        storage=storage_path,
+    )(definition)
+
+    async with ctx.scope("test"):
+        cases = await reloaded.cases()
+
+    assert [case.identifier for case in cases] == ["a", "c"]
+
+
+@pytest.mark.asyncio
+async def test_evaluator_suite_jsonl_storage_counts_only_live_cases(tmp_path) -> None:
+    storage_path = tmp_path / "suite.jsonl"
+    stored = [
+        EvaluatorSuiteCase(identifier=name, parameters=_NamedCase(name=name)) for name in ("a", "b")
+    ]
+    storage_path.write_text("".join(f"{json.dumps(case.to_mapping())}\n" for case in stored))
+    # removals before any load still see the cases already stored in the file
+    storage = _EvaluatorSuiteJSONLStorage(
+        storage_path,
+        parameters=_NamedCase,
+        compaction_threshold=2,
+    )
+
+    async with ctx.scope("test"):
+        await storage.remove(["missing"])
+        assert len(storage_path.read_text().splitlines()) == 2
+
+        await storage.remove(["a", "missing"])
+
+    lines = [json.loads(line) for line in storage_path.read_text().splitlines()]
+    assert [line["identifier"] for line in lines] == ["b"]
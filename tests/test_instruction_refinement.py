@@ -0,0 +1,183 @@
+from collections.abc import Sequence
+from typing import cast
+from uuid import uuid4
+
+import pytest
+from haiway import ctx
+
+from draive.evaluation import (
+    EvaluatorResult,
+    EvaluatorSuiteCaseResult,
+    EvaluatorSuiteResult,
+)
+from draive.helpers.instruction_refinement import (
+    _EvaluationMemo,
+    _RefinementState,
+    _RefinementTreeNode,
+    _tree_finalization_step,
+)
+from draive.multimodal import Template, TemplatesRepository
+from draive.steps import Step, StepState, step
+
+_INSTRUCTIONS: Template = Template.of("instructions")
+
+
+class _RecordingSuite:
+    def __init__(
+        self,
+        cases: Sequence[str],
+    ) -> None:
+        self.cases: Sequence[str] = cases
+        self.calls: list[tuple[str, tuple[str, ...]]] = []
+
+    async def __call__(
+        self,
+        cases: object = None,
+        /,
+    ) -> EvaluatorSuiteResult:
+        assert cases is None or isinstance(cases, Sequence)
+        selected: tuple[str, ...] = tuple(
+            self.cases if cases is None else (str(case) for case in cast(Sequence[object], cases))
+        )
+        instructions: str = await TemplatesRepository.load(_INSTRUCTIONS)
+        self.calls.append((instructions, selected))
+        score: float = 1.0 if "refined" in instructions else 0.0
+        return EvaluatorSuiteResult(
+            suite="suite",
+            results=tuple(
+                EvaluatorSuiteCaseResult(
+                    case_identifier=case,
+                    results=(EvaluatorResult.of("check", score=score, threshold=1.0),),
+                )
+                for case in selected
+            ),
+        )
+
+
+def _memo() -> _EvaluationMemo:
+    return _EvaluationMemo(
+        _results={},
+        _explored=set(),
+    )
+
+
+def _node(
+    content: str,
+    *,
+    parent: _RefinementTreeNode | None = None,
+) -> _RefinementTreeNode:
+    evaluation: EvaluatorSuiteResult = EvaluatorSuiteResult(
+        suite="placeholder",
+        results=(),
+    )
+    return _RefinementTreeNode(
+        identifier=uuid4(),
+        instructions=_INSTRUCTIONS,
+        instructions_content=content,
+        strategy="initial" if parent is None else "refined",
+        parent_id=None if parent is None else parent.identifier,
+        depth=0 if parent is None else parent.depth + 1,
+        focused_evaluation=evaluation,
+        complete_evaluation=evaluation if parent is None else None,
+        children=(),
+        pruned=False,
+    )
+
+
+def test_memo_claim_skips_whitespace_variants() -> None:
+    memo = _memo()
+
+    assert memo.claim("refined instructions")
+    assert not memo.claim("  refined\n\tinstructions ")
+    assert not memo.claim("refined instructions")
+    assert memo.claim("other instructions")
+
+
+@pytest.mark.asyncio
+async def test_memo_evaluates_each_instructions_case_pair_once() -> None:
+    suite = _RecordingSuite(("a", "b", "c"))
+    memo = _memo()
+
+    async with ctx.scope("test"):
+        first = await memo.evaluate(
+            _node("refined instructions"),
+            evaluator_suite=suite,
+            cases=("a", "b"),
+        )
+        second = await memo.evaluate(
+            _node("refined instructions"),
+            evaluator_suite=suite,
+            cases=("a", "b", "c"),
+        )
+        reformatted = await memo.evaluate(
+            _node(" refined\ninstructions "),
+            evaluator_suite=suite,
+            cases=("c", "a"),
+        )
+
+    assert suite.calls == [
+        ("refined instructions", ("a", "b")),
+        ("refined instructions", ("c",)),
+    ]
+    assert [result.case_identifier for result in first.results] == ["a", "b"]
+    assert [result.case_identifier for result in second.results] == ["a", "b", "c"]
+    assert [result.case_identifier for result in reformatted.results] == ["c", "a"]
+    assert second.performance == 1.0
+
+
+@pytest.mark.asyncio
+async def test_finalization_evaluates_only_missing_cases() -> None:
+    suite = _RecordingSuite(("a", "b", "c"))
+    memo = _memo()
+    selected: list[str] = []
+
+    @step
+    async def capture(
+        state: StepState,
+    ) -> StepState:
+        selected.append(state.get(_RefinementState, required=True).instructions)
+        return state
+
+    async with ctx.scope("test"):
+        root = _node("initial instructions")
+        root = root.updating(
+            focused_evaluation=await memo.evaluate(
+                root,
+                evaluator_suite=suite,
+                cases=("a", "b", "c"),
+            ),
+        )
+        root = root.updating(complete_evaluation=root.focused_evaluation)
+        child = _node("refined instructions", parent=root)
+        child = child.updating(
+            focused_evaluation=await memo.evaluate(
+                child,
+                evaluator_suite=suite,
+                cases=("a",),
+            ),
+        )
+        root = root.updating(children=(child.identifier,))
+        suite.calls.clear()
+
+        await Step.sequence(
+            _tree_finalization_step(
+                evaluator_suite=suite,
+                memo=memo,
+                quality_threshold=0.99,
+                candidates_limit=3,
+            ),
+            capture,
+        ).run(
+            (),
+            _RefinementState(
+                root=root,
+                nodes={root.identifier: root, child.identifier: child},
+                sample_ratio=0.1,
+                performance_drop_threshold=0.5,
+                rounds_remaining=0,
+                instructions=root.instructions_content,
+            ),
+        )
+
+    assert suite.calls == [("refined instructions", ("b", "c"))]
+    assert selected == ["refined instructions"]
@@ -0,0 +1,24 @@
+from base64 import urlsafe_b64encode
+
+import pytest
+from mcp.types import ImageContent as MCPImageContent
+
+from draive.mcp.client import _convert_content
+from draive.resources import ResourceContent
+
+
+@pytest.mark.asyncio
+async def test_convert_content_normalizes_urlsafe_base64() -> None:
+    payload = bytes([251, 255, 190, 0, 1])
+    content = await _convert_content(
+        MCPImageContent(
+            type="image",
+            data=urlsafe_b64encode(payload).decode().rstrip("="),
+            mimeType="image/png",
+        )
+    )
+
+    resource = content.parts[0]
+    assert isinstance(resource, ResourceContent)
+    assert resource.data == "+/++AAE="
+    assert resource.to_bytes() == payload
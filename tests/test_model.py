@@ -1,3 +1,4 @@
+import asyncio
 from collections.abc import AsyncIterable
 from typing import Any
 
@@ -7,6 +8,7 @@ from haiway import State, ctx
 from draive.models import (
     GenerativeModel,
     ModelOutput,
+    ModelRateLimit,
     ModelReasoning,
     ModelReasoningChunk,
     ModelToolRequest,
@@ -60,3 +62,62 @@ async def test_generative_model_completion_streams_chunks() -> None:
         chunks = [chunk async for chunk in stream]
 
     assert MultimodalContent.of(*chunks).to_str() == "AB"
+
+
+@pytest.mark.asyncio
+async def test_generative_model_hedging_streams_first_responding_attempt() -> None:
+    async def slow(
+        *,
+        instructions: str,
+        tools: ModelTools,
+        context,
+        output,
+        **extra: Any,
+    ) -> AsyncIterable[TextContent]:
+        _ = (instructions, tools, context, output, extra)
+        await asyncio.sleep(1.0)
+        yield TextContent.of("slow")
+
+    async def fast(
+        *,
+        instructions: str,
+        tools: ModelTools,
+        context,
+        output,
+        **extra: Any,
+    ) -> AsyncIterable[TextContent]:
+        _ = (instructions, tools, context, output, extra)
+        yield TextContent.of("fast")
+
+    model = GenerativeModel(generating=slow).with_hedging(delay=0.01, fallback=fast)
+    async with ctx.scope("test", model):
+        chunks = [chunk async for chunk in GenerativeModel.completion(context=())]
+
+    assert MultimodalContent.of(*chunks).to_str() == "fast"
+
+
+@pytest.mark.asyncio
+async def test_generative_model_hedging_retries_rate_limit_after_delay() -> None:
+    calls: list[str] = []
+
+    async def limited(
+        *,
+        instructions: str,
+        tools: ModelTools,
+        context,
+        output,
+        **extra: Any,
+    ) -> AsyncIterable[TextContent]:
+        _ = (instructions, tools, context, output, extra)
+        calls.append("call")
+        if len(calls) == 1:
+            raise ModelRateLimit(provider="test", model="test", retry_after=0.01)
+
+        yield TextContent.of("retried")
+
+    model = GenerativeModel(generating=limited).with_hedging(delay=1.0)
+    async with ctx.scope("test", model):
+        chunks = [chunk async for chunk in GenerativeModel.completion(context=())]
+
+    assert MultimodalContent.of(*chunks).to_str() == "retried"
+    assert len(calls) == 2
@@ -45,6 +45,18 @@ def test_empty_texts_are_skipped():
     assert result.parts[0].text == ""
 
 
+def test_streamed_text_deltas_are_merged_into_runs():
+    deltas = [TextContent.of(str(idx % 10)) for idx in range(1000)]
+    tagged = TextContent.of("x", meta={"test": True})
+
+    assert MultimodalContent.of(*deltas).parts == (TextContent.of("0123456789" * 100),)
+    assert MultimodalContent.of(*deltas[:3], tagged, tagged, *deltas[:2]).parts == (
+        TextContent.of("012"),
+        TextContent.of("xx", meta={"test": True}),
+        TextContent.of("01"),
+    )
+
+
 def test_merged_contents_with_same_meta_are_concatenated():
     assert MultimodalContent.of(
         input_multimodal,
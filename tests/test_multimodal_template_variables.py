@@ -2,6 +2,7 @@ from pytest import raises
 
 from draive.multimodal.content import MultimodalContent
 from draive.multimodal.templates.variables import (
+    CompiledTemplate,
     parse_template_variables,
     resolve_multimodal_template,
     resolve_text_template,
@@ -206,3 +207,13 @@ def test_resolve_multimodal_template_returns_empty_content_for_empty_template()
     result = resolve_multimodal_template("", arguments={})
 
     assert result is MultimodalContent.empty
+
+
+def test_compiled_template_splits_literals_and_variables() -> None:
+    compiled = CompiledTemplate.of("{%greeting%}, {%name%}!")
+
+    assert compiled.literals == ("", ", ", "!")
+    assert compiled.variables == ("greeting", "name")
+    assert compiled.resolve_text(arguments={"greeting": "Hi", "name": "Ada"}) == "Hi, Ada!"
+    with raises(KeyError):
+        compiled.resolve_text(arguments={"greeting": "Hi"})
@@ -1,3 +1,4 @@
+import asyncio
 from pathlib import Path
 
 import pytest
@@ -564,3 +565,113 @@ async def test_resolve_raw_and_loaded_empty_templates_match() -> None:
 
     assert raw is MultimodalContent.empty
     assert loaded is MultimodalContent.empty
+
+
+@pytest.mark.asyncio
+async def test_resolve_caches_loaded_templates_until_defined() -> None:
+    loads: list[str] = []
+    contents: dict[str, str] = {"welcome": "Hello {%name%}"}
+
+    async def loading(
+        identifier: str,
+        meta: Meta,
+        **extra: object,
+    ) -> str | None:
+        loads.append(identifier)
+        return contents.get(identifier)
+
+    async def defining(
+        identifier: str,
+        description: str | None,
+        content: str,
+        variables: object,
+        meta: Meta,
+        **extra: object,
+    ) -> None:
+        contents[identifier] = content
+
+    repository = TemplatesRepository(loading=loading, defining=defining, cache_limit=64)
+    template = Template.of("welcome", arguments={"name": "Ada"})
+
+    assert await repository.resolve_str(template) == "Hello Ada"
+    assert await repository.resolve_str(template) == "Hello Ada"
+    assert loads == ["welcome"]
+
+    await repository.define(
+        TemplateDeclaration.of("welcome", variables={"name": "Recipient name"}),
+        content="Hi {%name%}",
+    )
+
+    assert await repository.resolve_str(template) == "Hi Ada"
+    assert loads == ["welcome", "welcome"]
+
+
+@pytest.mark.asyncio
+async def test_file_repository_appends_journal_and_picks_up_external_updates(
+    tmp_path: Path,
+) -> None:
+    path = tmp_path / "templates.jsonl"
+    writer = TemplatesRepository.file(path)
+    reader = TemplatesRepository.file(path, cache_limit=0)
+
+    async with ctx.scope("test"):
+        await writer.define(TemplateDeclaration.of("first"), content="Hello")
+        assert await reader.load(Template.of("first")) == "Hello"
+
+        await writer.define(TemplateDeclaration.of("first"), content="Hi")
+        await writer.define(TemplateDeclaration.of("second"), content="Hey")
+
+        assert len(path.read_text(encoding="utf-8").splitlines()) == 3
+        assert await reader.load(Template.of("first")) == "Hi"
+        assert tuple(item.identifier for item in (await reader.templates()).items) == (
+            "first",
+            "second",
+        )
+
+
+@pytest.mark.asyncio
+async def test_file_repository_converts_legacy_array_on_define(tmp_path: Path) -> None:
+    path = tmp_path / "templates.json"
+    path.write_text(
+        ('[{"identifier":"valid","description":null,"variables":{},"content":"Hello","meta":{}}]'),
+        encoding="utf-8",
+    )
+    repository = TemplatesRepository.file(path)
+
+    async with ctx.scope("test"):
+        await repository.define(TemplateDeclaration.of("other"), content="Hi")
+
+    assert len(path.read_text(encoding="utf-8").splitlines()) == 2
+    reloaded = TemplatesRepository.file(path)
+    async with ctx.scope("test"):
+        assert await reloaded.load(Template.of("valid")) == "Hello"
+        assert await reloaded.load(Template.of("other")) == "Hi"
+
+
+@pytest.mark.asyncio
+async def test_file_repository_concurrent_writers_keep_all_templates(tmp_path: Path) -> None:
+    path = tmp_path / "templates.json"
+    first = TemplatesRepository.file(path)
+    second = TemplatesRepository.file(path)
+
+    async def define_all(
+        repository: TemplatesRepository,
+        prefix: str,
+    ) -> None:
+        for index in range(60):  # enough overrides to trigger compaction
+            await repository.define(
+                TemplateDeclaration.of(f"{prefix}{index % 10}"),
+                content=f"{prefix}:{index}",
+            )
+
+    async with ctx.scope("test"):
+        await asyncio.gather(
+            define_all(first, "a"),
+            define_all(second, "b"),
+        )
+
+        declarations = await TemplatesRepository.file(path).templates(Pagination.of(limit=100))
+
+    assert sorted(declaration.identifier for declaration in declarations.items) == sorted(
+        [f"a{index}" for index in range(10)] + [f"b{index}" for index in range(10)]
+    )
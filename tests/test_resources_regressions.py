@@ -1,3 +1,4 @@
+import asyncio
 from typing import Any
 
 import pytest
@@ -5,6 +6,8 @@ import pytest
 from draive.resources.http import (
     http_resource_deleting,
     http_resource_fetching,
+    http_resource_revision_checking,
+    http_resource_stream_fetching,
     http_resource_uploading,
 )
 from draive.resources.state import ResourcesRepository
@@ -253,3 +256,187 @@ async def test_http_resource_deleting_raises_inaccessible_for_auth_errors(
         await http_resource_deleting("https://example.com/resource")
 
     assert exc_info.value.description == description
+
+
+def test_resource_content_encodes_buffers_and_reports_size() -> None:
+    payload = bytes(range(256)) * 4
+    content = ResourceContent.of(memoryview(payload), mime_type="application/pdf")
+
+    assert content.to_bytes() == payload
+    assert content.size == len(payload)
+    assert ResourceContent.of(content.data).size == len(payload)
+    assert ResourceContent.of(b"ab").size == 2
+
+
+def test_resource_content_decodes_payload_once() -> None:
+    payload = b"payload"
+    content = ResourceContent.of(payload, mime_type="text/plain")
+    encoded = ResourceContent.of(content.data, mime_type="text/plain")
+
+    assert content.to_bytes() is payload
+    assert encoded.to_bytes() is encoded.to_bytes()
+    assert encoded.to_bytes() == payload
+    assert encoded == content
+    assert "_decoded" not in content.to_mapping()
+
+
+@pytest.mark.asyncio
+async def test_repository_fetch_stream_slices_fetched_content() -> None:
+    async def fake_fetching(uri: str, **extra: Any) -> ResourceContent:
+        _ = (uri, extra)
+        return ResourceContent.of(b"0123456789", mime_type="text/plain")
+
+    repository = ResourcesRepository(fetching=fake_fetching)
+
+    stream = await repository.fetch_stream("memory://data", offset=2, length=5, chunk_size=2)
+
+    assert stream.size == 10
+    assert stream.mime_type == "text/plain"
+    assert [chunk async for chunk in stream] == [b"23", b"45", b"6"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("revision", "header"),
+    [
+        ('"v1"', "if-none-match"),
+        ('W/"v1"', "if-none-match"),
+        ("Wed, 21 Oct 2015 07:28:00 GMT", "if-modified-since"),
+    ],
+)
+async def test_http_resource_revision_checking_uses_matching_conditional_header(
+    monkeypatch: pytest.MonkeyPatch,
+    revision: str,
+    header: str,
+) -> None:
+    requested: list[dict[str, str]] = []
+
+    async def fake_request(
+        method: str,
+        *,
+        url: str,
+        headers: dict[str, str],
+        **kwargs: Any,
+    ) -> _DummyResponse:
+        _ = (method, url, kwargs)
+        requested.append(headers)
+        return _DummyResponse(status_code=304, body=b"")
+
+    monkeypatch.setattr("draive.resources.http.HTTPClient.request", fake_request)
+
+    checked = await http_resource_revision_checking(
+        "https://example.com/resource",
+        revision=revision,
+    )
+
+    assert checked == revision
+    assert requested == [{header: revision}]
+
+
+@pytest.mark.asyncio
+async def test_http_resource_stream_fetching_uses_range_requests(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    payload = b"0123456789"
+    requested: list[str] = []
+
+    async def fake_get(*, url: str, headers: dict[str, str], **kwargs: Any) -> _DummyResponse:
+        _ = (url, kwargs)
+        requested.append(headers["range"])
+        start, stop = (int(value) for value in headers["range"][6:].split("-"))
+        return _DummyResponse(
+            status_code=206,
+            body=payload[start : stop + 1],
+            headers={
+                "content-type": "text/plain",
+                "content-range": f"bytes {start}-{min(stop, 9)}/10",
+            },
+        )
+
+    monkeypatch.setattr("draive.resources.http.HTTPClient.get", fake_get)
+
+    stream = await http_resource_stream_fetching(
+        "https://example.com/resource",
+        offset=1,
+        length=None,
+        chunk_size=4,
+    )
+
+    assert stream is not None
+    assert stream.size == 10
+    assert await stream.read() == payload[1:]
+    assert requested == ["bytes=1-4", "bytes=5-8", "bytes=9-12"]
+
+
+@pytest.mark.asyncio
+async def test_http_resource_stream_fetching_raises_when_resource_changes(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    validators: list[str | None] = []
+
+    async def fake_get(*, url: str, headers: dict[str, str], **kwargs: Any) -> _DummyResponse:
+        _ = (url, kwargs)
+        validators.append(headers.get("if-range"))
+        if "if-range" in headers:  # validator no longer matches, full body returned
+            return _DummyResponse(status_code=200, body=b"changed")
+
+        return _DummyResponse(
+            status_code=206,
+            body=b"0123",
+            headers={
+                "content-range": "bytes 0-3/10",
+                "etag": '"v1"',
+            },
+        )
+
+    monkeypatch.setattr("draive.resources.http.HTTPClient.get", fake_get)
+
+    stream = await http_resource_stream_fetching(
+        "https://example.com/resource",
+        offset=0,
+        length=None,
+        chunk_size=4,
+    )
+
+    assert stream is not None
+    with pytest.raises(ResourceCorrupted):
+        await stream.read()
+
+    assert validators == [None, '"v1"']
+
+
+@pytest.mark.asyncio
+async def test_repository_cache_revalidates_and_deduplicates_fetches() -> None:
+    fetches: list[str] = []
+    revision: list[str] = ["v1"]
+
+    async def fake_fetching(uri: str, **extra: Any) -> ResourceContent:
+        _ = extra
+        fetches.append(uri)
+        await asyncio.sleep(0.01)
+        return ResourceContent.of(revision[0].encode(), mime_type="text/plain")
+
+    async def fake_revision_checking(uri: str, *, revision: str | None, **extra: Any) -> str:
+        _ = (uri, extra)
+        return revision[0]
+
+    repository = ResourcesRepository(
+        fetching=fake_fetching,
+        revision_checking=fake_revision_checking,
+    ).with_cache()
+
+    first, second = await asyncio.gather(
+        repository.fetch("memory://data"),
+        repository.fetch("memory://data"),
+    )
+    assert first == second
+    assert len(fetches) == 1
+
+    await repository.fetch("memory://data")
+    assert len(fetches) == 1
+
+    revision[0] = "v2"
+    updated = await repository.fetch("memory://data")
+    assert isinstance(updated.resource, ResourceContent)
+    assert updated.resource.to_bytes() == b"v2"
+    assert len(fetches) == 2
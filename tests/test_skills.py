@@ -3,8 +3,14 @@ from pathlib import Path
 import pytest
 
 from draive import ctx
-from draive.resources import ResourceContent
-from draive.skills import Skill, SkillResource, SkillResourceMissing
+from draive.resources import ResourceContent, ResourceReference
+from draive.skills import (
+    Skill,
+    SkillException,
+    SkillResource,
+    SkillResourceMissing,
+    SkillsCatalog,
+)
 
 
 def test_skill_resource_lookup_uses_normalized_paths() -> None:
@@ -235,3 +241,194 @@ async def test_skill_from_directory_allows_non_string_metadata_values(
         skill = await Skill.from_directory(skill_root)
 
     assert skill.meta["version"] == 1
+
+
+@pytest.mark.asyncio
+async def test_skill_from_directory_reads_resources_eagerly(
+    tmp_path: Path,
+) -> None:
+    skill_root = tmp_path / "eager-skill"
+    skill_root.mkdir()
+    (skill_root / "SKILL.md").write_text(
+        "---\nname: eager-skill\ndescription: Eager resources.\n---\n# Body\n",
+        encoding="utf-8",
+    )
+    (skill_root / "schema.json").write_text('{"ok":true}', encoding="utf-8")
+
+    async with ctx.scope("test"):
+        skill = await Skill.from_directory(skill_root)
+        schema = skill.resource("schema.json")
+
+    assert schema.reference is None
+    assert schema.content is not None
+    assert schema.content.to_bytes() == b'{"ok":true}'
+    assert schema.mime_type == "application/json"
+
+
+@pytest.mark.asyncio
+async def test_skill_from_directory_loads_resources_lazily(
+    tmp_path: Path,
+) -> None:
+    skill_root = tmp_path / "lazy-skill"
+    (skill_root / "references").mkdir(parents=True)
+    (skill_root / "SKILL.md").write_text(
+        "---\nname: lazy-skill\ndescription: Lazy resources.\n---\n# Body\n",
+        encoding="utf-8",
+    )
+    (skill_root / "references" / "guide.md").write_text("# guide", encoding="utf-8")
+    (skill_root / "schema.json").write_text('{"ok":true}', encoding="utf-8")
+
+    async with ctx.scope("test"):
+        skill = await Skill.from_directory(skill_root, lazy=True)
+        schema = skill.resource("schema.json")
+
+        assert schema.size == len(b'{"ok":true}')
+        assert schema.mime_type == "application/json"
+        # lazy resources are file references, content is read with load()
+        assert schema.content is None
+        assert isinstance(schema.reference, ResourceReference)
+        assert (await schema.load()).to_bytes() == b'{"ok":true}'
+
+        inline = SkillResource.of("inline.txt", content=ResourceContent.of(b"inline"))
+        assert await inline.load() is inline.content
+
+        guide, manifest = await skill.load_resources("references/guide.md", "SKILL.md")
+        assert guide.to_bytes() == b"# guide"
+        assert manifest.to_bytes().startswith(b"---")
+
+        # unchanged directory reuses the previous scan
+        assert await Skill.from_directory(skill_root, lazy=True) is skill
+        assert await Skill.from_directory(skill_root) is not skill
+
+        (skill_root / "references" / "extra.md").write_text("extra", encoding="utf-8")
+        reloaded = await Skill.from_directory(skill_root, lazy=True)
+
+        assert reloaded.has_resource("references/extra.md")
+
+        (skill_root / "references" / "guide.md").unlink()
+        with pytest.raises(SkillResourceMissing):
+            await reloaded.load_resource("references/guide.md")
+
+
+@pytest.mark.asyncio
+async def test_skill_from_directory_reloads_files_rewritten_in_place(
+    tmp_path: Path,
+) -> None:
+    skill_root = tmp_path / "rewritten-skill"
+    skill_root.mkdir()
+    (skill_root / "SKILL.md").write_text(
+        "---\nname: rewritten-skill\ndescription: Rewritten.\n---\n# Body\n",
+        encoding="utf-8",
+    )
+    notes = skill_root / "notes.txt"
+    notes.write_text("short", encoding="utf-8")
+
+    async with ctx.scope("test"):
+        skill = await Skill.from_directory(skill_root, lazy=True)
+        assert skill.resource("notes.txt").size == len(b"short")
+
+        # rewriting an existing file does not change the directory modification time
+        notes.write_text("much longer notes", encoding="utf-8")
+        reloaded = await Skill.from_directory(skill_root, lazy=True)
+
+    assert reloaded is not skill
+    assert reloaded.resource("notes.txt").size == len(b"much longer notes")
+
+
+@pytest.mark.asyncio
+async def test_skill_cache_can_be_configured_and_cleared(
+    tmp_path: Path,
+) -> None:
+    skill_root = tmp_path / "cached-skill"
+    skill_root.mkdir()
+    (skill_root / "SKILL.md").write_text(
+        "---\nname: cached-skill\ndescription: Cached.\n---\n# Body\n",
+        encoding="utf-8",
+    )
+
+    async with ctx.scope("test"):
+        skill = await Skill.from_directory(skill_root)
+        assert await Skill.from_directory(skill_root) is skill
+
+        Skill.clear_cache()
+        assert await Skill.from_directory(skill_root) is not skill
+
+        Skill.configure_cache(skills_limit=0)
+        try:
+            uncached = await Skill.from_directory(skill_root)
+            assert await Skill.from_directory(skill_root) is not uncached
+
+        finally:
+            Skill.configure_cache(skills_limit=256)
+
+
+@pytest.mark.asyncio
+async def test_skills_catalog_loads_descriptions_and_revalidates(
+    tmp_path: Path,
+) -> None:
+    for name in ("first-skill", "second-skill"):
+        (tmp_path / name).mkdir()
+        (tmp_path / name / "SKILL.md").write_text(
+            f"---\nname: {name}\ndescription: Describes {name}.\n---\n# {name}\n",
+            encoding="utf-8",
+        )
+
+    cache_path = tmp_path / "cache" / "skills.json"
+    async with ctx.scope("test"):
+        catalog = await SkillsCatalog.load(
+            tmp_path / "first-skill",
+            tmp_path / "second-skill",
+            cache_path=cache_path,
+        )
+
+        assert [description.name for description in catalog.descriptions] == [
+            "first-skill",
+            "second-skill",
+        ]
+        assert catalog.description("second-skill").description == "Describes second-skill."
+        assert cache_path.exists()
+
+        restored = await SkillsCatalog.load(tmp_path / "first-skill", cache_path=cache_path)
+        assert restored.description("first-skill") == catalog.description("first-skill")
+
+        (tmp_path / "first-skill" / "SKILL.md").write_text(
+            "---\nname: first-skill\ndescription: Updated.\n---\n# Updated body\n",
+            encoding="utf-8",
+        )
+
+        assert "Updated body" in await catalog.instructions("first-skill")
+        assert catalog.description("first-skill").description == "Updated."
+        assert (await catalog.skill("first-skill")).description == "Updated."
+
+        with pytest.raises(SkillException):
+            catalog.description("missing")
+
+
+@pytest.mark.asyncio
+async def test_skills_catalog_rejects_renames_to_cataloged_names(
+    tmp_path: Path,
+) -> None:
+    for name in ("first-skill", "second-skill"):
+        (tmp_path / name).mkdir()
+        (tmp_path / name / "SKILL.md").write_text(
+            f"---\nname: {name}\ndescription: Describes {name}.\n---\n# {name}\n",
+            encoding="utf-8",
+        )
+
+    async with ctx.scope("test"):
+        catalog = await SkillsCatalog.load(
+            tmp_path / "first-skill",
+            tmp_path / "second-skill",
+        )
+        (tmp_path / "second-skill" / "SKILL.md").write_text(
+            "---\nname: first-skill\ndescription: Renamed.\n---\n# Renamed\n",
+            encoding="utf-8",
+        )
+
+        with pytest.raises(SkillException):
+            await catalog.instructions("second-skill")
+
+        await catalog.refresh()
+
+        assert [description.name for description in catalog.descriptions] == ["first-skill"]
+        assert catalog.description("first-skill").description == "Describes first-skill."
@@ -1,4 +1,7 @@
+import asyncio
+import json
 from collections.abc import AsyncIterable, Iterable, Sequence
+from pathlib import Path
 from typing import Any
 
 import pytest
@@ -18,7 +21,7 @@ from draive.models import (
     ModelTools,
 )
 from draive.multimodal import MultimodalContent, TextContent
-from draive.steps import Step, StepException, StepState, step
+from draive.steps import Step, StepCache, StepContext, StepException, StepState, step
 from draive.tools import tool
 
 
@@ -86,6 +89,45 @@ async def test_appending_and_mutating_context() -> None:
     assert isinstance(state.context[1], ModelInput)
 
 
+def test_step_context_appending_shares_structure() -> None:
+    elements = tuple(ModelInput.of(MultimodalContent.of(f"{idx}")) for idx in range(100))
+
+    state = StepState.of()
+    snapshots: list[StepState] = []
+    for element in elements:
+        state = state.appending_context(element)
+        snapshots.append(state)
+
+    assert isinstance(state.context, StepContext)
+    assert len(state.context) == 100
+    assert state.context == elements
+    assert tuple(state.context) == elements
+    assert tuple(reversed(state.context)) == tuple(reversed(elements))
+    assert state.context[0] is elements[0]
+    assert state.context[-1] is elements[-1]
+    assert state.context[40] is elements[40]
+    assert state.context[10:12] == elements[10:12]
+    assert elements[50] in state.context
+    # previous snapshots remain unchanged
+    assert len(snapshots[9].context) == 10
+    assert snapshots[9].context == elements[:10]
+    assert StepContext.of(elements).appending(elements[0])[-1] is elements[0]
+
+
+def test_step_state_serializes_context_as_list() -> None:
+    elements = tuple(ModelInput.of(MultimodalContent.of(f"{idx}")) for idx in range(40))
+    state = StepState.of().appending_context(*elements[:30]).appending_context(*elements[30:])
+
+    serialized = json.loads(state.to_json())
+
+    assert isinstance(serialized["context"], list)
+    assert len(serialized["context"]) == 40
+    restored = StepState.from_json(json.dumps(serialized))
+    assert isinstance(restored.context, StepContext)
+    assert restored.context == state.context
+    assert len(StepContext(prefix=StepContext.of(elements[:2]), elements=elements[2:3])) == 3
+
+
 @pytest.mark.asyncio
 async def test_preserving_and_restoring_state() -> None:
     storage: dict[str, StepState] = {"state": StepState.of()}
@@ -175,6 +217,156 @@ async def test_loop_and_concurrent_composition() -> None:
     assert concurrent_state.get(BetaArtifact, key="right", required=True).value == "R"
 
 
+@pytest.mark.asyncio
+async def test_concurrent_folding_with_limit_and_sufficient_result() -> None:
+    running = 0
+    max_running = 0
+    started: list[str] = []
+
+    def branch(value: str) -> Step:
+        @step
+        async def execute(state: StepState) -> StepState:
+            nonlocal running, max_running
+            started.append(value)
+            running += 1
+            max_running = max(max_running, running)
+            await asyncio.sleep(0)
+            running -= 1
+            return state.updating_artifacts(**{value: AlphaArtifact(value=value)})
+
+        return execute
+
+    async def fold(accumulated: StepState, branch: StepState) -> StepState:
+        return accumulated.updating(artifacts={**accumulated.artifacts, **branch.artifacts})
+
+    folded = await Step.concurrent(
+        *(branch(f"b{idx}") for idx in range(6)),
+        fold=fold,
+        concurrent_tasks=2,
+    ).process()
+
+    assert max_running == 2
+    assert sorted(folded.artifacts) == [f"b{idx}" for idx in range(6)]
+
+    async def sufficient(state: StepState) -> bool:
+        return "b1" in state.artifacts
+
+    started.clear()
+    stopped = await Step.concurrent(
+        *(branch(f"b{idx}") for idx in range(6)),
+        fold=fold,
+        concurrent_tasks=1,
+        sufficient=sufficient,
+    ).process()
+
+    assert started == ["b0", "b1"]
+    assert sorted(stopped.artifacts) == ["b0", "b1"]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_sufficient_result_merges_branches_finished_together() -> None:
+    cancelled: list[str] = []
+
+    def branch(value: str) -> Step:
+        @step
+        async def execute(state: StepState) -> StepState:
+            return state.updating_artifacts(**{value: AlphaArtifact(value=value)})
+
+        return execute
+
+    @step
+    async def slow(state: StepState) -> StepState:
+        try:
+            await asyncio.sleep(10)
+
+        except asyncio.CancelledError:
+            cancelled.append("slow")
+            raise
+
+        return state.updating_artifacts(slow=AlphaArtifact(value="slow"))
+
+    async def merge(branches: Iterable[StepState]) -> StepState:
+        artifacts: dict[str, Any] = {}
+        for branch_state in branches:
+            artifacts.update(branch_state.artifacts)
+
+        return StepState.of().updating(artifacts=artifacts)
+
+    async def sufficient(state: StepState) -> bool:
+        return "b0" in state.artifacts
+
+    merged = await Step.concurrent(
+        branch("b0"),
+        branch("b1"),
+        slow,
+        branch("b2"),
+        merge=merge,
+        sufficient=sufficient,
+    ).process()
+
+    assert sorted(merged.artifacts) == ["b0", "b1", "b2"]
+    assert cancelled == ["slow"]
+
+
+@pytest.mark.asyncio
+async def test_graph_runs_independent_nodes_concurrently() -> None:
+    events: list[str] = []
+
+    def node(name: str, reads: str | None) -> Step:
+        @step
+        async def execute(state: StepState) -> StepState:
+            events.append(f"start:{name}")
+            await asyncio.sleep(0)
+            source: str = (
+                state.get(AlphaArtifact, key=reads, required=True).value if reads else "root"
+            )
+            events.append(f"end:{name}")
+            return state.updating_artifacts(
+                **{name: AlphaArtifact(value=f"{source}>{name}")}
+            ).appending_context(ModelInput.of(MultimodalContent.of(name)))
+
+        return execute
+
+    graph = Step.graph(
+        node("a", None).graph_node(outputs=("a",)),
+        node("b", None).graph_node(outputs=("b",)),
+        node("c", "a").graph_node(inputs=("a",), outputs=("c",)),
+    )
+    state = await graph.process()
+
+    assert events.index("start:b") < events.index("end:a")  # independent nodes overlap
+    assert events.index("start:c") > events.index("end:a")  # dependency respected
+    assert state.get(AlphaArtifact, key="c", required=True).value == "root>a>c"
+    assert [_text_of(element.content) for element in state.context] == ["a", "b", "c"]
+
+
+@pytest.mark.asyncio
+async def test_graph_rejects_undeclared_artifact_changes() -> None:
+    @step
+    async def writing(state: StepState) -> StepState:
+        return state.updating_artifacts(
+            declared=AlphaArtifact(value="declared"),
+            undeclared=AlphaArtifact(value="undeclared"),
+        )
+
+    @step
+    async def removing(state: StepState) -> StepState:
+        return state.updating(
+            artifacts={key: value for key, value in state.artifacts.items() if key != "declared"}
+        )
+
+    with pytest.raises(StepException, match="undeclared"):
+        await Step.graph(writing.graph_node(outputs=("declared",))).process()
+
+    state = await Step.graph(removing.graph_node(outputs=("declared",))).process(
+        declared=AlphaArtifact(value="initial"),
+        kept=AlphaArtifact(value="kept"),
+    )
+
+    assert state.get(AlphaArtifact, key="declared") is None
+    assert state.get(AlphaArtifact, key="kept", required=True).value == "kept"
+
+
 @pytest.mark.asyncio
 async def test_selection_executes_selected_step() -> None:
     beta = Step.updating_artifacts(BetaArtifact(value="B"))
@@ -357,6 +549,67 @@ async def test_wrappers_retry_fallback_condition_and_suppressed_output() -> None
     assert _text_of(await suppressed.run()) == ""
 
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize("file_cache", [False, True])
+async def test_with_cache_replays_recorded_execution(
+    file_cache: bool,
+    tmp_path: Path,
+) -> None:
+    executions = 0
+
+    async def classify(state: StepState) -> AsyncIterable[Any]:
+        nonlocal executions
+        executions += 1
+        yield TextContent.of("label")
+        yield state.appending_context(
+            ModelOutput.of(MultimodalContent.of("label")),
+        ).updating_artifacts(AlphaArtifact(value="label"))
+
+    cache = StepCache.file(tmp_path) if file_cache else StepCache.volatile(limit=4)
+    cached = Step(classify).with_cache("classify", cache=cache)
+    initial_context = (ModelInput.of(MultimodalContent.of("input")),)
+
+    first_output = await cached.run(initial_context)
+    second_output = await cached.run(initial_context)
+    second_state = await cached.process(initial_context, BetaArtifact(value="kept"))
+    other_output = await cached.run((ModelInput.of(MultimodalContent.of("other")),))
+
+    assert executions == 3  # artifacts change the fingerprint, context too
+    assert _text_of(first_output) == _text_of(second_output) == _text_of(other_output) == "label"
+
+    replayed_state = await cached.process(initial_context, BetaArtifact(value="kept"))
+    assert executions == 3
+    assert replayed_state.context == second_state.context
+    assert len(replayed_state.context) == 2
+    assert replayed_state.get(AlphaArtifact, required=True).value == "label"
+    assert replayed_state.get(BetaArtifact, required=True).value == "kept"
+
+
+@pytest.mark.asyncio
+async def test_with_cache_namespaces_custom_fingerprint_and_survives_storing_failure() -> None:
+    stored_keys: list[str] = []
+
+    async def failing_storing(
+        key: str,
+        entry: Any,
+        *,
+        expiration: float | None,
+        **extra: Any,
+    ) -> None:
+        stored_keys.append(key)
+        raise ValueError("Unsupported step output chunk")
+
+    cache = StepCache(storing=failing_storing)
+    cached = Step.emitting(TextContent.of("label")).with_cache(
+        "classify",
+        fingerprint=lambda state: "constant",
+        cache=cache,
+    )
+
+    assert _text_of(await cached.run()) == "label"
+    assert stored_keys == ["classify:constant"]
+
+
 @pytest.mark.asyncio
 async def test_volatile_context_and_evaluation_wrappers() -> None:
     initial_context = (ModelInput.of(MultimodalContent.of("start")),)
@@ -1,4 +1,22 @@
-from draive import MultimodalContent, MultimodalTag, TextContent
+from collections.abc import AsyncIterator
+
+import pytest
+
+from draive import (
+    Meta,
+    ModelReasoningChunk,
+    MultimodalContent,
+    MultimodalTag,
+    TextContent,
+    model_output_tags,
+)
+from draive.multimodal import (
+    MultimodalTagClosed,
+    MultimodalTagDelta,
+    MultimodalTagEvent,
+    MultimodalTagOpened,
+    MultimodalTagsParser,
+)
 from draive.resources import ResourceReference
 
 
@@ -532,3 +550,70 @@ def test_handles_mixed_media_and_empty_tags():
 
 def test_handles_attribute_without_value():
     assert MultimodalContent.of("<test solo>content</test>").tag("test") is None
+
+
+def test_reuses_tags_index_for_repeated_queries():
+    content = MultimodalContent.of(
+        "<outer>before<inner>first</inner>",
+        ResourceReference.of(uri="http://image", mime_type="image/png"),
+        "<inner>second</inner>after</outer><inner>third</inner>",
+    )
+
+    inner = tuple(content.tags("inner"))
+    assert [tag.content.to_str() for tag in inner] == ["first", "second", "third"]
+    assert tuple(content.tags("inner")) == inner
+
+    outer = content.tag("outer")
+    assert outer is not None
+    assert outer.content.to_str().startswith("before<inner>first</inner>")
+    assert content.tag("inner") == inner[0]
+    assert content.tag("missing") is None
+    # cached index stays private to the instance
+    assert "_tags_index" not in content.to_mapping()
+    assert content == MultimodalContent.from_mapping(content.to_mapping())
+
+
+def test_streaming_parser_matches_complete_extraction():
+    text = '<think>skip</think><answer kind="final">Hello <b>wor</b>ld</answer> 1 < 2'
+    parser = MultimodalTagsParser()
+    events: list[MultimodalTagEvent] = []
+    for char in text:
+        events.extend(parser.feed(TextContent(text=char)))
+    events.extend(parser.finish())
+
+    closed = tuple(event.tag for event in events if isinstance(event, MultimodalTagClosed))
+    assert sorted(tag.to_str() for tag in closed) == sorted(
+        tag.to_str() for tag in MultimodalContent.of(text).tags()
+    )
+
+
+def test_streaming_parser_reports_selected_tag_deltas():
+    parser = MultimodalTagsParser(("answer",))
+    events = [
+        *parser.feed(TextContent(text="<think>hidden</think><ans")),
+        *parser.feed(TextContent(text='wer kind="final">Hel')),
+        *parser.feed(TextContent(text="lo <b>you</b></answer> tail")),
+        *parser.finish(),
+    ]
+
+    assert events[0] == MultimodalTagOpened(name="answer", meta=Meta.of({"kind": "final"}))
+    deltas = [event for event in events if isinstance(event, MultimodalTagDelta)]
+    assert all(delta.name == "answer" for delta in deltas)
+    assert "".join(delta.content.to_str() for delta in deltas) == "Hello <b>you</b>"
+    assert isinstance(events[-1], MultimodalTagClosed)
+    assert events[-1].tag == MultimodalContent.of(
+        '<answer kind="final">Hello <b>you</b></answer>'
+    ).tag("answer")
+
+
+@pytest.mark.asyncio
+async def test_model_output_tags_skips_reasoning():
+    async def stream() -> AsyncIterator[ModelReasoningChunk | TextContent]:
+        yield TextContent(text="<answer>4")
+        yield ModelReasoningChunk.of(TextContent(text="<answer>ignored</answer>"))
+        yield TextContent(text="2</answer>")
+
+    events = [event async for event in model_output_tags(stream(), names=("answer",))]
+
+    assert isinstance(events[-1], MultimodalTagClosed)
+    assert events[-1].tag.content.to_str() == "42"